@@ -4,24 +4,40 @@ author: Rudi César Comiotto Modena
 email: rmodena@unisinos.br
 date: July, 2020
 """
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from continentalfuzzy.applicationservice.FuzzyMatrixWorker import \
+    FuzzyMatrixWorker
 from continentalfuzzy.domain.definition.ControllerType import ControllerType
+from continentalfuzzy.domain.definition.mamdani.CentroidModes import CentroidModes
 from continentalfuzzy.service.MamdaniControllerService import MamdaniControllerService
 from continentalfuzzy.dto.FuzzyControlCommandInput import FuzzyControlCommandInput
 from continentalfuzzy.dto.FuzzyControlCommandOutput import FuzzyControlCommandOutput
 from continentalfuzzy.dto.ProcessResult import ProcessResult
+from continentalfuzzy.service.ControllerCacheService import \
+    ControllerCacheService
 from continentalfuzzy.service.SugenoControllerService import \
     SugenoControllerService
 from continentalfuzzy.service.SystemService import SystemService
+from continentalfuzzy.util.SharedMatrix import SharedMatrix
+from continentalfuzzy.util.TileScheduler import TileScheduler
 import numpy as np
+import queue
 import threading
-import psutil
 
 class FuzzyControlApplicationService:
+    # Quantidade máxima de células de cada bloco do
+    # process_fuzzy_matrix_vectorized
+    MATRIX_CHUNK_CELLS = 2 ** 16
+
     def __init__(self):
         self.__fisSystem = None
         self.__fuzzy_controller = None
         self.__fuzzy_output_matrix = None
-        self.__number_of_cpus = psutil.cpu_count()
+        self.__fuzzy_inactive_matrix = None
+        self.__fuzzy_errors = list()
+        self.__fill_value = 0.0
+        self.__number_of_workers = TileScheduler.get_available_cpus()
+        self.__tile_shape = None
 
     @property
     def fisSystem(self):
@@ -39,6 +55,58 @@ class FuzzyControlApplicationService:
     def fuzzyController(self, p_fuzzyController):
         self.__fuzzy_controller = p_fuzzyController
 
+    @property
+    def number_of_workers(self) -> int:
+        """
+        Quantidade de threads ou processos do cálculo das matrizes. O valor
+        inicial é a quantidade de CPUs disponíveis para o processo
+        (afinidade e cota do cgroup).
+        """
+        return self.__number_of_workers
+
+    @number_of_workers.setter
+    def number_of_workers(self, p_number_of_workers: int):
+        if not isinstance(p_number_of_workers, int) or p_number_of_workers < 1:
+            raise Exception("O número de workers precisa ser maior que zero!")
+
+        self.__number_of_workers = p_number_of_workers
+
+    @property
+    def tile_shape(self):
+        """
+        Tamanho (linhas, colunas) dos blocos entregues aos workers. Com None
+        o tamanho é escolhido pelo TileScheduler.
+        """
+        return self.__tile_shape
+
+    @tile_shape.setter
+    def tile_shape(self, p_tile_shape):
+        if p_tile_shape is not None and (len(p_tile_shape) != 2 or min(p_tile_shape) < 1):
+            raise Exception("O tamanho dos blocos precisa ser maior que zero!")
+
+        self.__tile_shape = p_tile_shape
+
+    @property
+    def fill_value(self) -> float:
+        """
+        Valor das células da matriz de resultados que não foram calculadas
+        (inativas) ou que tiveram erro. O valor inicial é 0.
+        """
+        return self.__fill_value
+
+    @fill_value.setter
+    def fill_value(self, p_fill_value: float):
+        try:
+            self.__fill_value = float(p_fill_value)
+        except (TypeError, ValueError):
+            raise Exception("O valor de preenchimento precisa ser um número!")
+
+    def create_tile_scheduler(self, fuzzyControlCommandInput: FuzzyControlCommandInput, number_of_workers: int):
+        return TileScheduler(fuzzyControlCommandInput.get_num_rows(),
+                             fuzzyControlCommandInput.get_num_cols(),
+                             self.__tile_shape,
+                             number_of_workers)
+
     @classmethod
     def process_fuzzy_control(cls, fuzzyControlCommandInput: FuzzyControlCommandInput):
 
@@ -46,24 +114,20 @@ class FuzzyControlApplicationService:
         result.status = ProcessResult.RESULT_ERROR
 
         try:
-            fisSystemService = SystemService()
-            fisSystem = fisSystemService.import_file(
-                fuzzyControlCommandInput.filename,
-                fuzzyControlCommandInput.use_dict_facies_association)
-
-            if fisSystem.type == ControllerType.mamdani:
-                mamdaniController = MamdaniControllerService()
-                mamdaniController.create_from_fis_system(fisSystem)
-
-                fuzzy_result = mamdaniController.fuzzy_calc_single_value(
-                    fuzzyControlCommandInput.fuzzy_inputs,
-                    fuzzyControlCommandInput.fuzzy_output)
-            elif fisSystem.type == ControllerType.sugeno:
-                sugenoController = SugenoControllerService()
-                sugenoController.create_from_fis_system(fisSystem)
-
-                fuzzy_result = sugenoController.sugeno_calc_single_value(
-                    fuzzyControlCommandInput.fuzzy_inputs)
+            # O controlador é criado uma única vez por arquivo .fis
+            fisSystem, fuzzyController, controllerLock = \
+                ControllerCacheService.get_controller(
+                    fuzzyControlCommandInput.filename,
+                    fuzzyControlCommandInput.use_dict_facies_association)
+
+            with controllerLock:
+                if fisSystem.type == ControllerType.mamdani:
+                    fuzzy_result = fuzzyController.fuzzy_calc_single_value(
+                        fuzzyControlCommandInput.fuzzy_inputs,
+                        fuzzyControlCommandInput.fuzzy_output)
+                elif fisSystem.type == ControllerType.sugeno:
+                    fuzzy_result = fuzzyController.sugeno_calc_single_value(
+                        fuzzyControlCommandInput.fuzzy_inputs)
 
             result.add_message("Processo executado com sucesso!")
             result.status = ProcessResult.RESULT_SUCCESS
@@ -126,19 +190,126 @@ class FuzzyControlApplicationService:
 
         return result.result
 
+    def init_fuzzy_output_matrix(self, fuzzyControlCommandInput: FuzzyControlCommandInput, output_matrix=None):
+        # Uma matriz informada (por exemplo em memória compartilhada) já
+        # está preenchida e não é alterada
+        if output_matrix is None:
+            output_matrix = np.full((fuzzyControlCommandInput.get_num_rows(), fuzzyControlCommandInput.get_num_cols()),
+                                    self.__fill_value)
+        self.__fuzzy_output_matrix = output_matrix
+        self.__fuzzy_inactive_matrix = fuzzyControlCommandInput.get_inactive_mask()
+        self.__fuzzy_errors = list()
+
     def process_fuzzy_matrix(self, fuzzyControlCommandInput: FuzzyControlCommandInput):
-        self.__fuzzy_output_matrix = np.zeros((fuzzyControlCommandInput.get_num_rows(), fuzzyControlCommandInput.get_num_cols()))
-        for row in range(fuzzyControlCommandInput.get_num_rows()):
-            for col in range(fuzzyControlCommandInput.get_num_cols()):
-                self.process_fuzzy_matrix_item(col, fuzzyControlCommandInput, row)
+        self.init_fuzzy_output_matrix(fuzzyControlCommandInput)
+        self.process_fuzzy_matrix_tile(fuzzyControlCommandInput,
+                                       (0, fuzzyControlCommandInput.get_num_rows(),
+                                        0, fuzzyControlCommandInput.get_num_cols()))
+
+    def process_fuzzy_matrix_vectorized(self, fuzzyControlCommandInput: FuzzyControlCommandInput):
+        """
+        Calcula a matriz com o motor vetorizado do controlador
+        (fuzzy_calc_native no Mamdani e sugeno_calc_batch no Sugeno), em
+        blocos de até MATRIX_CHUNK_CELLS células. Os blocos são montados
+        somente com as células ativas, por um índice compactado, e os
+        resultados são escritos direto na matriz de resultados, sem criar
+        uma entrada por célula.
+
+        O resultado de cada célula é o mesmo do process_fuzzy_matrix, com o
+        consequente output1, o dicionário de fácies do fisSystem e as
+        tolerâncias do result_cache. No Mamdani o centroide é sempre o do
+        universo amostrado (CentroidModes.sampled), o mesmo do simulador do
+        scikit-fuzzy, independente do centroid_mode do controlador. As
+        células sem resultado finito (nenhuma regra ativada, código de fácies
+        não encontrado ou antecedente sem valor) são calculadas uma a uma,
+        assim os erros ficam no get_fuzzy_errors como no cálculo célula a
+        célula. Quando o motor vetorizado não calcula o sistema, por
+        exemplo com métodos não implementados, todas as células são
+        calculadas uma a uma.
+
+        Um firing_epsilon maior que zero no Sugeno também é usado neste
+        cálculo e descarta as regras com disparo menor ou igual a ele.
+        """
+        self.init_fuzzy_output_matrix(fuzzyControlCommandInput)
+
+        # Posições (na matriz achatada) das células ativas
+        index = np.flatnonzero(~self.__fuzzy_inactive_matrix)
+        dict_inputs = {name: np.asarray(matrix, dtype=np.float64).reshape(-1)
+                       for name, matrix in fuzzyControlCommandInput.get_fuzzy_inputs_matrix().items()}
+
+        for start in range(0, index.shape[0], self.MATRIX_CHUNK_CELLS):
+            self.process_fuzzy_matrix_chunk(fuzzyControlCommandInput, dict_inputs,
+                                            index[start:start + self.MATRIX_CHUNK_CELLS])
+
+    def process_fuzzy_matrix_chunk(self, fuzzyControlCommandInput: FuzzyControlCommandInput, dict_inputs, index):
+        chunk_inputs = {name: values[index] for name, values in dict_inputs.items()}
+
+        try:
+            result = self.calc_fuzzy_matrix_batch(chunk_inputs)
+        except Exception:
+            self.process_fuzzy_matrix_cells(fuzzyControlCommandInput, index)
+            return
+
+        valid = np.isfinite(result)
+        for values in chunk_inputs.values():
+            valid &= np.isfinite(values)
+
+        self.__fuzzy_output_matrix.flat[index[valid]] = result[valid]
+        self.process_fuzzy_matrix_cells(fuzzyControlCommandInput, index[~valid])
+
+    def process_fuzzy_matrix_cells(self, fuzzyControlCommandInput: FuzzyControlCommandInput, index, simulator=None):
+        rows, cols = np.unravel_index(index, (fuzzyControlCommandInput.get_num_rows(),
+                                              fuzzyControlCommandInput.get_num_cols()))
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            self.process_fuzzy_matrix_item(col, fuzzyControlCommandInput, row, simulator)
+
+    def calc_fuzzy_matrix_batch(self, dict_inputs):
+        """
+        Calcula um bloco da matriz com o motor vetorizado do controlador.
+        Os antecedentes da matriz precisam ser os mesmos do sistema, pois no
+        cálculo célula a célula um antecedente a mais também é um erro.
+        """
+        if self.fisSystem.type == ControllerType.mamdani:
+            compiled = self.fuzzyController.fuzzy_machine.compiled_rules
+        elif self.fisSystem.type == ControllerType.sugeno:
+            compiled = self.fuzzyController.sugeno_controller.compiled_rules
+        else:
+            raise Exception(f"O controlador {self.fisSystem.type} não foi implementado!")
+
+        if compiled is None or set(dict_inputs) != set(compiled.input_names):
+            raise Exception("Os antecedentes da matriz não são os antecedentes do sistema!")
+
+        if self.fisSystem.type == ControllerType.mamdani:
+            cache = self.fuzzyController.result_cache
+            if cache is not None:
+                dict_inputs = cache.quantize_array(dict_inputs)
+            # O centroide analítico do modo automatic difere do centroide do
+            # scikit-fuzzy usado no cálculo célula a célula
+            return self.fuzzyController.fuzzy_calc_native(dict_inputs, "output1", CentroidModes.sampled)
+
+        return self.fuzzyController.sugeno_calc_batch(dict_inputs)
 
     def process_fuzzy_matrix_multithread(self, fuzzyControlCommandInput: FuzzyControlCommandInput):
-        self.__fuzzy_output_matrix = np.zeros((fuzzyControlCommandInput.get_num_rows(), fuzzyControlCommandInput.get_num_cols()))
+        """
+        Calcula a matriz em threads. Os blocos do TileScheduler ficam em uma
+        fila e cada thread pega o próximo bloco quando termina o anterior.
+        """
+        self.init_fuzzy_output_matrix(fuzzyControlCommandInput)
+        scheduler = self.create_tile_scheduler(fuzzyControlCommandInput, self.__number_of_workers)
+        work_queue = scheduler.create_queue()
         jobs = []
-        step = int(fuzzyControlCommandInput.get_num_rows() / self.__number_of_cpus)
-        for rowStart in range(0, fuzzyControlCommandInput.get_num_rows(), step):
-            thread = threading.Thread(target=self.process_fuzzy_matrix_multithread_slice, args=(fuzzyControlCommandInput, rowStart, min(rowStart + step, fuzzyControlCommandInput.get_num_rows())))
-            jobs.append(thread)
+        failures = []
+
+        # Os erros fora das células (por exemplo na criação dos simuladores)
+        # são repassados para a thread principal
+        def run_tiles():
+            try:
+                self.process_fuzzy_matrix_queue(fuzzyControlCommandInput, work_queue)
+            except Exception as ex:
+                failures.append(ex)
+
+        for _ in range(min(self.__number_of_workers, scheduler.num_tiles)):
+            jobs.append(threading.Thread(target=run_tiles))
 
         # Start the threads (i.e. calculate the random number lists)
         for j in jobs:
@@ -148,12 +319,128 @@ class FuzzyControlApplicationService:
         for j in jobs:
             j.join()
 
-    def process_fuzzy_matrix_multithread_slice(self, fuzzyControlCommandInput: FuzzyControlCommandInput, rowStart, rowEnd):
-        for row in range(rowStart, rowEnd):
-            for col in range(fuzzyControlCommandInput.get_num_cols()):
-                self.process_fuzzy_matrix_item(col, fuzzyControlCommandInput, row)
+        if failures:
+            raise failures[0]
+
+    def process_fuzzy_matrix_queue(self, fuzzyControlCommandInput: FuzzyControlCommandInput, work_queue: queue.Queue):
+        # No Mamdani cada thread usa o seu próprio simulador, pois o
+        # simulador guarda o estado do último cálculo
+        if self.fisSystem.type == ControllerType.mamdani:
+            with self.fuzzyController.simulator_pool.simulator() as simulator:
+                self.process_fuzzy_matrix_queue_tiles(fuzzyControlCommandInput, work_queue, simulator)
+        else:
+            self.process_fuzzy_matrix_queue_tiles(fuzzyControlCommandInput, work_queue)
+
+    def process_fuzzy_matrix_queue_tiles(self, fuzzyControlCommandInput: FuzzyControlCommandInput, work_queue: queue.Queue, simulator=None):
+        while True:
+            try:
+                tile = work_queue.get_nowait()
+            except queue.Empty:
+                return
+            self.process_fuzzy_matrix_tile(fuzzyControlCommandInput, tile, simulator)
+
+    def process_fuzzy_matrix_parallel(self, fuzzyControlCommandInput: FuzzyControlCommandInput, number_of_workers=None):
+        """
+        Calcula a matriz em processos, sem a limitação do GIL das threads.
+
+        As matrizes dos antecedentes e a matriz de resultados ficam em
+        memória compartilhada (SharedMatrix): cada processo cria o
+        controlador uma única vez a partir do fisSystem, conecta às matrizes
+        sem cópia (FuzzyMatrixWorker.initialize) e recebe os blocos do
+        TileScheduler, entregues ao próximo processo livre. Os segmentos são
+        removidos ao final, também quando um processo falha ou o cálculo é
+        interrompido. Os erros das células ficam no get_fuzzy_errors, como no
+        cálculo serial.
+
+        Parâmetros
+        ----------
+        fuzzyControlCommandInput : FuzzyControlCommandInput
+            Entrada com as matrizes dos antecedentes.
+
+        number_of_workers : int
+            Quantidade de processos. Quando não informado é usado o
+            number_of_workers.
+        """
+        self.init_fuzzy_output_matrix(fuzzyControlCommandInput)
+        if number_of_workers is None:
+            number_of_workers = self.__number_of_workers
+
+        scheduler = self.create_tile_scheduler(fuzzyControlCommandInput, number_of_workers)
+        if scheduler.num_tiles == 0:
+            return
+
+        matrices = list()
+        executor = None
+        try:
+            output = SharedMatrix.from_array(self.__fuzzy_output_matrix)
+            matrices.append(output)
+            input_descriptors = dict()
+            for name, matrix in fuzzyControlCommandInput.get_fuzzy_inputs_matrix().items():
+                matrices.append(SharedMatrix.from_array(matrix))
+                input_descriptors[name] = matrices[-1].descriptor
+
+            mask_descriptors = dict()
+            for name, mask in fuzzyControlCommandInput.get_fuzzy_inputs_masks().items():
+                matrices.append(SharedMatrix.from_array(mask))
+                mask_descriptors[name] = matrices[-1].descriptor
+
+            executor = ProcessPoolExecutor(max_workers=min(number_of_workers, scheduler.num_tiles),
+                                           initializer=FuzzyMatrixWorker.initialize,
+                                           initargs=(self.fisSystem,
+                                                     FuzzyMatrixWorker.get_settings(self.fuzzyController),
+                                                     input_descriptors,
+                                                     output.descriptor,
+                                                     mask_descriptors,
+                                                     fuzzyControlCommandInput.get_nodata_values()))
+            futures = [executor.submit(FuzzyMatrixWorker.process_tile, tile)
+                       for tile in scheduler.tiles]
+
+            for future in as_completed(futures):
+                self.__fuzzy_errors.extend(future.result())
+
+            executor.shutdown()
+            self.__fuzzy_output_matrix[...] = output.array
+
+        finally:
+            # Com erro ou interrupção as tarefas pendentes são canceladas e
+            # os processos terminam antes da remoção dos segmentos
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+            for matrix in matrices:
+                matrix.close()
+
+    def process_fuzzy_matrix_block(self, fuzzyControlCommandInput: FuzzyControlCommandInput, tile):
+        """
+        Calcula o bloco (linha inicial, linha final, coluna inicial, coluna
+        final) na matriz de resultados e retorna os erros das células do
+        bloco.
+        """
+        num_errors = len(self.__fuzzy_errors)
+        self.process_fuzzy_matrix_tile(fuzzyControlCommandInput, tile)
+
+        return self.__fuzzy_errors[num_errors:]
 
-    def process_fuzzy_matrix_item(self, col, fuzzyControlCommandInput, row):
+    def process_fuzzy_matrix_multithread_slice(self, fuzzyControlCommandInput: FuzzyControlCommandInput, rowStart, rowEnd):
+        # No Mamdani cada thread usa o seu próprio simulador, pois o
+        # simulador guarda o estado do último cálculo
+        if self.fisSystem.type == ControllerType.mamdani:
+            with self.fuzzyController.simulator_pool.simulator() as simulator:
+                self.process_fuzzy_matrix_rows(fuzzyControlCommandInput, rowStart, rowEnd, simulator)
+        else:
+            self.process_fuzzy_matrix_rows(fuzzyControlCommandInput, rowStart, rowEnd)
+
+    def process_fuzzy_matrix_rows(self, fuzzyControlCommandInput: FuzzyControlCommandInput, rowStart, rowEnd, simulator=None):
+        self.process_fuzzy_matrix_tile(fuzzyControlCommandInput, (rowStart, rowEnd, 0, fuzzyControlCommandInput.get_num_cols()), simulator)
+
+    def process_fuzzy_matrix_tile(self, fuzzyControlCommandInput: FuzzyControlCommandInput, tile, simulator=None):
+        # Somente as células ativas do bloco são calculadas
+        rowStart, rowEnd, colStart, colEnd = tile
+        rows, cols = np.nonzero(~self.__fuzzy_inactive_matrix[rowStart:rowEnd, colStart:colEnd])
+        for row, col in zip((rows + rowStart).tolist(), (cols + colStart).tolist()):
+            self.process_fuzzy_matrix_item(col, fuzzyControlCommandInput, row, simulator)
+
+    def process_fuzzy_matrix_item(self, col, fuzzyControlCommandInput, row, simulator=None):
         fuzzy_control_command_input_temp = FuzzyControlCommandInput()
         for name, matrix in fuzzyControlCommandInput.get_fuzzy_inputs_matrix().items():
             fuzzy_control_command_input_temp.add_fuzzy_inputs(name, matrix[row][col])
@@ -163,17 +450,50 @@ class FuzzyControlApplicationService:
             try:
                 self.__fuzzy_output_matrix[row][col] = self.fuzzyController.fuzzy_calc_single_value(
                     fuzzy_control_command_input_temp.fuzzy_inputs,
-                    fuzzy_control_command_input_temp.fuzzy_output)
-            except Exception:
-                pass
+                    fuzzy_control_command_input_temp.fuzzy_output,
+                    simulator)
+            except Exception as ex:
+                self.add_fuzzy_error(row, col, ex)
 
         elif self.fisSystem.type == ControllerType.sugeno:
             try:
                 self.__fuzzy_output_matrix[row][col] = self.fuzzyController.sugeno_calc_single_value(
                     fuzzy_control_command_input_temp.fuzzy_inputs)
-            except Exception:
-                pass
+            except Exception as ex:
+                self.add_fuzzy_error(row, col, ex)
+
+    def add_fuzzy_error(self, row, col, ex: Exception):
+        # list.append é atômico, então as threads podem registrar os erros
+        # na mesma lista
+        self.__fuzzy_errors.append((row, col, f"{type(ex).__name__}: {ex}"))
+
+    def get_fuzzy_errors(self):
+        """
+        Células da última matriz calculada que não tiveram resultado, como
+        tuplas (linha, coluna, mensagem do erro). Essas células mantêm o
+        fill_value na matriz de resultados.
+        """
+        return sorted(self.__fuzzy_errors)
 
     def get_fuzzy_output_matrix(self, row: int, col: int):
         return self.__fuzzy_output_matrix[row][col]
 
+    def get_fuzzy_output(self):
+        """
+        Matriz de resultados da última matriz calculada. As células sem
+        resultado (get_fuzzy_output_mask) possuem o fill_value.
+        """
+        return self.__fuzzy_output_matrix
+
+    def get_fuzzy_output_mask(self):
+        """
+        Máscara das células da última matriz calculada sem resultado: as
+        células inativas (máscaras e valores nodata dos antecedentes), que
+        não foram calculadas, e as células com erro (get_fuzzy_errors).
+        """
+        mask = self.__fuzzy_inactive_matrix.copy()
+        for row, col, _ in self.__fuzzy_errors:
+            mask[row, col] = True
+
+        return mask
+
@@ -0,0 +1,146 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+from typing import Any, Dict, List, Tuple
+from continentalfuzzy.domain.System import System
+from continentalfuzzy.dto.FuzzyControlCommandInput import \
+    FuzzyControlCommandInput
+from continentalfuzzy.service.ControllerCacheService import \
+    ControllerCacheService
+from continentalfuzzy.service.MamdaniControllerService import \
+    MamdaniControllerService
+from continentalfuzzy.service.SugenoControllerService import \
+    SugenoControllerService
+from continentalfuzzy.service.mamdani.ResultCache import ResultCache
+from continentalfuzzy.util.SharedMatrix import SharedMatrix
+
+
+class FuzzyMatrixWorker:
+    """
+    Funções executadas nos processos do
+    FuzzyControlApplicationService.process_fuzzy_matrix_parallel.
+
+    O initialize é chamado uma única vez em cada processo: ele cria o
+    controlador a partir do sistema já importado e conecta às matrizes em
+    memória compartilhada, assim cada tarefa recebe somente os limites do
+    bloco e escreve os resultados direto na matriz de resultados.
+    """
+
+    # Configurações de cada tipo de controlador copiadas para os processos
+    DICT_SETTINGS = {
+        MamdaniControllerService: ['universe_resolution', 'centroid_mode'],
+        SugenoControllerService: ['firing_epsilon']}
+
+    __service = None
+    __command_input = None
+    __matrices = list()
+
+    @classmethod
+    def get_settings(cls, controller) -> Dict[str, Any]:
+        """
+        Configurações do controlador que precisam ser repetidas nos
+        processos para o resultado ser o mesmo do cálculo serial.
+        """
+        settings = {name: getattr(controller, name)
+                    for name in cls.DICT_SETTINGS.get(type(controller), [])}
+
+        # O ResultCache possui um lock e não pode ser enviado ao processo,
+        # então somente a sua configuração é copiada
+        if isinstance(controller, MamdaniControllerService):
+            cache = controller.result_cache
+            settings['result_cache'] = None if cache is None else \
+                (cache.max_size, cache.tolerances)
+
+        return settings
+
+    @staticmethod
+    def create_controller(fis_system: System, settings: Dict[str, Any]):
+        """
+        Cria o controlador com as configurações do get_settings. As
+        configurações são aplicadas antes da criação, pois a resolução dos
+        universos é usada na criação.
+        """
+        if fis_system.type not in ControllerCacheService.DICT_CONTROLLERS:
+            raise Exception(f"O controlador {fis_system.type} não foi "
+                            f"implementado!")
+
+        controller = ControllerCacheService.DICT_CONTROLLERS[
+            fis_system.type]()
+
+        for name, value in settings.items():
+            if name == 'result_cache':
+                controller.result_cache = None if value is None else \
+                    ResultCache(*value)
+            else:
+                setattr(controller, name, value)
+
+        controller.create_from_fis_system(fis_system)
+
+        return controller
+
+    @classmethod
+    def initialize(cls,
+                   fis_system: System,
+                   settings: Dict[str, Any],
+                   input_descriptors: Dict[str, Tuple],
+                   output_descriptor: Tuple,
+                   mask_descriptors: Dict[str, Tuple] = None,
+                   nodata_values: Dict[str, float] = None):
+        """
+        Cria o controlador e conecta às matrizes compartilhadas dos
+        antecedentes, das máscaras dos antecedentes e dos resultados
+        (SharedMatrix.descriptor), sem cópia. As máscaras e os valores
+        nodata definem as células que não são calculadas.
+        """
+        # Importado aqui por causa da importação circular com o
+        # FuzzyControlApplicationService
+        from continentalfuzzy.applicationservice.\
+            FuzzyControlApplicationService import \
+            FuzzyControlApplicationService
+
+        # As matrizes ficam abertas até o fim do processo, e o segmento é
+        # removido pelo processo principal
+        cls.__matrices = [SharedMatrix.attach(output_descriptor)]
+        output_matrix = cls.__matrices[0].array
+
+        command_input = FuzzyControlCommandInput()
+        command_input.set_matrix_dimension(*output_matrix.shape)
+        for name, descriptor in input_descriptors.items():
+            matrix = SharedMatrix.attach(descriptor)
+            cls.__matrices.append(matrix)
+            command_input.set_fuzzy_inputs_matrix(name, matrix.array)
+
+        for name, descriptor in (mask_descriptors or dict()).items():
+            matrix = SharedMatrix.attach(descriptor)
+            cls.__matrices.append(matrix)
+            command_input.set_fuzzy_inputs_mask(name, matrix.array)
+
+        for name, value in (nodata_values or dict()).items():
+            command_input.set_nodata_value(name, value)
+
+        service = FuzzyControlApplicationService()
+        service.fisSystem = fis_system
+        service.fuzzyController = cls.create_controller(fis_system, settings)
+        service.init_fuzzy_output_matrix(command_input, output_matrix)
+
+        cls.__service = service
+        cls.__command_input = command_input
+
+    @classmethod
+    def process_tile(cls, tile: Tuple[int, int, int, int]) \
+            -> List[Tuple[int, int, str]]:
+        """
+        Calcula o bloco (linha inicial, linha final, coluna inicial, coluna
+        final) do TileScheduler, escrevendo os resultados direto na matriz
+        compartilhada.
+
+        Retorna
+        -------
+        List[Tuple[int, int, str]]
+            Retorna os erros das células do bloco.
+        """
+        return cls.__service.process_fuzzy_matrix_block(cls.__command_input,
+                                                        tile)
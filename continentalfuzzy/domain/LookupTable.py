@@ -0,0 +1,135 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import numpy as np
+from typing import List, Optional
+
+
+class LookupTable:
+    """
+    Tabela com os consequentes de um controlador amostrados em uma grade
+    regular sobre os ranges dos antecedentes.
+
+    values possui o formato consequente x pontos do primeiro antecedente x
+    pontos do segundo antecedente x ..., na ordem de input_names e
+    output_names. fis_hash identifica o arquivo .fis usado na amostragem.
+    """
+
+    def __init__(self,
+                 t_input_names: Optional[List[str]] = None,
+                 t_axes: Optional[List[np.ndarray]] = None,
+                 t_output_names: Optional[List[str]] = None,
+                 t_values: Optional[np.ndarray] = None,
+                 t_fis_hash: Optional[str] = None):
+        self.__input_names = list()
+        self.__axes = list()
+        self.__output_names = list()
+        self.__values = None
+        self.__fis_hash = None
+
+        if t_input_names is not None:
+            self.input_names = t_input_names
+
+        if t_axes is not None:
+            self.axes = t_axes
+
+        if t_output_names is not None:
+            self.output_names = t_output_names
+
+        if t_values is not None:
+            self.values = t_values
+
+        if t_fis_hash is not None:
+            self.fis_hash = t_fis_hash
+
+    @staticmethod
+    def valid_names(p_names):
+        if not isinstance(p_names, list):
+            raise Exception("O parâmetro não é uma lista!")
+
+        for value in p_names:
+            if not isinstance(value, str):
+                raise Exception("O nome não é uma string!")
+
+    @property
+    def num_inputs(self) -> int:
+        return len(self.__input_names)
+
+    @property
+    def num_outputs(self) -> int:
+        return len(self.__output_names)
+
+    @property
+    def grid_shape(self) -> tuple:
+        return tuple(axis.shape[0] for axis in self.__axes)
+
+    @property
+    def input_names(self) -> List[str]:
+        return self.__input_names
+
+    @input_names.setter
+    def input_names(self, value: List[str]):
+        self.valid_names(value)
+        self.__input_names = value
+
+    @property
+    def axes(self) -> List[np.ndarray]:
+        """
+        Pontos da grade de cada antecedente, em ordem crescente.
+        """
+        return self.__axes
+
+    @axes.setter
+    def axes(self, value: List[np.ndarray]):
+        if not isinstance(value, list):
+            raise Exception("O parâmetro não é uma lista!")
+
+        for axis in value:
+            if not isinstance(axis, np.ndarray):
+                raise Exception("O parâmetro não é um numpy array!")
+
+            if axis.ndim != 1 or axis.shape[0] < 2:
+                raise Exception("O eixo da tabela precisa ter pelo menos "
+                                "2 pontos!")
+
+            if np.any(np.diff(axis) <= 0):
+                raise Exception("O eixo da tabela não é crescente!")
+
+        self.__axes = value
+
+    @property
+    def output_names(self) -> List[str]:
+        return self.__output_names
+
+    @output_names.setter
+    def output_names(self, value: List[str]):
+        self.valid_names(value)
+        self.__output_names = value
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.__values
+
+    @values.setter
+    def values(self, value: np.ndarray):
+        if not isinstance(value, np.ndarray):
+            raise Exception("O parâmetro não é um numpy array!")
+
+        if value.ndim < 2:
+            raise Exception("O array precisa ter pelo menos 2 dimensões!")
+
+        self.__values = value
+
+    @property
+    def fis_hash(self) -> Optional[str]:
+        return self.__fis_hash
+
+    @fis_hash.setter
+    def fis_hash(self, value: str):
+        if not isinstance(value, str):
+            raise Exception("O hash do arquivo .fis não é uma string!")
+
+        self.__fis_hash = value
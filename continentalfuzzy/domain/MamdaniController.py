@@ -4,6 +4,7 @@ author: Rudi César Comiotto Modena
 email: rmodena@unisinos.br
 date: July, 2020
 """
+import operator
 import numpy as np
 from skfuzzy.control.antecedent_consequent import Antecedent
 from skfuzzy.control.antecedent_consequent import Consequent
@@ -12,9 +13,14 @@ from skfuzzy.control.controlsystem import ControlSystem
 from skfuzzy.control.controlsystem import ControlSystemSimulation
 from typing import Dict, List, Optional
 from continentalfuzzy.domain.Rule import Rule
+from continentalfuzzy.domain.System import System
+from continentalfuzzy.domain.definition.AndMethods import AndMethods
 from continentalfuzzy.domain.definition.mamdani.MamdaniAndMethods import MamdaniAndMethods
 from continentalfuzzy.domain.definition.Connections import Connections
 from continentalfuzzy.domain.definition.mamdani.MamdaniOrMethods import MamdaniOrMethods
+from continentalfuzzy.domain.definition.OrMethods import OrMethods
+from continentalfuzzy.domain.mamdani.MamdaniCompiledRules import \
+    MamdaniCompiledRules
 
 
 class MamdaniController:
@@ -22,15 +28,23 @@ class MamdaniController:
     Classe usada para criar um controlador fuzzy da biblioteca scikit-fuzzy.
     """
 
-    # Dicionário com os métodos AND implementadas
-    DICT_AND_METHODS = {MamdaniAndMethods.min: np.min}
+    # Dicionário com os métodos AND implementadas. O System guarda os métodos
+    # como AndMethods e o scikit-fuzzy precisa de uma função elemento a
+    # elemento de dois argumentos (np.fmin)
+    DICT_AND_METHODS = {MamdaniAndMethods.min: np.min,
+                        AndMethods.min: np.fmin}
 
     # Dicionário com os métodos OR implementadas
-    DICT_OR_METHODS = {MamdaniOrMethods.max: np.max}
+    DICT_OR_METHODS = {MamdaniOrMethods.max: np.max,
+                       OrMethods.max: np.fmax}
 
     # Dicionário com os conectores implementados
     DICT_CONNECTORS = {Connections.AND: '&', Connections.OR: '|'}
 
+    # Dicionário com os operadores dos termos do scikit-fuzzy de cada conector
+    DICT_CONNECTOR_OPERATORS = {Connections.AND: operator.and_,
+                                Connections.OR: operator.or_}
+
     def __init__(self,
                  cont_inputs: Optional[Dict[str, Antecedent]] = None,
                  cont_outputs: Optional[Dict[str, Consequent]] = None,
@@ -44,6 +58,8 @@ class MamdaniController:
         self.__rules = list()
         self.__controller = None
         self.__simulator = None
+        self.__compiled_rules = None
+        self.__fis_system = None
 
         if cont_inputs is not None:
             self.inputs = cont_inputs
@@ -311,3 +327,37 @@ class MamdaniController:
                             "ControlSystemSimulation!")
 
         self.__simulator = f_simulator
+
+    @property
+    def compiled_rules(self) -> MamdaniCompiledRules:
+        """
+        Base de regras compilada usada pelo motor vetorizado.
+
+        Retorna
+        -------
+        MamdaniCompiledRules
+            Retorna uma instância da classe MamdaniCompiledRules.
+        """
+        return self.__compiled_rules
+
+    @compiled_rules.setter
+    def compiled_rules(self, p_compiled_rules: MamdaniCompiledRules):
+        if not isinstance(p_compiled_rules, MamdaniCompiledRules):
+            raise Exception("O valor não é uma instância da classe "
+                            "MamdaniCompiledRules!")
+
+        self.__compiled_rules = p_compiled_rules
+
+    @property
+    def fis_system(self) -> System:
+        """
+        Sistema usado para criar o controlador.
+        """
+        return self.__fis_system
+
+    @fis_system.setter
+    def fis_system(self, p_fis_system: System):
+        if not isinstance(p_fis_system, System):
+            raise Exception("O parâmetro não é uma instância da classe System!")
+
+        self.__fis_system = p_fis_system
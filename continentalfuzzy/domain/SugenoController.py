@@ -9,6 +9,8 @@ from continentalfuzzy.domain.System import System
 from continentalfuzzy.domain.sugeno.variable.SugenoInput import SugenoInput
 from continentalfuzzy.domain.sugeno.variable.SugenoOutput import SugenoOutput
 from continentalfuzzy.domain.sugeno.SugenoRule import SugenoRule
+from continentalfuzzy.domain.sugeno.SugenoCompiledRules import \
+    SugenoCompiledRules
 
 
 class SugenoController:
@@ -24,6 +26,7 @@ class SugenoController:
         self.__inputs = dict()
         self.__outputs = dict()
         self.__rules = list()
+        self.__compiled_rules = None
 
         if sugeno_fis_system is not None:
             self.fis_system = sugeno_fis_system
@@ -123,3 +126,14 @@ class SugenoController:
             raise Exception(
                 f"O valor não é uma instância da classe SugenoRule!")
         self.__rules.append(p_rule)
+
+    @property
+    def compiled_rules(self) -> SugenoCompiledRules:
+        return self.__compiled_rules
+
+    @compiled_rules.setter
+    def compiled_rules(self, p_compiled_rules: SugenoCompiledRules):
+        if not isinstance(p_compiled_rules, SugenoCompiledRules):
+            raise Exception("O valor não é uma instância da classe "
+                            "SugenoCompiledRules!")
+        self.__compiled_rules = p_compiled_rules
@@ -20,8 +20,9 @@ class System:
     """
     Classe usada para armazenar todos os componentes de um arquivo (.fis).
     """
-    # Constante com o número máximo de consequentes
-    MAX_NUM_OUTPUTS = 1
+    # Constante com o número máximo de consequentes. Os controladores Sugeno
+    # calculam todos os consequentes com os mesmos disparos das regras
+    MAX_NUM_OUTPUTS = 8
 
     # Dicionário com os conectores implementados e a equivalência com
     # relação ao arquivo .fis
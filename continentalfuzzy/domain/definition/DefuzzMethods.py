@@ -14,3 +14,7 @@ class DefuzzMethods(Enum):
     centroid = auto()
     wtaver = auto()
     wtsum = auto()
+    bisector = auto()
+    mom = auto()
+    som = auto()
+    lom = auto()
@@ -0,0 +1,16 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+from enum import Enum, auto
+
+
+class CentroidModes(Enum):
+    """
+    Enum com os modos de cálculo do centroide do motor vetorizado Mamdani.
+    """
+    automatic = auto()
+    sampled = auto()
+    analytic = auto()
@@ -12,3 +12,7 @@ class MamdaniDefuzzMethods(Enum):
     Enum com os métodos de defuzzificação implementados para o Mamdani.
     """
     centroid = auto()
+    bisector = auto()
+    mom = auto()
+    som = auto()
+    lom = auto()
@@ -0,0 +1,16 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+from enum import Enum, auto
+
+
+class UniverseModes(Enum):
+    """
+    Enum com os modos de criação dos universos das variáveis Mamdani.
+    """
+    default = auto()
+    fixed = auto()
+    adaptive = auto()
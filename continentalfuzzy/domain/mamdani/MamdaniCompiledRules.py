@@ -0,0 +1,320 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import numpy as np
+from typing import List, Optional
+
+
+class MamdaniCompiledRules:
+    """
+    Base de regras Mamdani compilada em arrays densos, usada pelo motor
+    vetorizado.
+
+    As curvas de pertinência dos antecedentes e dos consequentes são
+    amostradas uma única vez sobre o universo de cada variável, o mesmo
+    universo usado pelo controlador do scikit-fuzzy.
+    """
+
+    # Marcador para os antecedentes que não participam da regra e para os
+    # consequentes que não são alterados pela regra (valor 0 no arquivo .fis)
+    DONT_CARE = -1
+
+    def __init__(self,
+                 c_input_names: Optional[List[str]] = None,
+                 c_input_universes: Optional[List[np.ndarray]] = None,
+                 c_input_mfs: Optional[List[np.ndarray]] = None,
+                 c_mf_terms: Optional[np.ndarray] = None,
+                 c_term_mf: Optional[np.ndarray] = None,
+                 c_term_not: Optional[np.ndarray] = None,
+                 c_term_index: Optional[np.ndarray] = None,
+                 c_or_mask: Optional[np.ndarray] = None,
+                 c_weights: Optional[np.ndarray] = None,
+                 c_output_names: Optional[List[str]] = None,
+                 c_output_universes: Optional[List[np.ndarray]] = None,
+                 c_output_mfs: Optional[List[np.ndarray]] = None,
+                 c_output_mf_index: Optional[np.ndarray] = None,
+                 c_output_trapezoids: Optional[List[Optional[np.ndarray]]] =
+                 None):
+        self.__input_names = list()
+        self.__input_universes = list()
+        self.__input_mfs = list()
+        self.__mf_terms = None
+        self.__term_mf = None
+        self.__term_not = None
+        self.__term_index = None
+        self.__or_mask = None
+        self.__weights = None
+        self.__output_names = list()
+        self.__output_universes = list()
+        self.__output_mfs = list()
+        self.__output_mf_index = None
+        self.__output_trapezoids = list()
+
+        if c_input_names is not None:
+            self.input_names = c_input_names
+
+        if c_input_universes is not None:
+            self.input_universes = c_input_universes
+
+        if c_input_mfs is not None:
+            self.input_mfs = c_input_mfs
+
+        if c_mf_terms is not None:
+            self.mf_terms = c_mf_terms
+
+        if c_term_mf is not None:
+            self.term_mf = c_term_mf
+
+        if c_term_not is not None:
+            self.term_not = c_term_not
+
+        if c_term_index is not None:
+            self.term_index = c_term_index
+
+        if c_or_mask is not None:
+            self.or_mask = c_or_mask
+
+        if c_weights is not None:
+            self.weights = c_weights
+
+        if c_output_names is not None:
+            self.output_names = c_output_names
+
+        if c_output_universes is not None:
+            self.output_universes = c_output_universes
+
+        if c_output_mfs is not None:
+            self.output_mfs = c_output_mfs
+
+        if c_output_mf_index is not None:
+            self.output_mf_index = c_output_mf_index
+
+        if c_output_trapezoids is not None:
+            self.output_trapezoids = c_output_trapezoids
+
+    @staticmethod
+    def valid_array(p_array, p_ndim: int):
+        if not isinstance(p_array, np.ndarray):
+            raise Exception("O parâmetro não é um numpy array!")
+
+        if p_array.ndim != p_ndim:
+            raise Exception(f"O array precisa ter {p_ndim} dimensões!")
+
+    @classmethod
+    def valid_array_list(cls, p_list, p_ndim: int):
+        if not isinstance(p_list, list):
+            raise Exception("O parâmetro não é uma lista!")
+
+        for value in p_list:
+            cls.valid_array(value, p_ndim)
+
+    @staticmethod
+    def valid_names(p_names):
+        if not isinstance(p_names, list):
+            raise Exception("O parâmetro não é uma lista!")
+
+        for value in p_names:
+            if not isinstance(value, str):
+                raise Exception("O nome não é uma string!")
+
+    @property
+    def num_rules(self) -> int:
+        return 0 if self.__weights is None else self.__weights.shape[0]
+
+    @property
+    def num_inputs(self) -> int:
+        return len(self.__input_names)
+
+    @property
+    def num_outputs(self) -> int:
+        return len(self.__output_names)
+
+    @property
+    def num_terms(self) -> int:
+        return 0 if self.__term_mf is None else self.__term_mf.shape[0]
+
+    @property
+    def input_names(self) -> List[str]:
+        """
+        Nomes dos antecedentes na ordem das colunas de term_index.
+        """
+        return self.__input_names
+
+    @input_names.setter
+    def input_names(self, p_input_names: List[str]):
+        self.valid_names(p_input_names)
+        self.__input_names = p_input_names
+
+    @property
+    def input_universes(self) -> List[np.ndarray]:
+        """
+        Universo de cada antecedente, criado pelo UniverseService.
+        """
+        return self.__input_universes
+
+    @input_universes.setter
+    def input_universes(self, p_input_universes: List[np.ndarray]):
+        self.valid_array_list(p_input_universes, 1)
+        self.__input_universes = p_input_universes
+
+    @property
+    def input_mfs(self) -> List[np.ndarray]:
+        """
+        Matriz função de pertinência x universo de cada antecedente, com as
+        curvas de pertinência amostradas no universo.
+        """
+        return self.__input_mfs
+
+    @input_mfs.setter
+    def input_mfs(self, p_input_mfs: List[np.ndarray]):
+        self.valid_array_list(p_input_mfs, 2)
+        self.__input_mfs = p_input_mfs
+
+    @property
+    def mf_terms(self) -> np.ndarray:
+        """
+        Matriz com os pares distintos (antecedente, função de pertinência)
+        usados pelas regras. Cada par é fuzzificado uma única vez por amostra.
+        """
+        return self.__mf_terms
+
+    @mf_terms.setter
+    def mf_terms(self, p_mf_terms: np.ndarray):
+        self.valid_array(p_mf_terms, 2)
+        self.__mf_terms = p_mf_terms
+
+    @property
+    def term_mf(self) -> np.ndarray:
+        """
+        Vetor com a posição em mf_terms de cada termo (antecedente, função de
+        pertinência, NOT) distinto.
+        """
+        return self.__term_mf
+
+    @term_mf.setter
+    def term_mf(self, p_term_mf: np.ndarray):
+        self.valid_array(p_term_mf, 1)
+        self.__term_mf = p_term_mf
+
+    @property
+    def term_not(self) -> np.ndarray:
+        """
+        Vetor indicando os termos que usam o operador NOT.
+        """
+        return self.__term_not
+
+    @term_not.setter
+    def term_not(self, p_term_not: np.ndarray):
+        self.valid_array(p_term_not, 1)
+        self.__term_not = p_term_not
+
+    @property
+    def term_index(self) -> np.ndarray:
+        """
+        Matriz regra x antecedente com a posição do termo usado pela regra,
+        ou DONT_CARE quando o antecedente não participa da regra.
+        """
+        return self.__term_index
+
+    @term_index.setter
+    def term_index(self, p_term_index: np.ndarray):
+        self.valid_array(p_term_index, 2)
+        self.__term_index = p_term_index
+
+    @property
+    def or_mask(self) -> np.ndarray:
+        """
+        Vetor indicando as regras que usam o conector OR.
+        """
+        return self.__or_mask
+
+    @or_mask.setter
+    def or_mask(self, p_or_mask: np.ndarray):
+        self.valid_array(p_or_mask, 1)
+        self.__or_mask = p_or_mask
+
+    @property
+    def weights(self) -> np.ndarray:
+        """
+        Vetor com os pesos das regras.
+        """
+        return self.__weights
+
+    @weights.setter
+    def weights(self, p_weights: np.ndarray):
+        self.valid_array(p_weights, 1)
+        self.__weights = p_weights
+
+    @property
+    def output_names(self) -> List[str]:
+        """
+        Nomes dos consequentes na ordem das linhas de output_mf_index.
+        """
+        return self.__output_names
+
+    @output_names.setter
+    def output_names(self, p_output_names: List[str]):
+        self.valid_names(p_output_names)
+        self.__output_names = p_output_names
+
+    @property
+    def output_universes(self) -> List[np.ndarray]:
+        """
+        Universo de cada consequente, criado pelo UniverseService.
+        """
+        return self.__output_universes
+
+    @output_universes.setter
+    def output_universes(self, p_output_universes: List[np.ndarray]):
+        self.valid_array_list(p_output_universes, 1)
+        self.__output_universes = p_output_universes
+
+    @property
+    def output_mfs(self) -> List[np.ndarray]:
+        """
+        Matriz função de pertinência x universo de cada consequente, com as
+        curvas de pertinência amostradas no universo.
+        """
+        return self.__output_mfs
+
+    @output_mfs.setter
+    def output_mfs(self, p_output_mfs: List[np.ndarray]):
+        self.valid_array_list(p_output_mfs, 2)
+        self.__output_mfs = p_output_mfs
+
+    @property
+    def output_mf_index(self) -> np.ndarray:
+        """
+        Matriz consequente x regra com o índice da função de pertinência do
+        consequente alterada pela regra, ou DONT_CARE.
+        """
+        return self.__output_mf_index
+
+    @output_mf_index.setter
+    def output_mf_index(self, p_output_mf_index: np.ndarray):
+        self.valid_array(p_output_mf_index, 2)
+        self.__output_mf_index = p_output_mf_index
+
+    @property
+    def output_trapezoids(self) -> List[Optional[np.ndarray]]:
+        """
+        Matriz função de pertinência x (a, b, c, d) de cada consequente, ou
+        None quando alguma função de pertinência do consequente não é
+        triangular nem trapezoidal.
+        """
+        return self.__output_trapezoids
+
+    @output_trapezoids.setter
+    def output_trapezoids(self,
+                          p_output_trapezoids: List[Optional[np.ndarray]]):
+        if not isinstance(p_output_trapezoids, list):
+            raise Exception("O parâmetro não é uma lista!")
+
+        for value in p_output_trapezoids:
+            if value is not None:
+                self.valid_array(value, 2)
+
+        self.__output_trapezoids = p_output_trapezoids
@@ -0,0 +1,88 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+from typing import Optional, Tuple
+from continentalfuzzy.domain.definition.mamdani.UniverseModes import \
+    UniverseModes
+
+
+class UniverseResolution:
+    """
+    Política de resolução dos universos das variáveis de um controlador
+    Mamdani.
+
+    - default: pontos notáveis das funções de pertinência e 100 pontos por
+      gaussiana (50 + 50 por gaussiana dupla), como o FuzzyUtil.create_universe.
+    - fixed: num_points pontos igualmente espaçados no range, mais os pontos
+      notáveis das funções de pertinência.
+    - adaptive: a quantidade de pontos é dobrada até o erro relativo ficar
+      abaixo de tolerance. Nos consequentes o erro é a variação do centroide
+      dividida pela largura do range; nos antecedentes é o erro do grau de
+      pertinência interpolado.
+    """
+
+    def __init__(self,
+                 r_mode: UniverseModes = UniverseModes.default,
+                 r_num_points: Optional[int] = None,
+                 r_tolerance: Optional[float] = None):
+        self.__mode = None
+        self.__num_points = None
+        self.__tolerance = None
+
+        self.mode = r_mode
+
+        if r_num_points is not None:
+            self.num_points = r_num_points
+
+        if r_tolerance is not None:
+            self.tolerance = r_tolerance
+
+    @property
+    def mode(self) -> UniverseModes:
+        return self.__mode
+
+    @mode.setter
+    def mode(self, value: UniverseModes):
+        if not isinstance(value, UniverseModes):
+            raise Exception("O valor não é uma instância da classe "
+                            "UniverseModes!")
+
+        self.__mode = value
+
+    @property
+    def num_points(self) -> Optional[int]:
+        return self.__num_points
+
+    @num_points.setter
+    def num_points(self, value: int):
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise Exception("O número de pontos não é um inteiro!")
+
+        if value < 2:
+            raise Exception("O número de pontos precisa ser maior que 1!")
+
+        self.__num_points = value
+
+    @property
+    def tolerance(self) -> Optional[float]:
+        return self.__tolerance
+
+    @tolerance.setter
+    def tolerance(self, value: float):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise Exception("A tolerância não é um número!")
+
+        if value <= 0:
+            raise Exception("A tolerância precisa ser maior que zero!")
+
+        self.__tolerance = float(value)
+
+    @property
+    def key(self) -> Tuple:
+        """
+        Chave da política, usada no cache dos universos.
+        """
+        return self.__mode, self.__num_points, self.__tolerance
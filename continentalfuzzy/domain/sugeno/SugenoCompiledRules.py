@@ -0,0 +1,369 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import numpy as np
+from typing import Dict, List, Optional
+
+
+class SugenoCompiledRules:
+    """
+    Base de regras Sugeno compilada em arrays densos.
+
+    As linhas dos arrays representam as regras e as colunas representam os
+    antecedentes, na ordem em que foram declarados no arquivo .fis.
+    """
+
+    # Marcador para os antecedentes que não participam da regra (valor 0 no
+    # arquivo .fis)
+    DONT_CARE = -1
+
+    def __init__(self,
+                 c_input_names: Optional[List[str]] = None,
+                 c_input_mfs: Optional[List[List[Dict]]] = None,
+                 c_mf_index: Optional[np.ndarray] = None,
+                 c_not_mask: Optional[np.ndarray] = None,
+                 c_or_mask: Optional[np.ndarray] = None,
+                 c_weights: Optional[np.ndarray] = None,
+                 c_coefficients: Optional[np.ndarray] = None,
+                 c_mf_terms: Optional[np.ndarray] = None,
+                 c_term_mf: Optional[np.ndarray] = None,
+                 c_term_not: Optional[np.ndarray] = None,
+                 c_term_index: Optional[np.ndarray] = None,
+                 c_output_names: Optional[List[str]] = None,
+                 c_output_coefficients: Optional[np.ndarray] = None,
+                 c_output_mask: Optional[np.ndarray] = None):
+        self.__input_names = list()
+        self.__input_mfs = list()
+        self.__mf_index = None
+        self.__not_mask = None
+        self.__or_mask = None
+        self.__weights = None
+        self.__coefficients = None
+        self.__output_names = list()
+        self.__output_coefficients = None
+        self.__output_mask = None
+        self.__constant_consequents = False
+        self.__mf_terms = None
+        self.__term_mf = None
+        self.__term_not = None
+        self.__term_index = None
+        self.__rule_terms = list()
+
+        if c_input_names is not None:
+            self.input_names = c_input_names
+
+        if c_input_mfs is not None:
+            self.input_mfs = c_input_mfs
+
+        if c_mf_index is not None:
+            self.mf_index = c_mf_index
+
+        if c_not_mask is not None:
+            self.not_mask = c_not_mask
+
+        if c_or_mask is not None:
+            self.or_mask = c_or_mask
+
+        if c_weights is not None:
+            self.weights = c_weights
+
+        if c_coefficients is not None:
+            self.coefficients = c_coefficients
+
+        if c_mf_terms is not None:
+            self.mf_terms = c_mf_terms
+
+        if c_term_mf is not None:
+            self.term_mf = c_term_mf
+
+        if c_term_not is not None:
+            self.term_not = c_term_not
+
+        if c_term_index is not None:
+            self.term_index = c_term_index
+
+        if c_output_names is not None:
+            self.output_names = c_output_names
+
+        if c_output_coefficients is not None:
+            self.output_coefficients = c_output_coefficients
+
+        if c_output_mask is not None:
+            self.output_mask = c_output_mask
+
+    @staticmethod
+    def valid_array(p_array, p_ndim: int):
+        if not isinstance(p_array, np.ndarray):
+            raise Exception("O parâmetro não é um numpy array!")
+
+        if p_array.ndim != p_ndim:
+            raise Exception(f"O array precisa ter {p_ndim} dimensões!")
+
+    @property
+    def num_rules(self) -> int:
+        return 0 if self.__weights is None else self.__weights.shape[0]
+
+    @property
+    def num_inputs(self) -> int:
+        return len(self.__input_names)
+
+    @property
+    def input_names(self) -> List[str]:
+        """
+        Nomes dos antecedentes na ordem das colunas dos arrays.
+        """
+        return self.__input_names
+
+    @input_names.setter
+    def input_names(self, p_input_names: List[str]):
+        if not isinstance(p_input_names, list):
+            raise Exception("O parâmetro não é uma lista!")
+
+        for value in p_input_names:
+            if not isinstance(value, str):
+                raise Exception("O nome não é uma string!")
+        self.__input_names = p_input_names
+
+    @property
+    def input_mfs(self) -> List[List[Dict]]:
+        """
+        Funções de pertinência de cada antecedente, no formato retornado por
+        SugenoControllerService.get_mf_function. Os valores de mf_index
+        apontam para as posições destas listas.
+        """
+        return self.__input_mfs
+
+    @input_mfs.setter
+    def input_mfs(self, p_input_mfs: List[List[Dict]]):
+        if not isinstance(p_input_mfs, list):
+            raise Exception("O parâmetro não é uma lista!")
+
+        for value in p_input_mfs:
+            if not isinstance(value, list):
+                raise Exception("Um dos itens não é uma lista!")
+        self.__input_mfs = p_input_mfs
+
+    @property
+    def mf_index(self) -> np.ndarray:
+        """
+        Matriz regra x antecedente com o índice da função de pertinência
+        usada, ou DONT_CARE quando o antecedente não participa da regra.
+        """
+        return self.__mf_index
+
+    @mf_index.setter
+    def mf_index(self, p_mf_index: np.ndarray):
+        self.valid_array(p_mf_index, 2)
+        self.__mf_index = p_mf_index
+
+    @property
+    def not_mask(self) -> np.ndarray:
+        """
+        Matriz regra x antecedente indicando o uso do operador NOT.
+        """
+        return self.__not_mask
+
+    @not_mask.setter
+    def not_mask(self, p_not_mask: np.ndarray):
+        self.valid_array(p_not_mask, 2)
+        self.__not_mask = p_not_mask
+
+    @property
+    def or_mask(self) -> np.ndarray:
+        """
+        Vetor indicando as regras que usam o conector OR.
+        """
+        return self.__or_mask
+
+    @or_mask.setter
+    def or_mask(self, p_or_mask: np.ndarray):
+        self.valid_array(p_or_mask, 1)
+        self.__or_mask = p_or_mask
+
+    @property
+    def weights(self) -> np.ndarray:
+        """
+        Vetor com os pesos das regras.
+        """
+        return self.__weights
+
+    @weights.setter
+    def weights(self, p_weights: np.ndarray):
+        self.valid_array(p_weights, 1)
+        self.__weights = p_weights
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        """
+        Matriz regra x (antecedentes + 1) com os coeficientes lineares dos
+        consequentes do primeiro consequente. A última coluna contém o termo
+        constante.
+        """
+        return self.__coefficients
+
+    @coefficients.setter
+    def coefficients(self, p_coefficients: np.ndarray):
+        self.valid_array(p_coefficients, 2)
+        self.__coefficients = p_coefficients
+        self.__output_coefficients = p_coefficients[np.newaxis]
+        self.__output_mask = np.ones((1, p_coefficients.shape[0]), dtype=bool)
+        self.__constant_consequents = not p_coefficients[:, :-1].any()
+
+    @property
+    def output_names(self) -> List[str]:
+        """
+        Nomes dos consequentes na ordem da primeira dimensão de
+        output_coefficients.
+        """
+        return self.__output_names
+
+    @output_names.setter
+    def output_names(self, p_output_names: List[str]):
+        if not isinstance(p_output_names, list):
+            raise Exception("O parâmetro não é uma lista!")
+
+        for value in p_output_names:
+            if not isinstance(value, str):
+                raise Exception("O nome não é uma string!")
+        self.__output_names = p_output_names
+
+    @property
+    def num_outputs(self) -> int:
+        return 0 if self.__output_coefficients is None else \
+            self.__output_coefficients.shape[0]
+
+    @property
+    def output_coefficients(self) -> np.ndarray:
+        """
+        Array consequente x regra x (antecedentes + 1) com os coeficientes
+        lineares de todos os consequentes.
+        """
+        return self.__output_coefficients
+
+    @output_coefficients.setter
+    def output_coefficients(self, p_output_coefficients: np.ndarray):
+        self.valid_array(p_output_coefficients, 3)
+        self.__output_coefficients = p_output_coefficients
+        self.__coefficients = p_output_coefficients[0]
+        self.__output_mask = np.ones(p_output_coefficients.shape[:2],
+                                     dtype=bool)
+        self.__constant_consequents = \
+            not p_output_coefficients[:, :, :-1].any()
+
+    @property
+    def output_mask(self) -> np.ndarray:
+        """
+        Matriz consequente x regra indicando as regras que participam de cada
+        consequente (valor diferente de 0 no arquivo .fis).
+        """
+        return self.__output_mask
+
+    @output_mask.setter
+    def output_mask(self, p_output_mask: np.ndarray):
+        self.valid_array(p_output_mask, 2)
+        self.__output_mask = p_output_mask
+
+    @property
+    def constant_consequents(self) -> bool:
+        """
+        Indica se todos os consequentes são constantes (sistema de ordem
+        zero), ou seja, se somente a última coluna de coefficients possui
+        valores diferentes de zero.
+        """
+        return self.__constant_consequents
+
+    @property
+    def constants(self) -> np.ndarray:
+        """
+        Vetor com o termo constante do primeiro consequente de cada regra.
+        """
+        return self.__coefficients[:, -1]
+
+    @property
+    def mf_terms(self) -> np.ndarray:
+        """
+        Matriz com os pares distintos (antecedente, função de pertinência)
+        usados pelas regras. Cada par é avaliado uma única vez por amostra.
+        """
+        return self.__mf_terms
+
+    @mf_terms.setter
+    def mf_terms(self, p_mf_terms: np.ndarray):
+        self.valid_array(p_mf_terms, 2)
+        self.__mf_terms = p_mf_terms
+
+    @property
+    def term_mf(self) -> np.ndarray:
+        """
+        Vetor com a posição em mf_terms de cada termo (antecedente, função de
+        pertinência, NOT) distinto.
+        """
+        return self.__term_mf
+
+    @term_mf.setter
+    def term_mf(self, p_term_mf: np.ndarray):
+        self.valid_array(p_term_mf, 1)
+        self.__term_mf = p_term_mf
+
+    @property
+    def term_not(self) -> np.ndarray:
+        """
+        Vetor indicando os termos que usam o operador NOT.
+        """
+        return self.__term_not
+
+    @term_not.setter
+    def term_not(self, p_term_not: np.ndarray):
+        self.valid_array(p_term_not, 1)
+        self.__term_not = p_term_not
+
+    @property
+    def term_index(self) -> np.ndarray:
+        """
+        Matriz regra x antecedente com a posição do termo usado pela regra,
+        ou DONT_CARE quando o antecedente não participa da regra.
+        """
+        return self.__term_index
+
+    @term_index.setter
+    def term_index(self, p_term_index: np.ndarray):
+        self.valid_array(p_term_index, 2)
+        self.__term_index = p_term_index
+        self.__rule_terms = [
+            [int(term) for term in row if term != self.DONT_CARE]
+            for row in p_term_index]
+
+    @property
+    def rule_terms(self) -> List[List[int]]:
+        """
+        Lista com as posições dos termos usados por cada regra.
+        """
+        return self.__rule_terms
+
+    @property
+    def num_rule_antecedents(self) -> int:
+        """
+        Quantidade de antecedentes de todas as regras, ou seja, a quantidade
+        de avaliações de funções de pertinência feitas quando cada regra
+        calcula os seus próprios graus.
+        """
+        return sum(len(terms) for terms in self.__rule_terms)
+
+    @property
+    def num_mf_evaluations(self) -> int:
+        """
+        Quantidade de avaliações de funções de pertinência por amostra com a
+        fuzzificação compartilhada.
+        """
+        return 0 if self.__mf_terms is None else self.__mf_terms.shape[0]
+
+    @property
+    def num_mf_evaluations_saved(self) -> int:
+        """
+        Quantidade de avaliações de funções de pertinência economizadas por
+        amostra com a fuzzificação compartilhada.
+        """
+        return self.num_rule_antecedents - self.num_mf_evaluations
@@ -15,6 +15,8 @@ class FuzzyControlCommandInput:
         self.__matrix = None
         self.__fuzzy_inputs = dict()
         self.__fuzzy_inputs_matrix = dict()
+        self.__fuzzy_inputs_masks = dict()
+        self.__nodata_values = dict()
         self.__fuzzy_output = None
         self.__use_dict_facies_association = True
 
@@ -56,9 +58,65 @@ class FuzzyControlCommandInput:
 
         self.__fuzzy_inputs_matrix[p_name][p_row][p_column] = p_value
 
+    def set_fuzzy_inputs_matrix(self, p_name, p_matrix):
+        # A matriz é usada sem cópia, por exemplo uma matriz em memória
+        # compartilhada
+        if np.shape(p_matrix) != (self.__num_rows, self.__num_cols):
+            raise Exception("A matriz não possui a dimensão informada!")
+
+        self.__fuzzy_inputs_matrix[p_name] = p_matrix
+
     def get_fuzzy_inputs_matrix(self):
         return self.__fuzzy_inputs_matrix
 
+    def set_nodata_value(self, p_name, p_value):
+        # As células com este valor na matriz do antecedente não são
+        # calculadas (nan também é aceito). Com None o antecedente deixa de
+        # ter valor nodata
+        if p_value is None:
+            self.__nodata_values.pop(p_name, None)
+        else:
+            self.__nodata_values[p_name] = float(p_value)
+
+    def get_nodata_values(self):
+        return self.__nodata_values
+
+    def set_fuzzy_inputs_mask(self, p_name, p_mask):
+        # Máscara booleana das células inativas do antecedente, como no
+        # numpy.ma: as células True não são calculadas. Com None o
+        # antecedente deixa de ter máscara
+        if p_mask is None:
+            self.__fuzzy_inputs_masks.pop(p_name, None)
+            return
+
+        if np.shape(p_mask) != (self.__num_rows, self.__num_cols):
+            raise Exception("A máscara não possui a dimensão informada!")
+
+        self.__fuzzy_inputs_masks[p_name] = np.asarray(p_mask, dtype=bool)
+
+    def get_fuzzy_inputs_masks(self):
+        return self.__fuzzy_inputs_masks
+
+    def get_inactive_mask(self):
+        """
+        Células que não são calculadas: as marcadas na máscara de algum
+        antecedente ou com o valor nodata do antecedente.
+        """
+        inactive = np.zeros((self.__num_rows, self.__num_cols), dtype=bool)
+        for mask in self.__fuzzy_inputs_masks.values():
+            inactive |= mask
+
+        for name, value in self.__nodata_values.items():
+            matrix = self.__fuzzy_inputs_matrix.get(name)
+            if matrix is None:
+                continue
+            if np.isnan(value):
+                inactive |= np.isnan(matrix)
+            else:
+                inactive |= np.asarray(matrix) == value
+
+        return inactive
+
     @property
     def fuzzy_output(self) -> str:
         return self.__fuzzy_output
@@ -0,0 +1,137 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple, Union
+from continentalfuzzy.domain.System import System
+from continentalfuzzy.domain.definition.ControllerType import ControllerType
+from continentalfuzzy.service.MamdaniControllerService import \
+    MamdaniControllerService
+from continentalfuzzy.service.SugenoControllerService import \
+    SugenoControllerService
+from continentalfuzzy.service.SystemService import SystemService
+
+
+class ControllerCacheService:
+    """
+    Cache dos controladores criados a partir dos arquivos .fis, compartilhado
+    por todo o processo.
+
+    A chave é formada pelo caminho absoluto, pela data de modificação e pelo
+    hash SHA-256 do conteúdo do arquivo, e pelo uso do dicionário de fácies.
+    Um arquivo alterado gera uma chave nova, e o controlador usado há mais
+    tempo é descartado quando o cache passa de CACHE_SIZE controladores.
+
+    Cada controlador é devolvido com um lock, pois o simulador do
+    scikit-fuzzy guarda o estado do último cálculo e não pode ser usado por
+    duas threads ao mesmo tempo.
+    """
+
+    # Quantidade máxima de controladores no cache
+    CACHE_SIZE = 16
+
+    # Classe do serviço de cada tipo de controlador
+    DICT_CONTROLLERS = {
+        ControllerType.mamdani: MamdaniControllerService,
+        ControllerType.sugeno: SugenoControllerService}
+
+    __cache = OrderedDict()
+    __hits = 0
+    __misses = 0
+    __lock = threading.Lock()
+
+    @staticmethod
+    def get_file_key(filename: str) -> Tuple[str, int, str]:
+        """
+        Caminho absoluto, data de modificação (ns) e hash SHA-256 do arquivo.
+        """
+        if not os.path.isfile(filename):
+            raise Exception(f"O arquivo {filename} não existe!")
+
+        path = os.path.abspath(filename)
+        mtime = os.stat(path).st_mtime_ns
+        with open(path, 'rb') as file:
+            content_hash = hashlib.sha256(file.read()).hexdigest()
+
+        return path, mtime, content_hash
+
+    @classmethod
+    def create_controller(cls, fis_system: System) \
+            -> Union[MamdaniControllerService, SugenoControllerService]:
+        if fis_system.type not in cls.DICT_CONTROLLERS:
+            raise Exception(f"O controlador {fis_system.type} não foi "
+                            f"implementado!")
+
+        controller = cls.DICT_CONTROLLERS[fis_system.type]()
+        controller.create_from_fis_system(fis_system)
+
+        return controller
+
+    @classmethod
+    def get_controller(cls,
+                       filename: str,
+                       use_dict_facies_association: bool = False) \
+            -> Tuple[System, Union[MamdaniControllerService,
+                                   SugenoControllerService], threading.Lock]:
+        """
+        Retorna o controlador do arquivo .fis, criando o controlador somente
+        quando ele não está no cache.
+
+        Parâmetros
+        ----------
+        filename : str
+            Caminho do arquivo .fis.
+
+        use_dict_facies_association : bool
+            Indica se o dicionário de fácies é usado.
+
+        Retorna
+        -------
+        Tuple[System, Union[MamdaniControllerService, SugenoControllerService], threading.Lock]
+            Retorna o sistema, o serviço do controlador e o lock que precisa
+            ser adquirido durante os cálculos com o controlador.
+        """
+        key = cls.get_file_key(filename) + (bool(use_dict_facies_association),)
+
+        with cls.__lock:
+            if key in cls.__cache:
+                cls.__hits += 1
+                cls.__cache.move_to_end(key)
+                return cls.__cache[key]
+
+            cls.__misses += 1
+
+        # O controlador é criado fora do lock, assim arquivos diferentes são
+        # importados ao mesmo tempo
+        fis_system = SystemService().import_file(filename,
+                                                 use_dict_facies_association)
+        entry = (fis_system, cls.create_controller(fis_system),
+                 threading.Lock())
+
+        with cls.__lock:
+            entry = cls.__cache.setdefault(key, entry)
+            cls.__cache.move_to_end(key)
+            while len(cls.__cache) > cls.CACHE_SIZE:
+                cls.__cache.popitem(last=False)
+
+        return entry
+
+    @classmethod
+    def get_cache_info(cls) -> Dict[str, int]:
+        with cls.__lock:
+            return {'hits': cls.__hits,
+                    'misses': cls.__misses,
+                    'size': len(cls.__cache)}
+
+    @classmethod
+    def clear_cache(cls):
+        with cls.__lock:
+            cls.__cache.clear()
+            cls.__hits = 0
+            cls.__misses = 0
@@ -0,0 +1,398 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import hashlib
+import itertools
+import os
+import numpy as np
+from typing import Dict, List, Optional, Union
+from continentalfuzzy.domain.LookupTable import LookupTable
+from continentalfuzzy.domain.System import System
+from continentalfuzzy.domain.definition.ControllerType import ControllerType
+from continentalfuzzy.service.MamdaniControllerService import \
+    MamdaniControllerService
+from continentalfuzzy.service.SugenoControllerService import \
+    SugenoControllerService
+
+
+class LookupTableService:
+    """
+    Controlador substituto por tabela: os consequentes de um controlador
+    Mamdani ou Sugeno são amostrados uma única vez em uma grade regular sobre
+    os ranges dos antecedentes e os novos pontos são calculados por
+    interpolação multilinear da tabela.
+
+    Os valores fora dos ranges são limitados aos ranges (como o scikit-fuzzy
+    faz no Mamdani). A tabela guarda os consequentes sem a conversão do
+    dicionário de fácies, pois os códigos das fácies não podem ser
+    interpolados.
+    """
+
+    # Quantidade padrão de pontos da grade de cada antecedente
+    DEFAULT_GRID_POINTS = 33
+
+    # Quantidade padrão de amostras aleatórias da validação
+    VALIDATION_SAMPLES = 1000
+
+    # Extensão do arquivo da tabela, salvo ao lado do arquivo .fis
+    FILE_EXTENSION = '.lut.npz'
+
+    def __init__(self,
+                 controller_service: Union[MamdaniControllerService,
+                                           SugenoControllerService]):
+        if not isinstance(controller_service, (MamdaniControllerService,
+                                               SugenoControllerService)):
+            raise Exception("O controlador não é uma instância das classes "
+                            "MamdaniControllerService ou "
+                            "SugenoControllerService!")
+
+        self.__controller_service = controller_service
+        self.__table = None
+
+    @property
+    def controller_service(self) -> Union[MamdaniControllerService,
+                                          SugenoControllerService]:
+        return self.__controller_service
+
+    @property
+    def fis_system(self) -> System:
+        if isinstance(self.controller_service, MamdaniControllerService):
+            fis_system = self.controller_service.fuzzy_machine.fis_system
+        else:
+            fis_system = self.controller_service.sugeno_controller.fis_system
+
+        if fis_system is None:
+            raise Exception("O controlador não foi criado!")
+
+        return fis_system
+
+    @property
+    def table(self) -> LookupTable:
+        if self.__table is None:
+            raise Exception("A tabela não foi criada!")
+
+        return self.__table
+
+    @table.setter
+    def table(self, value: LookupTable):
+        if not isinstance(value, LookupTable):
+            raise Exception("O valor não é uma instância da classe "
+                            "LookupTable!")
+
+        self.__table = value
+
+    def get_fis_hash(self) -> Optional[str]:
+        """
+        Hash SHA-256 do arquivo .fis do controlador, ou None quando o
+        arquivo não existe.
+        """
+        filename = self.fis_system.filename
+        if filename is None or not os.path.isfile(filename):
+            return None
+
+        with open(filename, 'rb') as file:
+            return hashlib.sha256(file.read()).hexdigest()
+
+    def get_table_filename(self) -> str:
+        """
+        Caminho do arquivo da tabela, ao lado do arquivo .fis.
+        """
+        filename = self.fis_system.filename
+        if filename is None:
+            raise Exception("O caminho do arquivo .fis não foi informado!")
+
+        return os.path.splitext(filename)[0] + self.FILE_EXTENSION
+
+    def calc_exact(self, v_inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Calcula todos os consequentes com o motor do controlador.
+
+        Parâmetros
+        ----------
+        v_inputs : Dict[str, np.ndarray]
+            Dicionário com as chaves sendo o nome dos antecedentes e os
+            valores sendo arrays 1-D com as amostras.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array consequente x amostra.
+        """
+        fis_system = self.fis_system
+        output_names = [f_output.name for f_output in
+                        fis_system.outputs.values()]
+
+        if fis_system.type == ControllerType.sugeno:
+            service = self.controller_service
+            x_array = service.get_batch_matrix(
+                service.get_batch_inputs(v_inputs))
+            result = np.empty((len(output_names), x_array.shape[1]),
+                              dtype=np.float64)
+            for start in range(0, x_array.shape[1],
+                               service.BATCH_CHUNK_SIZE):
+                result[:, start:start + service.BATCH_CHUNK_SIZE] = \
+                    service.calc_outputs_compiled(
+                        x_array[:, start:start + service.BATCH_CHUNK_SIZE])
+
+            return result
+
+        try:
+            MamdaniControllerService.valid_native_methods(fis_system)
+        except Exception:
+            dict_result = self.controller_service.fuzzy_calc_batch(
+                v_inputs, output_names)
+            return np.array([dict_result[name] for name in output_names],
+                            dtype=np.float64)
+
+        return np.array([self.controller_service.fuzzy_calc_native(v_inputs,
+                                                                   name)
+                         for name in output_names], dtype=np.float64)
+
+    def create_table(self,
+                     grid_points: Union[int, List[int]] = DEFAULT_GRID_POINTS
+                     ) -> LookupTable:
+        """
+        Amostra o controlador na grade regular dos ranges dos antecedentes.
+
+        Parâmetros
+        ----------
+        grid_points : Union[int, List[int]]
+            Quantidade de pontos da grade de todos os antecedentes ou lista
+            com a quantidade de pontos de cada antecedente, na ordem do
+            arquivo .fis.
+
+        Retorna
+        -------
+        LookupTable
+            Retorna a tabela criada, que também fica na propriedade table.
+        """
+        fis_system = self.fis_system
+        f_inputs = list(fis_system.inputs.values())
+
+        if isinstance(grid_points, int):
+            grid_points = [grid_points] * len(f_inputs)
+
+        if len(grid_points) != len(f_inputs):
+            raise Exception("A quantidade de pontos da grade não corresponde "
+                            "aos antecedentes!")
+
+        axes = list()
+        for f_input, num_points in zip(f_inputs, grid_points):
+            if isinstance(num_points, bool) or \
+                    not isinstance(num_points, int) or num_points < 2:
+                raise Exception("O número de pontos precisa ser maior que 1!")
+
+            axes.append(np.linspace(f_input.range[0], f_input.range[1],
+                                    num=num_points, endpoint=True))
+
+        input_names = [f_input.name for f_input in f_inputs]
+        grid = np.meshgrid(*axes, indexing='ij')
+        values = self.calc_exact({name: np.ravel(matrix) for name, matrix
+                                  in zip(input_names, grid)})
+
+        self.table = LookupTable(
+            input_names,
+            axes,
+            [f_output.name for f_output in fis_system.outputs.values()],
+            values.reshape((-1,) + grid[0].shape),
+            self.get_fis_hash())
+
+        return self.table
+
+    def interpolate_outputs(self,
+                            v_inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Interpola todos os consequentes da tabela.
+
+        Parâmetros
+        ----------
+        v_inputs : Dict[str, np.ndarray]
+            Dicionário com as chaves sendo o nome dos antecedentes e os
+            valores sendo números ou arrays com o mesmo formato.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array com a primeira dimensão sendo o consequente e as
+            demais com o formato das entradas.
+        """
+        table = self.table
+        for name in table.input_names:
+            if name not in v_inputs:
+                raise Exception(f"O antecedente {name} não foi informado!")
+
+        try:
+            arrays = np.broadcast_arrays(
+                *[np.asarray(v_inputs[name], dtype=np.float64)
+                  for name in table.input_names])
+        except ValueError:
+            raise Exception("Os arrays dos antecedentes não possuem o mesmo "
+                            "formato!")
+
+        shape = arrays[0].shape
+        lower = list()
+        fraction = list()
+        for axis, values in zip(table.axes, arrays):
+            values = np.clip(np.ravel(values), axis[0], axis[-1])
+            index = np.clip(np.searchsorted(axis, values, side='right') - 1,
+                            0, axis.shape[0] - 2)
+            lower.append(index)
+            fraction.append((values - axis[index]) /
+                            (axis[index + 1] - axis[index]))
+
+        flat_values = table.values.reshape((table.num_outputs, -1))
+        result = np.zeros((table.num_outputs, lower[0].shape[0]),
+                          dtype=np.float64)
+
+        # Soma ponderada dos 2 ** n vértices da célula da grade
+        for corner in itertools.product((0, 1), repeat=table.num_inputs):
+            weight = np.ones(lower[0].shape[0], dtype=np.float64)
+            for offset, value in zip(corner, fraction):
+                weight *= value if offset else 1.0 - value
+
+            flat_index = np.ravel_multi_index(
+                [index + offset for index, offset in zip(lower, corner)],
+                table.grid_shape)
+
+            # Os vértices com peso zero não participam, assim um vértice sem
+            # resultado (nan) só afeta as células em que ele tem peso
+            contribution = weight * flat_values[:, flat_index]
+            result += np.where(weight > 0, contribution, 0.0)
+
+        return result.reshape((table.num_outputs,) + shape)
+
+    def interpolate(self,
+                    v_inputs: Dict[str, Union[float, np.ndarray]],
+                    output: Optional[str] = None) -> Union[float, np.ndarray]:
+        """
+        Interpola um consequente da tabela.
+
+        Parâmetros
+        ----------
+        v_inputs : Dict[str, Union[float, np.ndarray]]
+            Dicionário com as chaves sendo o nome dos antecedentes e os
+            valores sendo números ou arrays com o mesmo formato.
+
+        output : Optional[str]
+            Nome do consequente. Quando não informado é usado o primeiro.
+
+        Retorna
+        -------
+        Union[float, np.ndarray]
+            Retorna um array com o formato das entradas, ou um float.
+        """
+        table = self.table
+        if output is None:
+            output = table.output_names[0]
+
+        if output not in table.output_names:
+            raise Exception(f"O consequente {output} não existe!")
+
+        result = self.interpolate_outputs(v_inputs)[
+            table.output_names.index(output)]
+
+        if result.ndim == 0:
+            return float(result)
+
+        return result
+
+    def validate(self,
+                 num_samples: int = VALIDATION_SAMPLES,
+                 seed: int = 0) -> Dict[str, Dict[str, float]]:
+        """
+        Compara a tabela com o motor do controlador em amostras aleatórias
+        dentro dos ranges dos antecedentes.
+
+        Retorna
+        -------
+        Dict[str, Dict[str, float]]
+            Retorna um dicionário com as chaves sendo o nome dos consequentes
+            e os valores sendo dicionários com as chaves 'max_error',
+            'rms_error', 'num_samples' (amostras comparadas) e 'num_nan'
+            (amostras sem resultado na tabela ou no controlador).
+        """
+        table = self.table
+        rng = np.random.default_rng(seed)
+        v_inputs = {f_input.name: rng.uniform(f_input.range[0],
+                                              f_input.range[1],
+                                              size=num_samples)
+                    for f_input in self.fis_system.inputs.values()}
+
+        exact = self.calc_exact(v_inputs)
+        approx = self.interpolate_outputs(v_inputs)
+
+        report = dict()
+        for num_output, name in enumerate(table.output_names):
+            valid = ~(np.isnan(exact[num_output]) |
+                      np.isnan(approx[num_output]))
+            error = np.abs(exact[num_output][valid] -
+                           approx[num_output][valid])
+
+            report[name] = {
+                'max_error': float(error.max()) if error.size else 0.0,
+                'rms_error': float(np.sqrt(np.mean(error ** 2)))
+                if error.size else 0.0,
+                'num_samples': int(np.count_nonzero(valid)),
+                'num_nan': int(num_samples - np.count_nonzero(valid))}
+
+        return report
+
+    def save(self, filename: Optional[str] = None) -> str:
+        """
+        Salva a tabela em um arquivo .npz, por padrão ao lado do arquivo
+        .fis.
+
+        Retorna
+        -------
+        str
+            Retorna o caminho do arquivo salvo.
+        """
+        table = self.table
+        if filename is None:
+            filename = self.get_table_filename()
+
+        arrays = {f'axis_{num_input}': axis
+                  for num_input, axis in enumerate(table.axes)}
+        with open(filename, 'wb') as file:
+            np.savez_compressed(file,
+                                input_names=np.array(table.input_names),
+                                output_names=np.array(table.output_names),
+                                values=table.values,
+                                fis_hash=np.array(table.fis_hash or ''),
+                                **arrays)
+
+        return filename
+
+    def load(self, filename: Optional[str] = None) -> LookupTable:
+        """
+        Carrega a tabela de um arquivo .npz, por padrão o arquivo ao lado do
+        arquivo .fis. A tabela precisa ter sido criada a partir do mesmo
+        arquivo .fis do controlador.
+        """
+        if filename is None:
+            filename = self.get_table_filename()
+
+        if not os.path.isfile(filename):
+            raise Exception(f"O arquivo {filename} não existe!")
+
+        with np.load(filename, allow_pickle=False) as data:
+            input_names = [str(name) for name in data['input_names']]
+            table = LookupTable(
+                input_names,
+                [data[f'axis_{num_input}']
+                 for num_input in range(len(input_names))],
+                [str(name) for name in data['output_names']],
+                data['values'],
+                str(data['fis_hash']) or None)
+
+        fis_hash = self.get_fis_hash()
+        if table.fis_hash is not None and fis_hash is not None and \
+                table.fis_hash != fis_hash:
+            raise Exception("A tabela não corresponde ao arquivo .fis!")
+
+        self.table = table
+
+        return self.table
@@ -6,31 +6,179 @@ date: July, 2020
 """
 import numpy as np
 from skfuzzy import control as ctrl
-from typing import Dict, List
+from skfuzzy.defuzzify import DefuzzifyError
+from typing import Dict, List, Optional, Union
 from continentalfuzzy.domain.Rule import Rule
 from continentalfuzzy.domain.System import System
 from continentalfuzzy.domain.MamdaniController import MamdaniController
+from continentalfuzzy.domain.definition.AggMethods import AggMethods
+from continentalfuzzy.domain.definition.Connections import Connections
+from continentalfuzzy.domain.definition.DefuzzMethods import DefuzzMethods
+from continentalfuzzy.domain.definition.ImpMethods import ImpMethods
+from continentalfuzzy.domain.mamdani.MamdaniCompiledRules import \
+    MamdaniCompiledRules
+from continentalfuzzy.domain.mamdani.UniverseResolution import \
+    UniverseResolution
 from continentalfuzzy.domain.variable.Input import Input
 from continentalfuzzy.domain.variable.Output import Output
+from continentalfuzzy.domain.definition.mamdani.CentroidModes import \
+    CentroidModes
 from continentalfuzzy.domain.definition.mamdani.MamdaniAndMethods import MamdaniAndMethods
 from continentalfuzzy.domain.definition.mamdani.MamdaniDefuzzMethods import MamdaniDefuzzMethods
 from continentalfuzzy.domain.definition.mamdani.MamdaniOrMethods import MamdaniOrMethods
+from continentalfuzzy.service.mamdani.CentroidDefuzzMethod import \
+    CentroidDefuzzMethod
+from continentalfuzzy.service.mamdani.LinearCentroidDefuzzMethod import \
+    LinearCentroidDefuzzMethod
+from continentalfuzzy.service.mamdani.MamdaniControlSystem import \
+    MamdaniControlSystem
+from continentalfuzzy.service.mamdani.RefinedDefuzzMethod import \
+    RefinedDefuzzMethod
+from continentalfuzzy.service.mamdani.ResultCache import ResultCache
+from continentalfuzzy.service.mamdani.SimulatorPool import SimulatorPool
+from continentalfuzzy.service.mamdani.UniverseService import UniverseService
 from continentalfuzzy.util.FuzzyUtil import FuzzyUtil
 
 
 class MamdaniControllerService:
     """
     Classe usada para criar um controlador fuzzy da biblioteca scikit-fuzzy.
+
+    O controlador também possui um motor vetorizado próprio (fuzzy_calc_native)
+    que calcula várias amostras de uma só vez a partir da mesma base de
+    regras. O controlador do scikit-fuzzy continua sendo a referência.
     """
 
+    # Quantidade máxima de valores (amostras x pontos do universo) de cada
+    # array intermediário do motor vetorizado
+    BATCH_CHUNK_ELEMENTS = 2 ** 22
+
+    # Quantidade de execuções do simulador em lote do scikit-fuzzy antes de
+    # descartar os resultados intermediários
+    BATCH_FLUSH_AFTER_RUN = 1
+
+    # Dicionário com os métodos de defuzzificação do motor vetorizado. Todos
+    # recebem o universo, as curvas das funções de pertinência usadas e os
+    # cortes, e calculam todas as amostras de uma só vez
+    DICT_DEFUZZ_METHODS = {
+        DefuzzMethods.centroid: CentroidDefuzzMethod.calculate_centroid_array,
+        DefuzzMethods.bisector: RefinedDefuzzMethod.calculate_bisector_array,
+        DefuzzMethods.mom: RefinedDefuzzMethod.calculate_mom_array,
+        DefuzzMethods.som: RefinedDefuzzMethod.calculate_som_array,
+        DefuzzMethods.lom: RefinedDefuzzMethod.calculate_lom_array}
+
     def __init__(self):
         """ Inicializador da classe FuzzyController"""
         self.__fuzzy_machine = MamdaniController()
+        self.__batch_simulator = None
+        self.__simulator_pool = None
+        self.__result_cache = ResultCache()
+        self.__universe_resolution = UniverseResolution()
+        self.__centroid_mode = CentroidModes.automatic
 
     @property
     def fuzzy_machine(self) -> MamdaniController:
         return self.__fuzzy_machine
 
+    @property
+    def universe_resolution(self) -> UniverseResolution:
+        """
+        Política de resolução dos universos das variáveis. Precisa ser
+        definida antes da criação do controlador.
+        """
+        return self.__universe_resolution
+
+    @universe_resolution.setter
+    def universe_resolution(self, value: UniverseResolution):
+        if not isinstance(value, UniverseResolution):
+            raise Exception("O valor não é uma instância da classe "
+                            "UniverseResolution!")
+
+        self.__universe_resolution = value
+
+    @property
+    def centroid_mode(self) -> CentroidModes:
+        """
+        Modo do centroide do motor vetorizado. No modo automatic o centroide
+        analítico (LinearCentroidDefuzzMethod) é usado nos consequentes com
+        todas as funções de pertinência triangulares ou trapezoidais, e o
+        centroide do universo amostrado nos demais.
+        """
+        return self.__centroid_mode
+
+    @centroid_mode.setter
+    def centroid_mode(self, value: CentroidModes):
+        if not isinstance(value, CentroidModes):
+            raise Exception("O valor não é uma instância da classe "
+                            "CentroidModes!")
+
+        self.__centroid_mode = value
+
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        """
+        Cache dos resultados do fuzzy_calc_single_value. Com None todos os
+        valores são calculados pelo simulador.
+        """
+        return self.__result_cache
+
+    @result_cache.setter
+    def result_cache(self, value: Optional[ResultCache]):
+        if value is not None and not isinstance(value, ResultCache):
+            raise Exception("O valor não é uma instância da classe "
+                            "ResultCache!")
+
+        self.__result_cache = value
+
+    @property
+    def simulator_pool(self) -> SimulatorPool:
+        """
+        Simuladores do scikit-fuzzy para o cálculo em várias threads, todos
+        criados a partir do controlador do fuzzy_machine.
+        """
+        if self.fuzzy_machine.controller is None:
+            raise Exception("O controlador não foi criado!")
+
+        if self.__simulator_pool is None:
+            self.__simulator_pool = SimulatorPool(
+                self.fuzzy_machine.controller)
+
+        return self.__simulator_pool
+
+    @property
+    def batch_simulator(self) -> ctrl.ControlSystemSimulation:
+        """
+        Simulador do scikit-fuzzy usado somente com arrays de entrada. É
+        separado do simulador das amostras únicas, pois o scikit-fuzzy
+        reinicia o simulador quando recebe um float depois de um array.
+        """
+        if self.__batch_simulator is None:
+            self.__batch_simulator = ctrl.ControlSystemSimulation(
+                self.create_batch_controller(),
+                flush_after_run=self.BATCH_FLUSH_AFTER_RUN)
+
+        return self.__batch_simulator
+
+    def create_batch_controller(self) -> ctrl.ControlSystem:
+        """
+        Cria o controlador do simulador em lote. Com arrays de entrada o
+        scikit-fuzzy falha nos termos dos consequentes que não aparecem em
+        nenhuma regra, então cada um desses termos recebe uma regra de peso
+        zero, que não altera o resultado.
+        """
+        rules = list(self.fuzzy_machine.rules)
+
+        used_terms = {id(c.term) for rule in rules for c in rule.consequent}
+        f_input = next(iter(self.fuzzy_machine.inputs.values()))
+        f_ant = next(iter(f_input.terms.values()))
+        for f_output in self.fuzzy_machine.outputs.values():
+            for f_term in f_output.terms.values():
+                if id(f_term) not in used_terms:
+                    rules.append(ctrl.Rule(antecedent=f_ant,
+                                           consequent=f_term % 0.0))
+
+        return MamdaniControlSystem(rules)
+
     def create_inputs_from_fis(self, fis_inputs: Dict[int, Input]):
         """
         Cria os antecedentes do controlador usando instâncias da classe
@@ -48,7 +196,8 @@ class MamdaniControllerService:
             f_name = f_input.name
 
             # Cria o universo do antecedente
-            f_universe = FuzzyUtil.create_universe(f_range, f_input.mfs)
+            f_universe = UniverseService.get_universe(
+                f_range, f_input.mfs, self.universe_resolution)
 
             # Cria o antecedente usando o scikit-fuzzy
             val_input = ctrl.Antecedent(universe=f_universe, label=f_name)
@@ -83,7 +232,9 @@ class MamdaniControllerService:
             f_name = f_output.name
 
             # Cria o universo do consequente
-            f_universe = FuzzyUtil.create_universe(f_range, f_output.mfs)
+            f_universe = UniverseService.get_universe(
+                f_range, f_output.mfs, self.universe_resolution,
+                is_output=True)
 
             # Cria o antecedente usando o scikit-fuzzy
             val_output = ctrl.Consequent(universe=f_universe,
@@ -116,48 +267,42 @@ class MamdaniControllerService:
         fis_rules : List[FISRule]
             Lista com os valores sendo instâncias da classe FISRule.
         """
+        and_func = self.fuzzy_machine.DICT_AND_METHODS.get(fis_and)
+        or_func = self.fuzzy_machine.DICT_OR_METHODS.get(fis_or)
+        inputs = self.fuzzy_machine.inputs
+        outputs = self.fuzzy_machine.outputs
+
         # Percorre todos os valores da lista das regras
+        rules = list()
         for f_rule in fis_rules:
-            f_con = f_rule.connection
+            connector = self.fuzzy_machine.DICT_CONNECTOR_OPERATORS.get(
+                f_rule.connection)
 
-            first_input = True
-            aux_inputs = ""
-            # Percorre todos os antecedentes da regra
+            # Compõe o antecedente com os operadores dos termos do
+            # scikit-fuzzy (&, | e ~)
+            f_ant = None
             for f_input in f_rule.inputs:
-                if first_input:
-                    first_input = False
-                else:
-                    aux_inputs += self.fuzzy_machine.DICT_CONNECTORS.get(f_con)
-
-                inp_name = f_input.name
-                mf_name = f_input.mf
+                f_term = inputs[f_input.name][f_input.mf]
 
                 # Verifica se o antecedente possui o operador NOT
                 if f_input.var_not:
-                    aux_inputs += f"(~self.fuzzy_machine.inputs['{inp_name}']" \
-                                  f"['{mf_name}'])"
-                else:
-                    aux_inputs += f"self.fuzzy_machine.inputs['{inp_name}']" \
-                                  f"['{mf_name}']"
+                    f_term = ~f_term
 
-            # Cria o antecedente
-            f_ant = (eval(aux_inputs))
+                f_ant = f_term if f_ant is None else connector(f_ant, f_term)
 
-            # Percorre todos os consequentes da regra
-            for f_output in f_rule.outputs:
-                out_name = f_output.name
-                mf_name = f_output.mf
-
-                # Cria o consequente
-                f_output_name = self.fuzzy_machine.outputs[out_name]
-                f_con = (f_output_name[mf_name] % f_rule.weight)
+            # Cria os consequentes
+            f_cons = [outputs[f_output.name][f_output.mf] % f_rule.weight
+                      for f_output in f_rule.outputs]
+            if len(f_cons) == 1:
+                f_cons = f_cons[0]
 
             # Cria a regra usando o scikit-fuzzy
-            self.fuzzy_machine.rules.append(
-                ctrl.Rule(antecedent=f_ant,
-                          consequent=f_con,
-                          and_func=self.fuzzy_machine.DICT_AND_METHODS.get(fis_and),
-                          or_func=self.fuzzy_machine.DICT_OR_METHODS.get(fis_or)))
+            rules.append(ctrl.Rule(antecedent=f_ant,
+                                   consequent=f_cons,
+                                   and_func=and_func,
+                                   or_func=or_func))
+
+        self.fuzzy_machine.rules.extend(rules)
 
     def create_from_fis_system(self, fis_system: System):
         """
@@ -172,6 +317,8 @@ class MamdaniControllerService:
             raise Exception(
                 "O valor não é uma instância da classe FISSystem!")
 
+        self.fuzzy_machine.fis_system = fis_system
+
         # Cria os antecedentes
         self.create_inputs_from_fis(fis_system.inputs)
 
@@ -185,14 +332,26 @@ class MamdaniControllerService:
                                    fis_system.rules)
 
         # Criar o controlador
-        self.fuzzy_machine.controller = ctrl.ControlSystem(self.fuzzy_machine.rules)
+        self.fuzzy_machine.controller = MamdaniControlSystem(
+            self.fuzzy_machine.rules)
 
-        # Criar o simulador
-        self.fuzzy_machine.simulator = ctrl.ControlSystemSimulation(self.fuzzy_machine.controller)
+        # Criar o simulador. O cache do scikit-fuzzy é desligado, pois os
+        # resultados ficam no result_cache
+        self.fuzzy_machine.simulator = ctrl.ControlSystemSimulation(
+            self.fuzzy_machine.controller, cache=False)
+        self.__batch_simulator = None
+        self.__simulator_pool = None
+        if self.__result_cache is not None:
+            self.__result_cache.clear()
+
+        # Compila as regras para o motor vetorizado
+        self.compile_rules(fis_system)
 
     def fuzzy_calc_single_value(self,
                                 dict_inputs: Dict[str, float],
-                                output: str):
+                                output: str,
+                                simulator: Optional[
+                                    ctrl.ControlSystemSimulation] = None):
         """
         Calcula um valor do consequente fuzzy, baseado no dicionário com os
         valores dos antecedentes.
@@ -204,11 +363,534 @@ class MamdaniControllerService:
             valores sendo números float.
 
         output : str
+
+        simulator : Optional[ctrl.ControlSystemSimulation]
+            Simulador usado no cálculo, por exemplo um simulador do
+            simulator_pool. Quando não informado é usado o simulador do
+            fuzzy_machine.
+        """
+        if simulator is None:
+            simulator = self.fuzzy_machine.simulator
+
+        cache = self.__result_cache
+        if cache is None:
+            outputs = self.compute_simulator(simulator, dict_inputs)
+        else:
+            key, dict_inputs = cache.quantize(dict_inputs)
+            outputs = cache.get(key)
+            if outputs is None:
+                outputs = self.compute_simulator(simulator, dict_inputs)
+                cache.put(key, outputs)
+
+        # Retorna o output selecionado
+        return outputs[output]
+
+    @staticmethod
+    def compute_simulator(simulator: ctrl.ControlSystemSimulation,
+                          dict_inputs: Dict[str, float]) -> Dict[str, float]:
+        """
+        Calcula os consequentes no simulador do scikit-fuzzy.
         """
         # Percorre o dicionário dos antecedesntes
         for name_input, value_input in dict_inputs.items():
-            self.fuzzy_machine.simulator.input[name_input] = value_input
-        self.fuzzy_machine.simulator.compute()
+            simulator.input[name_input] = value_input
+        simulator.compute()
 
-        # Retorna o output selecionado
-        return self.fuzzy_machine.simulator.output[output]
+        return dict(simulator.output)
+
+    def fuzzy_calc_batch(self,
+                         dict_inputs: Dict[str, np.ndarray],
+                         outputs: Union[str, List[str]]):
+        """
+        Calcula os consequentes fuzzy para arrays de amostras, passando os
+        arrays inteiros para o simulador do scikit-fuzzy em uma única
+        chamada de compute.
+
+        O scikit-fuzzy interrompe o cálculo do array inteiro quando uma das
+        amostras não ativa nenhuma regra. Nesse caso as amostras são
+        calculadas uma a uma e as amostras sem resultado recebem nan.
+
+        Parâmetros
+        ----------
+        dict_inputs : Dict[str, np.ndarray]
+            Dicionário com as chaves sendo o nome dos antecedentes e os
+            valores sendo arrays com o mesmo formato.
+
+        outputs : Union[str, List[str]]
+            Nome do consequente ou lista com os nomes dos consequentes.
+
+        Retorna
+        -------
+        Union[np.ndarray, Dict[str, np.ndarray]]
+            Retorna um array com o formato dos antecedentes quando outputs é
+            uma string, ou um dicionário com um array por consequente.
+        """
+        if self.fuzzy_machine.controller is None:
+            raise Exception("O controlador não foi criado!")
+
+        output_names = [outputs] if isinstance(outputs, str) else \
+            list(outputs)
+        for output in output_names:
+            if output not in self.fuzzy_machine.outputs:
+                raise Exception(f"O consequente {output} não existe!")
+
+        dict_inputs = self.get_batch_inputs(dict_inputs)
+        shape = next(iter(dict_inputs.values())).shape
+        dict_inputs = {name: np.ravel(value)
+                       for name, value in dict_inputs.items()}
+
+        try:
+            simulator = self.batch_simulator
+            simulator.inputs(dict_inputs)
+            simulator.compute()
+            result = {output: np.array(simulator.output[output],
+                                       dtype=np.float64)
+                      for output in output_names}
+
+        except (DefuzzifyError, KeyError):
+            result = self.calc_batch_per_sample(dict_inputs, output_names)
+
+        result = {output: value.reshape(shape)
+                  for output, value in result.items()}
+
+        if isinstance(outputs, str):
+            return result[outputs]
+
+        return result
+
+    def calc_batch_per_sample(self,
+                              dict_inputs: Dict[str, np.ndarray],
+                              output_names: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Calcula as amostras uma a uma com o simulador das amostras únicas.
+        As amostras sem resultado recebem nan.
+        """
+        simulator = self.fuzzy_machine.simulator
+        num_samples = next(iter(dict_inputs.values())).shape[0]
+        result = {output: np.full(num_samples, np.nan, dtype=np.float64)
+                  for output in output_names}
+
+        for num in range(num_samples):
+            for name_input, value_input in dict_inputs.items():
+                simulator.input[name_input] = float(value_input[num])
+            simulator.compute()
+
+            for output in output_names:
+                if output in simulator.output:
+                    result[output][num] = simulator.output[output]
+
+        return result
+
+    def compile_rules(self, fis_system: System):
+        """
+        Compila a base de regras em arrays densos para o motor vetorizado.
+        As curvas de pertinência são amostradas nos mesmos universos usados
+        pelo scikit-fuzzy.
+
+        Parâmetros
+        ----------
+        fis_system : System
+            Instância da classe System.
+        """
+        f_inputs = list(fis_system.inputs.values())
+        f_outputs = list(fis_system.outputs.values())
+        input_names = [f_input.name for f_input in f_inputs]
+        output_names = [f_output.name for f_output in f_outputs]
+        num_rules = len(fis_system.rules)
+
+        input_universes = list()
+        input_mfs = list()
+        dict_mf_index = dict()
+        for f_input in f_inputs:
+            f_universe = UniverseService.get_universe(
+                f_input.range, f_input.mfs, self.universe_resolution)
+            input_universes.append(f_universe)
+            input_mfs.append(np.array(
+                [FuzzyUtil.membership_function(mf=f_mf, univ=f_universe)
+                 for f_mf in f_input.mfs.values()], dtype=np.float64))
+            for mf_index, f_mf in enumerate(f_input.mfs.values()):
+                dict_mf_index[(f_input.name, f_mf.name)] = mf_index
+
+        output_universes = list()
+        output_mfs = list()
+        output_trapezoids = list()
+        dict_output_mf_index = dict()
+        for f_output in f_outputs:
+            output_trapezoids.append(
+                LinearCentroidDefuzzMethod.get_trapezoids(f_output.mfs))
+            f_universe = UniverseService.get_universe(
+                f_output.range, f_output.mfs, self.universe_resolution,
+                is_output=True)
+            output_universes.append(f_universe)
+            output_mfs.append(np.array(
+                [FuzzyUtil.membership_function(mf=f_mf, univ=f_universe)
+                 for f_mf in f_output.mfs.values()], dtype=np.float64))
+            for mf_index, f_mf in enumerate(f_output.mfs.values()):
+                dict_output_mf_index[(f_output.name, f_mf.name)] = mf_index
+
+        # Termos (antecedente, função de pertinência, NOT) distintos usados
+        # pelas regras, para que cada grau seja calculado uma única vez
+        terms = list()
+        dict_terms = dict()
+        term_index = np.full((num_rules, len(input_names)),
+                             MamdaniCompiledRules.DONT_CARE, dtype=np.intp)
+        or_mask = np.zeros(num_rules, dtype=bool)
+        weights = np.zeros(num_rules, dtype=np.float64)
+        output_mf_index = np.full((len(output_names), num_rules),
+                                  MamdaniCompiledRules.DONT_CARE,
+                                  dtype=np.intp)
+
+        for num_rule, f_rule in enumerate(fis_system.rules):
+            for f_input in f_rule.inputs:
+                num_input = input_names.index(f_input.name)
+                term = (num_input,
+                        dict_mf_index[(f_input.name, f_input.mf)],
+                        bool(f_input.var_not))
+                if term not in dict_terms:
+                    dict_terms[term] = len(terms)
+                    terms.append(term)
+                term_index[num_rule, num_input] = dict_terms[term]
+
+            for f_output in f_rule.outputs:
+                output_mf_index[output_names.index(f_output.name),
+                                num_rule] = dict_output_mf_index[
+                    (f_output.name, f_output.mf)]
+
+            or_mask[num_rule] = f_rule.connection == Connections.OR
+            weights[num_rule] = f_rule.weight
+
+        mf_terms = sorted({(num_input, num_mf) for num_input, num_mf, _
+                           in terms})
+
+        self.fuzzy_machine.compiled_rules = MamdaniCompiledRules(
+            input_names,
+            input_universes,
+            input_mfs,
+            np.array(mf_terms, dtype=np.intp).reshape((-1, 2)),
+            np.array([mf_terms.index((num_input, num_mf))
+                      for num_input, num_mf, _ in terms], dtype=np.intp),
+            np.array([var_not for _, _, var_not in terms], dtype=bool),
+            term_index,
+            or_mask,
+            weights,
+            output_names,
+            output_universes,
+            output_mfs,
+            output_mf_index,
+            output_trapezoids)
+
+    @classmethod
+    def valid_native_methods(cls, fis_system: System):
+        """
+        Verifica se os métodos do sistema são os implementados pelo motor
+        vetorizado, os mesmos usados pelo controlador do scikit-fuzzy.
+        """
+        if fis_system.and_method not in MamdaniController.DICT_AND_METHODS:
+            raise Exception("Método AND não implementado!")
+
+        if fis_system.or_method not in MamdaniController.DICT_OR_METHODS:
+            raise Exception("Método OR não implementado!")
+
+        if fis_system.imp_method != ImpMethods.min:
+            raise Exception("Método de implicação não implementado!")
+
+        if fis_system.agg_method != AggMethods.max:
+            raise Exception("Método de agregação não implementado!")
+
+        if fis_system.defuzz_method not in cls.DICT_DEFUZZ_METHODS:
+            raise Exception("Método de defuzzificação não implementado!")
+
+    def get_batch_inputs(self,
+                         v_inputs: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Converte os valores dos antecedentes em numpy arrays float64 com o
+        mesmo formato.
+
+        Parâmetros
+        ----------
+        v_inputs : Dict[str, np.ndarray]
+            Dicionário com as chaves sendo o nome dos antecedentes e os
+            valores sendo arrays com as amostras.
+
+        Retorna
+        -------
+        Dict[str, np.ndarray]
+            Retorna um dicionário com os arrays convertidos.
+        """
+        for f_input in self.fuzzy_machine.compiled_rules.input_names:
+            if f_input not in v_inputs:
+                raise Exception(f"O antecedente {f_input} não foi informado!")
+
+        names = list(v_inputs.keys())
+        try:
+            arrays = np.broadcast_arrays(
+                *[np.asarray(v_inputs[name], dtype=np.float64)
+                  for name in names])
+        except ValueError:
+            raise Exception("Os arrays dos antecedentes não possuem o mesmo "
+                            "formato!")
+
+        return dict(zip(names, arrays))
+
+    def get_batch_matrix(self, v_inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Monta o array antecedente x amostra na ordem dos antecedentes da base
+        de regras compilada.
+        """
+        compiled = self.fuzzy_machine.compiled_rules
+        return np.array([np.ravel(v_inputs[name]) for name in
+                         compiled.input_names],
+                        dtype=np.float64).reshape((compiled.num_inputs, -1))
+
+    def calc_term_degrees_batch(self, x_array: np.ndarray) -> np.ndarray:
+        """
+        Fuzzificação em lote: interpola as curvas de pertinência amostradas
+        nos valores dos antecedentes, como o scikit-fuzzy. Os valores fora do
+        universo são limitados às suas bordas.
+
+        Parâmetros
+        ----------
+        x_array : np.ndarray
+            Array antecedente x amostra com os valores dos antecedentes.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array termo x amostra.
+        """
+        compiled = self.fuzzy_machine.compiled_rules
+
+        mf_degrees = np.empty((compiled.mf_terms.shape[0], x_array.shape[1]),
+                              dtype=np.float64)
+        for num, (num_input, num_mf) in enumerate(compiled.mf_terms.tolist()):
+            mf_degrees[num] = np.interp(x_array[num_input],
+                                        compiled.input_universes[num_input],
+                                        compiled.input_mfs[num_input][num_mf])
+
+        term_degrees = mf_degrees[compiled.term_mf]
+        term_degrees[compiled.term_not] = 1 - term_degrees[compiled.term_not]
+
+        return term_degrees
+
+    def calc_rule_firing_compiled(self, x_array: np.ndarray) -> np.ndarray:
+        """
+        Calcula a ativação de todas as regras (AND min, OR max e peso da
+        regra).
+
+        Parâmetros
+        ----------
+        x_array : np.ndarray
+            Array antecedente x amostra com os valores dos antecedentes.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array regra x amostra.
+        """
+        compiled = self.fuzzy_machine.compiled_rules
+        term_degrees = self.calc_term_degrees_batch(x_array)
+
+        # Busca o grau de cada antecedente das regras na tabela de termos
+        term_index = compiled.term_index
+        care_mask = term_index != MamdaniCompiledRules.DONT_CARE
+        rule_degrees = term_degrees[np.where(care_mask, term_index, 0)]
+        care_mask = care_mask[..., np.newaxis]
+
+        firing = np.zeros((compiled.num_rules, x_array.shape[1]),
+                          dtype=np.float64)
+
+        and_rules = ~compiled.or_mask
+        if and_rules.any():
+            firing[and_rules] = np.where(care_mask[and_rules],
+                                         rule_degrees[and_rules],
+                                         1.0).min(axis=1)
+
+        or_rules = compiled.or_mask
+        if or_rules.any():
+            firing[or_rules] = np.where(care_mask[or_rules],
+                                        rule_degrees[or_rules],
+                                        0.0).max(axis=1)
+
+        return firing * compiled.weights[:, np.newaxis]
+
+    def calc_output_cuts_compiled(self,
+                                  firing: np.ndarray,
+                                  num_output: int = 0):
+        """
+        Acumula (max) a ativação das regras em cada função de pertinência do
+        consequente. As funções de pertinência que não aparecem em nenhuma
+        regra são descartadas, como no scikit-fuzzy.
+
+        Parâmetros
+        ----------
+        firing : np.ndarray
+            Array regra x amostra com a ativação das regras.
+
+        num_output : int
+            Posição do consequente em output_names.
+
+        Retorna
+        -------
+        Tuple[List[int], np.ndarray]
+            Retorna a lista com o índice de cada função de pertinência usada
+            e o array função de pertinência x amostra com o corte de cada
+            uma.
+        """
+        compiled = self.fuzzy_machine.compiled_rules
+        mf_index = compiled.output_mf_index[num_output]
+
+        used_mfs = list()
+        cuts = list()
+        for num_mf in range(compiled.output_mfs[num_output].shape[0]):
+            rules = mf_index == num_mf
+            if rules.any():
+                used_mfs.append(num_mf)
+                cuts.append(firing[rules].max(axis=0))
+
+        if not cuts:
+            return used_mfs, np.zeros((0, firing.shape[1]), dtype=np.float64)
+
+        return used_mfs, np.array(cuts, dtype=np.float64)
+
+    def use_analytic_centroid(self,
+                              num_output: int = 0,
+                              centroid_mode: Optional[CentroidModes] = None) \
+            -> bool:
+        """
+        Verifica se o consequente usa o centroide analítico, com o
+        centroid_mode informado ou, quando não informado, o do controlador.
+        """
+        if centroid_mode is None:
+            centroid_mode = self.centroid_mode
+
+        fis_system = self.fuzzy_machine.fis_system
+        if fis_system is not None and \
+                fis_system.defuzz_method != DefuzzMethods.centroid:
+            return False
+
+        trapezoids = self.fuzzy_machine.compiled_rules.output_trapezoids
+        available = num_output < len(trapezoids) and \
+            trapezoids[num_output] is not None
+
+        if centroid_mode == CentroidModes.analytic and not available:
+            raise Exception("O centroide analítico exige funções de "
+                            "pertinência triangulares ou trapezoidais!")
+
+        return available and centroid_mode != CentroidModes.sampled
+
+    def calc_output_compiled(self,
+                             x_array: np.ndarray,
+                             num_output: int = 0,
+                             centroid_mode: Optional[CentroidModes] = None) \
+            -> np.ndarray:
+        """
+        Calcula um consequente para todas as amostras, em blocos de no máximo
+        BATCH_CHUNK_ELEMENTS valores.
+
+        Parâmetros
+        ----------
+        x_array : np.ndarray
+            Array antecedente x amostra com os valores dos antecedentes.
+
+        num_output : int
+            Posição do consequente em output_names.
+
+        centroid_mode : Optional[CentroidModes]
+            Modo do centroide deste cálculo. Quando não informado é usado o
+            centroid_mode do controlador.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array com o resultado de cada amostra. Quando nenhuma
+            regra ativa o consequente o centroide e o bissetor são nan, e o
+            mom, som e lom seguem o scikit-fuzzy (RefinedDefuzzMethod).
+        """
+        compiled = self.fuzzy_machine.compiled_rules
+        universe = compiled.output_universes[num_output]
+        analytic = self.use_analytic_centroid(num_output, centroid_mode)
+
+        fis_system = self.fuzzy_machine.fis_system
+        defuzz_method = self.DICT_DEFUZZ_METHODS[
+            DefuzzMethods.centroid if fis_system is None
+            else fis_system.defuzz_method]
+
+        if analytic:
+            trapezoids = compiled.output_trapezoids[num_output]
+            u_range = (universe[0], universe[-1])
+            # Pontos de quebra por amostra: fixos mais um por lado e corte
+            num_points = 4 * trapezoids.shape[0] + 2 + \
+                (2 * trapezoids.shape[0]) ** 2
+            chunk = max(1, self.BATCH_CHUNK_ELEMENTS //
+                        (num_points * trapezoids.shape[0]))
+        else:
+            chunk = max(1, self.BATCH_CHUNK_ELEMENTS // universe.shape[0])
+
+        result = np.empty(x_array.shape[1], dtype=np.float64)
+        for start in range(0, x_array.shape[1], chunk):
+            firing = self.calc_rule_firing_compiled(
+                x_array[:, start:start + chunk])
+            used_mfs, cuts = self.calc_output_cuts_compiled(firing,
+                                                            num_output)
+            if analytic:
+                result[start:start + chunk] = \
+                    LinearCentroidDefuzzMethod.calculate_centroid_array(
+                        u_range, trapezoids[used_mfs], cuts)
+            else:
+                result[start:start + chunk] = defuzz_method(
+                    universe, compiled.output_mfs[num_output][used_mfs], cuts)
+
+        return result
+
+    def fuzzy_calc_native(self,
+                          v_inputs: Dict[str, Union[float, np.ndarray]],
+                          output: str,
+                          centroid_mode: Optional[CentroidModes] = None) \
+            -> Union[float, np.ndarray]:
+        """
+        Calcula o consequente fuzzy com o motor vetorizado, sem usar o
+        simulador do scikit-fuzzy.
+
+        Parâmetros
+        ----------
+        v_inputs : Dict[str, Union[float, np.ndarray]]
+            Dicionário com as chaves sendo o nome dos antecedentes e os
+            valores sendo números float ou arrays com o mesmo formato.
+
+        output : str
+            Nome do consequente.
+
+        centroid_mode : Optional[CentroidModes]
+            Modo do centroide deste cálculo, por exemplo CentroidModes.sampled
+            para o mesmo centroide do simulador do scikit-fuzzy. Quando não
+            informado é usado o centroid_mode do controlador.
+
+        Retorna
+        -------
+        Union[float, np.ndarray]
+            Retorna um array com o mesmo formato dos antecedentes (ou um
+            float). Nas amostras em que nenhuma regra ativa o consequente o
+            centroide e o bissetor são nan, onde o simulador do scikit-fuzzy
+            não calcula o consequente, e o mom, som e lom são a média, o
+            primeiro e o último ponto do universo, como no scikit-fuzzy.
+        """
+        compiled = self.fuzzy_machine.compiled_rules
+        if compiled is None:
+            raise Exception("O controlador não foi criado!")
+
+        if output not in compiled.output_names:
+            raise Exception(f"O consequente {output} não existe!")
+
+        self.valid_native_methods(self.fuzzy_machine.fis_system)
+
+        v_inputs = self.get_batch_inputs(v_inputs)
+        shape = next(iter(v_inputs.values())).shape
+        result = self.calc_output_compiled(
+            self.get_batch_matrix(v_inputs),
+            compiled.output_names.index(output),
+            centroid_mode).reshape(shape)
+
+        if result.ndim == 0:
+            return float(result)
+
+        return result
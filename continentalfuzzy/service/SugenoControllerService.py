@@ -5,10 +5,12 @@ email: rmodena@unisinos.br
 date: July, 2020
 """
 import numpy as np
-from typing import Optional
+from typing import Dict, List, Optional
 from continentalfuzzy.domain.Rule import Rule
 from continentalfuzzy.domain.SugenoController import SugenoController
 from continentalfuzzy.domain.sugeno.SugenoRule import SugenoRule
+from continentalfuzzy.domain.sugeno.SugenoCompiledRules import \
+    SugenoCompiledRules
 from continentalfuzzy.domain.System import System
 from continentalfuzzy.domain.definition.Functions import Functions
 from continentalfuzzy.domain.definition.AndMethods import AndMethods
@@ -21,6 +23,16 @@ from continentalfuzzy.domain.sugeno.rule_variable.SugenoRuleOutput import \
     SugenoRuleOutput
 from continentalfuzzy.domain.sugeno.variable.SugenoInput import SugenoInput
 from continentalfuzzy.domain.sugeno.variable.SugenoOutput import SugenoOutput
+from continentalfuzzy.service.sugeno.evaluators.Gauss2MFEvaluator import \
+    Gauss2MFEvaluator
+from continentalfuzzy.service.sugeno.evaluators.GaussMFEvaluator import \
+    GaussMFEvaluator
+from continentalfuzzy.service.sugeno.evaluators.SugenoScalarEvaluator import \
+    SugenoScalarEvaluator
+from continentalfuzzy.service.sugeno.evaluators.TrapMFEvaluator import \
+    TrapMFEvaluator
+from continentalfuzzy.service.sugeno.evaluators.TriMFEvaluator import \
+    TriMFEvaluator
 from continentalfuzzy.service.sugeno.membership_functions.GaussMembershipFunction import \
     GaussMembershipFunction
 from continentalfuzzy.service.sugeno.membership_functions.GaussTwoMembershipFunction import \
@@ -41,10 +53,60 @@ from continentalfuzzy.service.sugeno.operators.ProdAndMethod import \
 
 
 class SugenoControllerService:
+    # Dicionário com as versões vetorizadas das funções de pertinência
+    DICT_ARRAY_FUNCTIONS = {
+        TriangularMembershipFunction.calculate_trimf:
+            TriangularMembershipFunction.calculate_trimf_array,
+        TrapezoidalMembershipFunction.calculate_trapmf:
+            TrapezoidalMembershipFunction.calculate_trapmf_array,
+        GaussMembershipFunction.calculate_gaussmf:
+            GaussMembershipFunction.calculate_gaussmf_array,
+        GaussTwoMembershipFunction.calculate_gauss2mf:
+            GaussTwoMembershipFunction.calculate_gauss2mf_array}
+
+    # Dicionário com os avaliadores pré-validados das funções de pertinência
+    # dos antecedentes
+    DICT_MF_EVALUATORS = {
+        Functions.trimf: TriMFEvaluator,
+        Functions.trapmf: TrapMFEvaluator,
+        Functions.gaussmf: GaussMFEvaluator,
+        Functions.gauss2mf: Gauss2MFEvaluator}
+
+    # Dicionário com os métodos AND aplicados aos graus já calculados
+    DICT_AND_DEGREES_METHODS = {
+        AndMethods.min: MinAndMethod.calculate_min_and_degrees,
+        AndMethods.prod: ProdAndMethod.calculate_prod_and_degrees}
+
+    # Dicionário com os métodos OR aplicados aos graus já calculados
+    DICT_OR_DEGREES_METHODS = {
+        OrMethods.max: MaxOrMethod.calculate_max_or_degrees,
+        OrMethods.probor: ProborOrMethod.calculate_probor_or_degrees}
+
+    # Dicionário com as versões vetorizadas dos métodos AND
+    DICT_AND_ARRAY_METHODS = {
+        AndMethods.min: MinAndMethod.calculate_min_and_array,
+        AndMethods.prod: ProdAndMethod.calculate_prod_and_array}
+
+    # Dicionário com as versões vetorizadas dos métodos OR
+    DICT_OR_ARRAY_METHODS = {
+        OrMethods.max: MaxOrMethod.calculate_max_or_array,
+        OrMethods.probor: ProborOrMethod.calculate_probor_or_array}
+
+    # Quantidade máxima de amostras avaliadas de uma só vez pelo cálculo em
+    # lote
+    BATCH_CHUNK_SIZE = 65536
+
+    # Fração máxima de pares (amostra, regra) disparados para que o cálculo
+    # em lote use somente os pares compactados
+    SPARSE_DENSITY = 0.25
+
     def __init__(self,
                  sugeno_controller: Optional[SugenoController] = None):
         """ Inicializador da classe SugenoControllerService"""
         self.__sugeno_controller = SugenoController()
+        self.__scalar_evaluators = dict()
+        self.__firing_epsilon = 0.0
+        self.__activation = None
 
         if sugeno_controller is not None:
             self.__sugeno_controller = sugeno_controller
@@ -53,6 +115,67 @@ class SugenoControllerService:
     def sugeno_controller(self):
         return self.__sugeno_controller
 
+    @property
+    def firing_epsilon(self) -> float:
+        """
+        Limite do disparo das regras no cálculo em lote. Os pares (amostra,
+        regra) com disparo menor ou igual a este valor são descartados. O
+        valor 0 descarta somente as regras que não disparam e mantém o
+        resultado exato; valores maiores descartam as caudas das funções
+        gaussianas.
+        """
+        return self.__firing_epsilon
+
+    @firing_epsilon.setter
+    def firing_epsilon(self, p_firing_epsilon: float):
+        try:
+            p_firing_epsilon = float(p_firing_epsilon)
+        except Exception:
+            raise Exception("O limite de disparo não é do tipo float!")
+
+        if not 0 <= p_firing_epsilon < 1:
+            raise Exception("O limite de disparo precisa estar entre 0 e 1!")
+
+        self.__firing_epsilon = p_firing_epsilon
+
+    @property
+    def scalar_evaluator(self) -> SugenoScalarEvaluator:
+        """
+        Avaliador Sugeno de uma única amostra do primeiro consequente.
+        """
+        return self.get_scalar_evaluator(0)
+
+    def get_scalar_evaluator(self, num_output: int) -> SugenoScalarEvaluator:
+        """
+        Avaliador Sugeno de uma única amostra do consequente na posição
+        num_output, criado a partir da base de regras compilada na primeira
+        chamada.
+        """
+        if num_output not in self.__scalar_evaluators:
+            fis_system = self.sugeno_controller.fis_system
+            self.__scalar_evaluators[num_output] = SugenoScalarEvaluator(
+                self.sugeno_controller.compiled_rules,
+                fis_system.and_method,
+                fis_system.or_method,
+                fis_system.defuzz_method,
+                num_output)
+
+        return self.__scalar_evaluators[num_output]
+
+    def get_num_output(self, output: Optional[str] = None) -> int:
+        """
+        Posição do consequente em output_names. Sem o nome é usado o primeiro
+        consequente.
+        """
+        if output is None:
+            return 0
+
+        output_names = self.sugeno_controller.compiled_rules.output_names
+        if output not in output_names:
+            raise Exception(f"O consequente {output} não existe!")
+
+        return output_names.index(output)
+
     def get_connection(self, p_rule: Rule):
         if p_rule.connection == Connections.AND:
             if self.sugeno_controller.fis_system.and_method == AndMethods.min:
@@ -108,6 +231,17 @@ class SugenoControllerService:
             return {'func': LinearMembershipFunction.calculate_linear,
                     'params': dict_params}
 
+    def get_mf_evaluator(self, p_membershipfunction):
+        """
+        Cria o avaliador pré-validado da função de pertinência, ou retorna
+        None quando a função não possui avaliador.
+        """
+        evaluator = self.DICT_MF_EVALUATORS.get(p_membershipfunction.function)
+        if evaluator is None:
+            return None
+
+        return evaluator(p_membershipfunction)
+
     def create_from_fis_system(self, fis_system: System):
         self.sugeno_controller.fis_system = fis_system
 
@@ -157,6 +291,184 @@ class SugenoControllerService:
 
             self.sugeno_controller.add_rule(sugeno_rule)
 
+        # Compila as regras
+        self.compile_rules()
+
+    def compile_rules(self):
+        """
+        Compila as regras do controlador em arrays densos, usados pelo
+        cálculo em lote.
+        """
+        fis_system = self.sugeno_controller.fis_system
+        f_inputs = list(fis_system.inputs.values())
+        num_rules = len(fis_system.rules)
+        num_inputs = len(f_inputs)
+
+        input_names = [f_input.name for f_input in f_inputs]
+        output_names = [f_output.name for f_output in
+                        fis_system.outputs.values()]
+        num_outputs = len(output_names)
+
+        # Funções de pertinência vetorizadas de cada antecedente
+        input_mfs = list()
+        dict_mf_index = dict()
+        for f_input in f_inputs:
+            mfs = list()
+            for mf_index, f_mf in enumerate(f_input.mfs.values()):
+                mf_function = self.sugeno_controller.inputs[
+                    f_input.name].mfs[f_mf.name]
+                mfs.append({'func': mf_function['func'],
+                            'array_func': self.DICT_ARRAY_FUNCTIONS.get(
+                                mf_function['func']),
+                            'evaluator': self.get_mf_evaluator(f_mf),
+                            'params': mf_function['params']})
+                dict_mf_index[(f_input.name, f_mf.name)] = mf_index
+            input_mfs.append(mfs)
+
+        mf_index = np.full((num_rules, num_inputs),
+                           SugenoCompiledRules.DONT_CARE,
+                           dtype=np.intp)
+        not_mask = np.zeros((num_rules, num_inputs), dtype=bool)
+        or_mask = np.zeros(num_rules, dtype=bool)
+        weights = np.zeros(num_rules, dtype=np.float64)
+        output_coefficients = np.zeros((num_outputs, num_rules,
+                                        num_inputs + 1), dtype=np.float64)
+        output_mask = np.zeros((num_outputs, num_rules), dtype=bool)
+
+        for num_rule, rule in enumerate(fis_system.rules):
+            for i_rule in rule.inputs:
+                num_input = input_names.index(i_rule.name)
+                mf_index[num_rule, num_input] = dict_mf_index[
+                    (i_rule.name, i_rule.mf)]
+                not_mask[num_rule, num_input] = i_rule.var_not
+
+            or_mask[num_rule] = rule.connection == Connections.OR
+            weights[num_rule] = rule.weight
+
+            for r_output in self.sugeno_controller.rules[num_rule].outputs:
+                num_output = output_names.index(r_output.name)
+                coefficients = output_coefficients[num_output, num_rule]
+                for num_input, name in enumerate(input_names):
+                    coefficients[num_input] = r_output.params.get(name, 0)
+                coefficients[num_inputs] = r_output.params['__constant__']
+                output_mask[num_output, num_rule] = True
+
+        # Termos (antecedente, função de pertinência, NOT) distintos usados
+        # pelas regras, para que cada grau seja calculado uma única vez
+        care_mask = mf_index != SugenoCompiledRules.DONT_CARE
+        terms = sorted({(int(num_input), int(mf_index[num_rule, num_input]),
+                         bool(not_mask[num_rule, num_input]))
+                        for num_rule, num_input in zip(*np.nonzero(care_mask))})
+        mf_terms = sorted({(num_input, num_mf)
+                           for num_input, num_mf, _ in terms})
+
+        term_index = np.full((num_rules, num_inputs),
+                             SugenoCompiledRules.DONT_CARE,
+                             dtype=np.intp)
+        for num_rule, num_input in zip(*np.nonzero(care_mask)):
+            term_index[num_rule, num_input] = terms.index(
+                (int(num_input), int(mf_index[num_rule, num_input]),
+                 bool(not_mask[num_rule, num_input])))
+
+        self.__scalar_evaluators = dict()
+        self.sugeno_controller.compiled_rules = SugenoCompiledRules(
+            input_names,
+            input_mfs,
+            mf_index,
+            not_mask,
+            or_mask,
+            weights,
+            None,
+            np.array(mf_terms, dtype=np.intp).reshape((-1, 2)),
+            np.array([mf_terms.index((num_input, num_mf))
+                      for num_input, num_mf, _ in terms], dtype=np.intp),
+            np.array([var_not for _, _, var_not in terms], dtype=bool),
+            term_index,
+            output_names,
+            output_coefficients,
+            output_mask)
+
+    def get_mf_evaluations_report(self) -> Dict[str, int]:
+        """
+        Informa quantas avaliações de funções de pertinência são feitas por
+        amostra com e sem a fuzzificação compartilhada.
+
+        Retorna
+        -------
+        Dict[str, int]
+            Retorna um dicionário com as chaves 'per_rule' (uma avaliação por
+            antecedente de cada regra), 'shared' (uma avaliação por par
+            antecedente e função de pertinência distinto) e 'saved'.
+        """
+        compiled = self.sugeno_controller.compiled_rules
+        return {'per_rule': compiled.num_rule_antecedents,
+                'shared': compiled.num_mf_evaluations,
+                'saved': compiled.num_mf_evaluations_saved}
+
+    def calc_term_degrees(self, v_inputs: Dict[str, float]) -> List[float]:
+        """
+        Fuzzificação compartilhada: calcula o grau de cada termo
+        (antecedente, função de pertinência, NOT) distinto uma única vez.
+
+        Parâmetros
+        ----------
+        v_inputs : Dict[str, float]
+            Dicionário com as chaves sendo o nome dos antecedentes e os
+            valores sendo números float.
+
+        Retorna
+        -------
+        List[float]
+            Retorna uma lista com o grau de cada termo, na ordem dos termos
+            da base de regras compilada.
+        """
+        compiled = self.sugeno_controller.compiled_rules
+
+        mf_degrees = list()
+        for num_input, num_mf in compiled.mf_terms.tolist():
+            mf_degrees.append(compiled.input_mfs[num_input][num_mf][
+                'evaluator'](v_inputs[compiled.input_names[num_input]]))
+
+        term_degrees = list()
+        for num_mf, var_not in zip(compiled.term_mf.tolist(),
+                                   compiled.term_not.tolist()):
+            if var_not:
+                term_degrees.append(NotMethod.calculate_not(mf_degrees[num_mf]))
+            else:
+                term_degrees.append(mf_degrees[num_mf])
+
+        return term_degrees
+
+    def calc_term_degrees_batch(self, x_array: np.ndarray) -> np.ndarray:
+        """
+        Fuzzificação compartilhada em lote: calcula o grau de cada termo
+        distinto uma única vez para todas as amostras.
+
+        Parâmetros
+        ----------
+        x_array : np.ndarray
+            Array antecedente x amostra com os valores dos antecedentes.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array termo x amostra.
+        """
+        compiled = self.sugeno_controller.compiled_rules
+        x_array = np.ascontiguousarray(x_array, dtype=np.float64)
+
+        mf_degrees = np.empty((compiled.num_mf_evaluations, x_array.shape[1]),
+                              dtype=np.float64)
+        for num, (num_input, num_mf) in enumerate(compiled.mf_terms.tolist()):
+            compiled.input_mfs[num_input][num_mf]['evaluator'].calculate_array(
+                x_array[num_input], mf_degrees[num])
+
+        term_degrees = mf_degrees[compiled.term_mf]
+        term_degrees[compiled.term_not] = NotMethod.calculate_not(
+            term_degrees[compiled.term_not])
+
+        return term_degrees
+
     def calc_rule_weights(self):
         weights_list = list()
 
@@ -165,55 +477,491 @@ class SugenoControllerService:
 
         return weights_list
 
-    def calc_rule_output_level(self, v_inputs):
+    def calc_rule_output_level(self, v_inputs, num_output: int = 0):
+        compiled = self.sugeno_controller.compiled_rules
+        if compiled.constant_consequents:
+            return compiled.output_coefficients[num_output, :, -1].copy()
+
+        # As regras sem este consequente recebem 0, e não participam da soma
+        # pela output_mask
+        name = compiled.output_names[num_output]
         list_results = list()
         for rule in self.sugeno_controller.rules:
-            r_output = rule.outputs[0]
-            list_results.append(
-                LinearMembershipFunction.calculate_linear(r_output.params,
-                                                          v_inputs))
+            r_output = next((r_output for r_output in rule.outputs
+                             if r_output.name == name), None)
+            if r_output is None:
+                list_results.append(0.0)
+            else:
+                list_results.append(
+                    LinearMembershipFunction.calculate_linear(r_output.params,
+                                                              v_inputs))
 
         return np.array(list_results)
 
     def calc_rule_firing(self, v_inputs):
+        compiled = self.sugeno_controller.compiled_rules
+        fis_system = self.sugeno_controller.fis_system
+        and_method = self.DICT_AND_DEGREES_METHODS.get(fis_system.and_method)
+        or_method = self.DICT_OR_DEGREES_METHODS.get(fis_system.or_method)
+
+        term_degrees = self.calc_term_degrees(v_inputs)
+
         list_results = list()
-        for rule in self.sugeno_controller.rules:
-            if len(rule.inputs) == 1:
-                r_input = rule.inputs[0]
-                result = r_input.rule_func(v_inputs[r_input.name],
-                                           **r_input.params)
-                if r_input.var_not:
-                    list_results.append(NotMethod.calculate_not(result))
-                else:
-                    list_results.append(result)
+        for rule_terms, rule_or in zip(compiled.rule_terms,
+                                       compiled.or_mask.tolist()):
+            degrees = [term_degrees[term] for term in rule_terms]
+            if len(degrees) == 1:
+                list_results.append(degrees[0])
+            elif rule_or:
+                list_results.append(or_method(degrees))
             else:
-                list_results.append(rule.connection_func(
-                    rule.inputs,
-                    v_inputs))
+                list_results.append(and_method(degrees))
         return np.array(list_results)
 
-    def sugeno_calc_single_value(self, v_inputs):
+    def sugeno_calc_single_value(self, v_inputs, output: Optional[str] = None):
         result = -1
+        num_output = self.get_num_output(output)
+
+        # As regras sem este consequente (0 no arquivo .fis) não participam
+        # da soma
+        output_mask = self.sugeno_controller.compiled_rules.output_mask[num_output]
 
         if self.sugeno_controller.fis_system.defuzz_method == DefuzzMethods.wtaver:
             w_array = self.calc_rule_firing(v_inputs)
-            z_array = self.calc_rule_output_level(v_inputs)
+            z_array = self.calc_rule_output_level(v_inputs, num_output)
 
             weights = self.calc_rule_weights()
-            w_array_weights = w_array * weights
+            w_array_weights = w_array * weights * output_mask
 
             result = np.sum(w_array_weights * z_array) / sum(w_array_weights)
 
         elif self.sugeno_controller.fis_system.defuzz_method == DefuzzMethods.wtsum:
             w_array = self.calc_rule_firing(v_inputs)
-            z_array = self.calc_rule_output_level(v_inputs)
+            z_array = self.calc_rule_output_level(v_inputs, num_output)
 
             weights = self.calc_rule_weights()
-            w_array_weights = w_array * weights
+            w_array_weights = w_array * weights * output_mask
 
             result = np.sum(w_array_weights * z_array)
 
-        if self.sugeno_controller.fis_system.use_dict_facies_association:
+        # O dicionário de fácies é criado a partir do primeiro consequente
+        if num_output == 0 and self.sugeno_controller.fis_system.use_dict_facies_association:
             return self.sugeno_controller.fis_system.facies_association.get(int(round(result, 0)))
         else:
             return result
+
+    def sugeno_calc_fused(self,
+                          v_inputs: Dict[str, float],
+                          output: Optional[str] = None):
+        """
+        Calcula o consequente Sugeno de uma amostra em uma única passagem
+        sobre a base de regras compilada. Retorna o mesmo valor de
+        sugeno_calc_single_value, com menor latência.
+
+        Parâmetros
+        ----------
+        v_inputs : Dict[str, float]
+            Dicionário com as chaves sendo o nome dos antecedentes e os
+            valores sendo números float.
+
+        output : Optional[str]
+            Nome do consequente. Quando não informado é usado o primeiro
+            consequente.
+        """
+        num_output = self.get_num_output(output)
+        result = self.get_scalar_evaluator(num_output)(v_inputs)
+
+        # O dicionário de fácies é criado a partir do primeiro consequente
+        if num_output == 0 and \
+                self.sugeno_controller.fis_system.use_dict_facies_association:
+            return self.sugeno_controller.fis_system.facies_association.get(
+                int(round(result, 0)))
+        else:
+            return result
+
+    def sugeno_calc_outputs(self,
+                            v_inputs: Dict[str, float]) -> Dict[str, float]:
+        """
+        Calcula todos os consequentes Sugeno de uma amostra, com um único
+        cálculo dos disparos das regras.
+
+        Parâmetros
+        ----------
+        v_inputs : Dict[str, float]
+            Dicionário com as chaves sendo o nome dos antecedentes e os
+            valores sendo números float.
+
+        Retorna
+        -------
+        Dict[str, float]
+            Retorna um dicionário com as chaves sendo o nome dos consequentes.
+        """
+        compiled = self.sugeno_controller.compiled_rules
+
+        x_array = self.get_batch_matrix(self.get_batch_inputs(v_inputs))
+        result = self.calc_outputs_compiled(x_array)[:, 0].tolist()
+
+        if self.sugeno_controller.fis_system.use_dict_facies_association:
+            result[0] = self.sugeno_controller.fis_system.facies_association.get(
+                int(round(result[0], 0)))
+
+        return dict(zip(compiled.output_names, result))
+
+    def get_batch_inputs(self,
+                         v_inputs: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Converte os valores dos antecedentes em numpy arrays float64 com o
+        mesmo formato.
+
+        Parâmetros
+        ----------
+        v_inputs : Dict[str, np.ndarray]
+            Dicionário com as chaves sendo o nome dos antecedentes e os
+            valores sendo arrays com as amostras.
+
+        Retorna
+        -------
+        Dict[str, np.ndarray]
+            Retorna um dicionário com os arrays convertidos.
+        """
+        for f_input in self.sugeno_controller.inputs:
+            if f_input not in v_inputs:
+                raise Exception(f"O antecedente {f_input} não foi informado!")
+
+        names = list(v_inputs.keys())
+        try:
+            arrays = np.broadcast_arrays(
+                *[np.asarray(v_inputs[name], dtype=np.float64)
+                  for name in names])
+        except ValueError:
+            raise Exception("Os arrays dos antecedentes não possuem o mesmo "
+                            "formato!")
+
+        return dict(zip(names, arrays))
+
+    def calc_rule_firing_compiled(self, x_array: np.ndarray) -> np.ndarray:
+        compiled = self.sugeno_controller.compiled_rules
+        fis_system = self.sugeno_controller.fis_system
+
+        term_degrees = self.calc_term_degrees_batch(x_array)
+
+        # Busca o grau de cada antecedente das regras na tabela de termos
+        term_index = compiled.term_index
+        care_mask = term_index != SugenoCompiledRules.DONT_CARE
+        rule_degrees = term_degrees[np.where(care_mask, term_index, 0)]
+        care_mask = care_mask[..., np.newaxis]
+
+        firing = np.zeros((compiled.num_rules, x_array.shape[1]),
+                          dtype=np.float64)
+
+        and_rules = ~compiled.or_mask
+        if and_rules.any():
+            and_method = self.DICT_AND_ARRAY_METHODS.get(
+                fis_system.and_method)
+            firing[and_rules] = and_method(
+                np.where(care_mask[and_rules], rule_degrees[and_rules], 1.0),
+                axis=1)
+
+        or_rules = compiled.or_mask
+        if or_rules.any():
+            or_method = self.DICT_OR_ARRAY_METHODS.get(fis_system.or_method)
+            firing[or_rules] = or_method(
+                np.where(care_mask[or_rules], rule_degrees[or_rules], 0.0),
+                axis=1)
+
+        return firing
+
+    @staticmethod
+    def get_design_matrix(x_array: np.ndarray) -> np.ndarray:
+        """
+        Monta a matriz amostra x (antecedentes + 1) com os valores dos
+        antecedentes e uma última coluna de uns para o termo constante.
+        """
+        design = np.empty((x_array.shape[1], x_array.shape[0] + 1),
+                          dtype=np.float64)
+        design[:, :-1] = x_array.T
+        design[:, -1] = 1.0
+
+        return design
+
+    def calc_rule_output_level_compiled(self,
+                                        x_array: np.ndarray,
+                                        num_output: int = 0) -> np.ndarray:
+        """
+        Calcula os consequentes de todas as regras como um único produto de
+        matrizes X @ C.T. Nos sistemas de ordem zero o produto não é feito e
+        os termos constantes são repetidos para as amostras.
+
+        Parâmetros
+        ----------
+        x_array : np.ndarray
+            Array antecedente x amostra com os valores dos antecedentes.
+
+        num_output : int
+            Posição do consequente em output_names.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array regra x amostra.
+        """
+        compiled = self.sugeno_controller.compiled_rules
+        coefficients = compiled.output_coefficients[num_output]
+
+        if compiled.constant_consequents:
+            return np.broadcast_to(coefficients[:, -1, np.newaxis],
+                                   (compiled.num_rules, x_array.shape[1]))
+
+        return (self.get_design_matrix(x_array) @ coefficients.T).T
+
+    def get_batch_matrix(self, v_inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Monta o array antecedente x amostra na ordem dos antecedentes da base
+        de regras compilada.
+        """
+        return np.array([np.ravel(v_inputs[name]) for name in
+                         self.sugeno_controller.compiled_rules.input_names],
+                        dtype=np.float64).reshape(
+            (self.sugeno_controller.compiled_rules.num_inputs, -1))
+
+    def calc_rule_output_level_batch(self, v_inputs: Dict[str, np.ndarray]):
+        v_inputs = self.get_batch_inputs(v_inputs)
+        shape = next(iter(v_inputs.values())).shape
+        result = self.calc_rule_output_level_compiled(
+            self.get_batch_matrix(v_inputs))
+
+        return result.reshape((-1,) + shape)
+
+    def calc_rule_firing_batch(self, v_inputs: Dict[str, np.ndarray]):
+        v_inputs = self.get_batch_inputs(v_inputs)
+        shape = next(iter(v_inputs.values())).shape
+        result = self.calc_rule_firing_compiled(
+            self.get_batch_matrix(v_inputs))
+
+        return result.reshape((-1,) + shape)
+
+    def calc_outputs_compiled(self, x_array: np.ndarray) -> np.ndarray:
+        """
+        Calcula todos os consequentes com um único cálculo dos disparos das
+        regras, usado pela defuzzificação de cada consequente.
+
+        Parâmetros
+        ----------
+        x_array : np.ndarray
+            Array antecedente x amostra com os valores dos antecedentes.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array consequente x amostra.
+        """
+        compiled = self.sugeno_controller.compiled_rules
+        defuzz_method = self.sugeno_controller.fis_system.defuzz_method
+
+        result = np.full((compiled.num_outputs, x_array.shape[1]), -1,
+                         dtype=np.float64)
+        if defuzz_method not in (DefuzzMethods.wtaver, DefuzzMethods.wtsum):
+            return result
+
+        w_array = self.calc_rule_firing_compiled(x_array)
+        active = w_array > self.firing_epsilon
+        self.update_activation(active)
+
+        w_array_weights = w_array * compiled.weights[:, np.newaxis]
+
+        num_active = np.count_nonzero(active)
+        if num_active <= self.SPARSE_DENSITY * active.size:
+            rule_index, sample_index = np.nonzero(active)
+            self.calc_outputs_sparse(x_array, rule_index, sample_index,
+                                     w_array_weights[rule_index, sample_index],
+                                     result)
+        else:
+            if num_active != active.size and self.firing_epsilon > 0:
+                w_array_weights[~active] = 0.0
+            self.calc_outputs_dense(x_array, w_array_weights, result)
+
+        return result
+
+    def calc_outputs_dense(self, x_array: np.ndarray,
+                           w_array_weights: np.ndarray, result: np.ndarray):
+        """
+        Soma ponderada de todos os pares (amostra, regra).
+        """
+        compiled = self.sugeno_controller.compiled_rules
+        defuzz_method = self.sugeno_controller.fis_system.defuzz_method
+
+        for num_output, output_mask in enumerate(compiled.output_mask):
+            # As regras sem este consequente não participam da soma
+            if output_mask.all():
+                w_output = w_array_weights
+            else:
+                w_output = w_array_weights * output_mask[:, np.newaxis]
+
+            if compiled.constant_consequents:
+                result[num_output] = compiled.output_coefficients[
+                    num_output, :, -1] @ w_output
+            else:
+                z_array = self.calc_rule_output_level_compiled(x_array,
+                                                               num_output)
+                result[num_output] = np.sum(w_output * z_array, axis=0)
+
+            if defuzz_method == DefuzzMethods.wtaver:
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    result[num_output] /= np.sum(w_output, axis=0)
+
+    def calc_outputs_sparse(self, x_array: np.ndarray,
+                            rule_index: np.ndarray, sample_index: np.ndarray,
+                            w_active: np.ndarray, result: np.ndarray):
+        """
+        Soma ponderada somente dos pares (amostra, regra) compactados que
+        disparam. Os consequentes são calculados apenas para estes pares.
+        """
+        compiled = self.sugeno_controller.compiled_rules
+        defuzz_method = self.sugeno_controller.fis_system.defuzz_method
+        num_samples = x_array.shape[1]
+
+        if not compiled.constant_consequents:
+            x_active = x_array[:, sample_index]
+
+        for num_output, output_mask in enumerate(compiled.output_mask):
+            coefficients = compiled.output_coefficients[num_output]
+
+            # As regras sem este consequente não participam da soma
+            w_output = w_active * output_mask[rule_index]
+
+            z_active = coefficients[rule_index, -1]
+            if not compiled.constant_consequents:
+                z_active = z_active + np.einsum(
+                    'ij,ji->i', coefficients[rule_index, :-1], x_active)
+
+            result[num_output] = np.bincount(sample_index,
+                                             weights=w_output * z_active,
+                                             minlength=num_samples)
+
+            if defuzz_method == DefuzzMethods.wtaver:
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    result[num_output] /= np.bincount(sample_index,
+                                                      weights=w_output,
+                                                      minlength=num_samples)
+
+    def update_activation(self, active: np.ndarray):
+        """
+        Acumula a quantidade de pares (amostra, regra) disparados.
+        """
+        if self.__activation is None:
+            self.__activation = {'pairs': 0, 'active': 0,
+                                 'per_rule': np.zeros(active.shape[0],
+                                                      dtype=np.int64)}
+
+        self.__activation['pairs'] += active.size
+        self.__activation['active'] += int(np.count_nonzero(active))
+        self.__activation['per_rule'] += np.count_nonzero(active, axis=1)
+
+    def get_activation_report(self) -> Dict:
+        """
+        Informa a esparsidade dos disparos das regras do último cálculo em
+        lote.
+
+        Retorna
+        -------
+        Dict
+            Retorna um dicionário com as chaves 'pairs' (pares amostra x
+            regra), 'active' (pares com disparo maior que firing_epsilon),
+            'sparsity' (fração de pares descartados), 'epsilon' e 'per_rule'
+            (pares disparados por regra).
+        """
+        if self.__activation is None:
+            return {'pairs': 0, 'active': 0, 'sparsity': 0.0,
+                    'epsilon': self.firing_epsilon, 'per_rule': []}
+
+        pairs = self.__activation['pairs']
+        active = self.__activation['active']
+        return {'pairs': pairs,
+                'active': active,
+                'sparsity': 1.0 - active / pairs if pairs else 0.0,
+                'epsilon': self.firing_epsilon,
+                'per_rule': self.__activation['per_rule'].tolist()}
+
+    def sugeno_calc_batch_outputs(self,
+                                  v_inputs: Dict[str, np.ndarray],
+                                  as_array: bool = False):
+        """
+        Calcula todos os consequentes Sugeno para várias amostras de uma só
+        vez. A fuzzificação e os disparos das regras são calculados uma única
+        vez e compartilhados pelos consequentes.
+
+        Parâmetros
+        ----------
+        v_inputs : Dict[str, np.ndarray]
+            Dicionário com as chaves sendo o nome dos antecedentes e os
+            valores sendo arrays com as amostras. Todos os arrays precisam ter
+            o mesmo formato.
+
+        as_array : bool
+            Quando verdadeiro retorna um único array com a primeira dimensão
+            sendo o consequente, na ordem do arquivo .fis.
+
+        Retorna
+        -------
+        Dict[str, np.ndarray] ou np.ndarray
+            Retorna um dicionário com as chaves sendo o nome dos consequentes
+            e os valores sendo arrays com o mesmo formato das entradas. Quando
+            o dicionário de fácies é usado, o primeiro consequente contém os
+            códigos das associações de fácies (np.nan quando não encontrado).
+        """
+        v_inputs = self.get_batch_inputs(v_inputs)
+        shape = next(iter(v_inputs.values())).shape
+        x_array = self.get_batch_matrix(v_inputs)
+
+        compiled = self.sugeno_controller.compiled_rules
+        result = np.empty((compiled.num_outputs, x_array.shape[1]),
+                          dtype=np.float64)
+        self.__activation = None
+
+        # Processa as amostras em blocos para limitar o uso de memória
+        for start in range(0, x_array.shape[1], self.BATCH_CHUNK_SIZE):
+            result[:, start:start + self.BATCH_CHUNK_SIZE] = \
+                self.calc_outputs_compiled(
+                    x_array[:, start:start + self.BATCH_CHUNK_SIZE])
+
+        result = result.reshape((compiled.num_outputs,) + shape)
+
+        # O dicionário de fácies é criado a partir do primeiro consequente
+        if self.sugeno_controller.fis_system.use_dict_facies_association:
+            result[0] = self.get_facies_association_batch(result[0])
+
+        if as_array:
+            return result
+
+        return {name: result[num_output]
+                for num_output, name in enumerate(compiled.output_names)}
+
+    def sugeno_calc_batch(self, v_inputs: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Calcula o consequente Sugeno para várias amostras de uma só vez.
+
+        Parâmetros
+        ----------
+        v_inputs : Dict[str, np.ndarray]
+            Dicionário com as chaves sendo o nome dos antecedentes e os
+            valores sendo arrays com as amostras. Todos os arrays precisam ter
+            o mesmo formato.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array com o mesmo formato das entradas contendo os
+            resultados do primeiro consequente ou, quando o dicionário de
+            fácies é usado, os códigos das associações de fácies (np.nan
+            quando não encontrado).
+        """
+        return self.sugeno_calc_batch_outputs(v_inputs, as_array=True)[0]
+
+    def get_facies_association_batch(self, result: np.ndarray) -> np.ndarray:
+        facies = np.full(result.shape, np.nan)
+        codes = np.round(result, 0)
+        for key, value in \
+                self.sugeno_controller.fis_system.facies_association.items():
+            facies[codes == key] = value
+
+        return facies
@@ -0,0 +1,209 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import numpy as np
+
+
+class CentroidDefuzzMethod:
+    """
+    Centroide da saída Mamdani (implicação min e agregação max) calculado
+    para várias amostras de uma só vez.
+
+    O resultado é o mesmo do scikit-fuzzy: o universo de cada amostra recebe
+    os pontos em que cada curva de pertinência cruza o seu corte, a curva
+    agregada é avaliada nesses pontos e o centroide é a integral exata da
+    curva linear por partes resultante.
+    """
+
+    @staticmethod
+    def calculate_aggregated_array(term_mfs: np.ndarray,
+                                   cuts: np.ndarray) -> np.ndarray:
+        """
+        Calcula a curva agregada max(min(corte, pertinência)) de cada amostra
+        nos pontos do universo.
+
+        Parâmetros
+        ----------
+        term_mfs : np.ndarray
+            Array função de pertinência x universo do consequente.
+
+        cuts : np.ndarray
+            Array função de pertinência x amostra com o corte de cada
+            função de pertinência.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array amostra x universo.
+        """
+        aggregated = np.zeros((cuts.shape[1], term_mfs.shape[1]),
+                              dtype=np.float64)
+        for term_mf, cut in zip(term_mfs, cuts):
+            np.maximum(aggregated,
+                       np.minimum(cut[:, np.newaxis], term_mf),
+                       out=aggregated)
+
+        return aggregated
+
+    @staticmethod
+    def calculate_segments(x1, y1, x2, y2):
+        """
+        Calcula a área e o momento de cada segmento de reta (x1, y1) até
+        (x2, y2).
+        """
+        width = x2 - x1
+        area = width * (y1 + y2) / 2
+        moment = width * (x1 * (2 * y1 + y2) + x2 * (y1 + 2 * y2)) / 6
+
+        return area, moment
+
+    @classmethod
+    def calculate_crossings(cls,
+                            universe: np.ndarray,
+                            term_mfs: np.ndarray,
+                            cuts: np.ndarray):
+        """
+        Encontra os pontos em que cada curva de pertinência cruza o seu corte.
+
+        Retorna
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            Retorna a amostra, o segmento do universo e a posição de cada
+            cruzamento.
+        """
+        width = np.diff(universe)
+
+        samples = list()
+        segments = list()
+        positions = list()
+        for term_mf, cut in zip(term_mfs, cuts):
+            # Mesmo critério do scikit-fuzzy: um corte zero só cruza a curva
+            # onde ela deixa de ser zero
+            above = (term_mf > 0) & (term_mf >= cut[:, np.newaxis])
+            sample, segment = np.nonzero(above[:, 1:] != above[:, :-1])
+            if sample.size == 0:
+                continue
+
+            mf_1 = term_mf[segment]
+            mf_2 = term_mf[segment + 1]
+            samples.append(sample)
+            segments.append(segment)
+            positions.append(universe[segment]
+                             + (cut[sample] - mf_1) * width[segment]
+                             / (mf_2 - mf_1))
+
+        if not samples:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty, np.empty(0, dtype=np.float64)
+
+        return (np.concatenate(samples), np.concatenate(segments),
+                np.concatenate(positions))
+
+    @staticmethod
+    def calculate_crossing_values(universe: np.ndarray,
+                                  term_mfs: np.ndarray,
+                                  cuts: np.ndarray,
+                                  sample: np.ndarray,
+                                  segment: np.ndarray,
+                                  position: np.ndarray) -> np.ndarray:
+        """
+        Valor da curva agregada nos cruzamentos, interpolando as curvas de
+        pertinência como o np.interp.
+        """
+        slope_x = position - universe[segment]
+        width = universe[segment + 1] - universe[segment]
+        value = np.zeros(position.shape, dtype=np.float64)
+        for term_mf, cut in zip(term_mfs, cuts):
+            slope = (term_mf[segment + 1] - term_mf[segment]) / width
+            np.maximum(value,
+                       np.minimum(cut[sample],
+                                  slope * slope_x + term_mf[segment]),
+                       out=value)
+
+        return value
+
+    @classmethod
+    def calculate_centroid_array(cls,
+                                 universe: np.ndarray,
+                                 term_mfs: np.ndarray,
+                                 cuts: np.ndarray) -> np.ndarray:
+        """
+        Calcula o centroide da saída de cada amostra.
+
+        Parâmetros
+        ----------
+        universe : np.ndarray
+            Universo do consequente.
+
+        term_mfs : np.ndarray
+            Array função de pertinência x universo do consequente, somente
+            com as funções de pertinência usadas pelas regras.
+
+        cuts : np.ndarray
+            Array função de pertinência x amostra com o corte de cada
+            função de pertinência.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array com o centroide de cada amostra, ou nan quando a
+            curva agregada é vazia.
+        """
+        num_samples = cuts.shape[1]
+        aggregated = cls.calculate_aggregated_array(term_mfs, cuts)
+
+        x_1 = universe[:-1]
+        x_2 = universe[1:]
+        segment_area, segment_moment = cls.calculate_segments(
+            x_1, aggregated[:, :-1], x_2, aggregated[:, 1:])
+        area = segment_area.sum(axis=1)
+        moment = segment_moment.sum(axis=1)
+
+        sample, segment, position = cls.calculate_crossings(universe,
+                                                            term_mfs,
+                                                            cuts)
+        if sample.size > 0:
+            value = cls.calculate_crossing_values(universe, term_mfs, cuts,
+                                                  sample, segment, position)
+
+            order = np.lexsort((position, segment, sample))
+            sample = sample[order]
+            segment = segment[order]
+            position = position[order]
+            value = value[order]
+
+            # Os segmentos com cruzamentos são divididos nos cruzamentos
+            group = sample * x_1.shape[0] + segment
+            first = np.ones(group.shape, dtype=bool)
+            first[1:] = group[1:] != group[:-1]
+            last = np.ones(group.shape, dtype=bool)
+            last[:-1] = first[1:]
+
+            left_x = np.where(first, x_1[segment], np.roll(position, 1))
+            left_y = np.where(first, aggregated[sample, segment],
+                              np.roll(value, 1))
+            new_area, new_moment = cls.calculate_segments(
+                left_x, left_y, position, value)
+
+            last_area, last_moment = cls.calculate_segments(
+                position[last], value[last], x_2[segment[last]],
+                aggregated[sample[last], segment[last] + 1])
+
+            area += np.bincount(sample, new_area, num_samples)
+            area += np.bincount(sample[last], last_area, num_samples)
+            area -= np.bincount(sample[first],
+                                segment_area[sample[first], segment[first]],
+                                num_samples)
+            moment += np.bincount(sample, new_moment, num_samples)
+            moment += np.bincount(sample[last], last_moment, num_samples)
+            moment -= np.bincount(
+                sample[first], segment_moment[sample[first], segment[first]],
+                num_samples)
+
+        result = moment / np.fmax(area, np.finfo(float).eps)
+        result[~aggregated.any(axis=1)] = np.nan
+
+        return result
@@ -0,0 +1,239 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import numpy as np
+from typing import Dict, Optional
+from continentalfuzzy.domain.MembershipFunction import MembershipFunction
+from continentalfuzzy.domain.definition.Functions import Functions
+
+
+class LinearCentroidDefuzzMethod:
+    """
+    Centroide exato da saída Mamdani (implicação min e agregação max) quando
+    todas as funções de pertinência do consequente são triangulares ou
+    trapezoidais.
+
+    Nesse caso a curva agregada é linear por partes e os seus pontos de
+    quebra são conhecidos: os vértices das funções de pertinência, as
+    interseções entre os lados das funções de pertinência e os pontos em que
+    cada lado cruza o corte de cada função de pertinência. O centroide é a
+    integral exata entre esses pontos, sem universo amostrado, então o custo
+    por amostra depende somente da quantidade de funções de pertinência.
+    """
+
+    @staticmethod
+    def get_trapezoids(mfs: Dict[int, MembershipFunction]) \
+            -> Optional[np.ndarray]:
+        """
+        Converte as funções de pertinência em trapézios (a, b, c, d).
+
+        Parâmetros
+        ----------
+        mfs : Dict[int, MembershipFunction]
+            Dicionário com as funções de pertinência do consequente.
+
+        Retorna
+        -------
+        Optional[np.ndarray]
+            Retorna um array função de pertinência x 4, ou None quando alguma
+            função de pertinência não é triangular nem trapezoidal.
+        """
+        trapezoids = list()
+        for f_mf in mfs.values():
+            if f_mf.function == Functions.trimf:
+                a, b, c = f_mf.abc
+                trapezoids.append((a, b, b, c))
+
+            elif f_mf.function == Functions.trapmf:
+                trapezoids.append(tuple(f_mf.abcd))
+
+            else:
+                return None
+
+        return np.array(trapezoids, dtype=np.float64).reshape((-1, 4))
+
+    @staticmethod
+    def calculate_edges(trapezoids: np.ndarray):
+        """
+        Retas dos lados não verticais dos trapézios.
+
+        Retorna
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+            Retorna a inclinação, o coeficiente linear, a função de
+            pertinência e o início e o fim do intervalo de cada reta.
+        """
+        a, b, c, d = trapezoids.T
+        rising = b > a
+        falling = d > c
+        owners = np.arange(trapezoids.shape[0])
+
+        slopes = np.concatenate((1 / (b[rising] - a[rising]),
+                                 -1 / (d[falling] - c[falling])))
+        intercepts = np.concatenate((-a[rising] / (b[rising] - a[rising]),
+                                     d[falling] / (d[falling] - c[falling])))
+        edge_mfs = np.concatenate((owners[rising], owners[falling]))
+        starts = np.concatenate((a[rising], c[falling]))
+        ends = np.concatenate((b[rising], d[falling]))
+
+        return slopes, intercepts, edge_mfs, starts, ends
+
+    @classmethod
+    def calculate_static_points(cls,
+                                trapezoids: np.ndarray,
+                                u_range) -> np.ndarray:
+        """
+        Pontos de quebra que não dependem dos cortes: extremos do range,
+        vértices dos trapézios e interseções entre os lados de funções de
+        pertinência diferentes.
+        """
+        slopes, intercepts, edge_mfs, starts, ends = \
+            cls.calculate_edges(trapezoids)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            crossings = (intercepts[np.newaxis, :] -
+                         intercepts[:, np.newaxis]) / \
+                (slopes[:, np.newaxis] - slopes[np.newaxis, :])
+
+        # Somente as interseções dentro do intervalo dos dois lados
+        valid = np.isfinite(crossings) & \
+            (edge_mfs[:, np.newaxis] != edge_mfs[np.newaxis, :]) & \
+            (crossings >= np.maximum.outer(starts, starts)) & \
+            (crossings <= np.minimum.outer(ends, ends))
+
+        points = np.concatenate((np.asarray(u_range, dtype=np.float64),
+                                 np.ravel(trapezoids),
+                                 crossings[valid]))
+
+        return np.unique(points[(points >= u_range[0]) &
+                                (points <= u_range[1])])
+
+    @classmethod
+    def calculate_cut_edges(cls, trapezoids: np.ndarray):
+        """
+        Pares (função de pertinência, lado) em que o corte da função de
+        pertinência pode cruzar o lado: o lado é da própria função de
+        pertinência ou está dentro do seu suporte.
+
+        Retorna
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Retorna a função de pertinência e o lado de cada par.
+        """
+        _, _, edge_mfs, starts, ends = cls.calculate_edges(trapezoids)
+        a = trapezoids[:, 0]
+        d = trapezoids[:, 3]
+
+        pairs = (edge_mfs[np.newaxis, :] ==
+                 np.arange(trapezoids.shape[0])[:, np.newaxis]) | \
+            ((starts[np.newaxis, :] < d[:, np.newaxis]) &
+             (ends[np.newaxis, :] > a[:, np.newaxis]))
+
+        return np.nonzero(pairs)
+
+    @staticmethod
+    def calculate_membership(trapezoids: np.ndarray,
+                             x: np.ndarray) -> np.ndarray:
+        """
+        Calcula a pertinência de cada trapézio nos pontos x.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array função de pertinência x formato de x.
+        """
+        shape = (-1,) + (1,) * x.ndim
+        a, b, c, d = [value.reshape(shape) for value in trapezoids.T]
+
+        rising = np.where(b > a,
+                          (x - a) / np.where(b > a, b - a, 1.0),
+                          np.where(x >= a, 1.0, 0.0))
+        falling = np.where(d > c,
+                           (d - x) / np.where(d > c, d - c, 1.0),
+                           np.where(x <= d, 1.0, 0.0))
+
+        return np.clip(np.minimum(rising, falling), 0.0, 1.0)
+
+    @classmethod
+    def calculate_aggregated(cls,
+                             trapezoids: np.ndarray,
+                             cuts: np.ndarray,
+                             x: np.ndarray) -> np.ndarray:
+        """
+        Calcula a curva agregada max(min(corte, pertinência)) nos pontos x
+        (array amostra x ponto).
+        """
+        membership = cls.calculate_membership(trapezoids, x)
+
+        return np.max(np.minimum(cuts[:, :, np.newaxis], membership), axis=0)
+
+    @classmethod
+    def calculate_centroid_array(cls,
+                                 u_range,
+                                 trapezoids: np.ndarray,
+                                 cuts: np.ndarray) -> np.ndarray:
+        """
+        Calcula o centroide exato da saída de cada amostra.
+
+        Parâmetros
+        ----------
+        u_range : List[float]
+            Range do consequente.
+
+        trapezoids : np.ndarray
+            Array função de pertinência x 4, somente com as funções de
+            pertinência usadas pelas regras.
+
+        cuts : np.ndarray
+            Array função de pertinência x amostra com o corte de cada
+            função de pertinência.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array com o centroide de cada amostra, ou nan quando a
+            curva agregada é vazia.
+        """
+        num_samples = cuts.shape[1]
+        if trapezoids.shape[0] == 0:
+            return np.full(num_samples, np.nan)
+
+        static = cls.calculate_static_points(trapezoids, u_range)
+        slopes, intercepts, _, starts, ends = cls.calculate_edges(trapezoids)
+        cut_mfs, cut_edges = cls.calculate_cut_edges(trapezoids)
+
+        # Pontos em que os lados cruzam os cortes, limitados ao intervalo de
+        # cada lado e ao range
+        dynamic = (cuts[cut_mfs].T - intercepts[cut_edges]) / \
+            slopes[cut_edges]
+        dynamic = np.clip(np.clip(dynamic, starts[cut_edges],
+                                  ends[cut_edges]),
+                          u_range[0], u_range[1])
+        points = np.concatenate(
+            (np.broadcast_to(static, (num_samples, static.shape[0])),
+             dynamic), axis=1)
+        points.sort(axis=1)
+
+        # A curva é linear entre dois pontos de quebra. Ela é avaliada a 1/4
+        # e a 3/4 de cada intervalo, assim os degraus dos lados verticais
+        # ficam sempre nos extremos dos intervalos
+        left = points[:, :-1]
+        width = np.diff(points, axis=1)
+        y_1 = cls.calculate_aggregated(trapezoids, cuts, left + width / 4)
+        y_3 = cls.calculate_aggregated(trapezoids, cuts,
+                                       left + 3 * width / 4)
+
+        mean = (y_1 + y_3) / 2
+        slope = np.divide(2 * (y_3 - y_1), width,
+                          out=np.zeros(width.shape), where=width > 0)
+        area = np.sum(width * mean, axis=1)
+        moment = np.sum(width * mean * (left + width / 2) +
+                        slope * width ** 3 / 12, axis=1)
+
+        result = np.full(num_samples, np.nan)
+        np.divide(moment, area, out=result, where=area > 0)
+
+        return result
@@ -0,0 +1,70 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+from typing import List, Optional
+from skfuzzy.control import ControlSystem
+from skfuzzy.control.rule import Rule as SkRule
+
+
+class MamdaniControlSystem(ControlSystem):
+    """
+    ControlSystem do scikit-fuzzy para as bases de regras dos arquivos .fis.
+
+    O ControlSystem original junta o grafo de cada regra ao grafo do sistema
+    e refaz a ordem de execução de todas as regras a cada regra adicionada
+    e a cada cálculo, o que é quadrático no número de regras. Nos arquivos
+    .fis as regras só ligam antecedentes a consequentes (não há variáveis
+    intermediárias), então a ordem de declaração já é uma ordem de execução
+    válida: o grafo é montado uma única vez e as regras são devolvidas nessa
+    ordem.
+    """
+
+    def __init__(self, rules: Optional[List[SkRule]] = None):
+        self.__rule_list = list()
+        super().__init__()
+
+        if rules is not None:
+            self.add_rules(rules)
+
+    @property
+    def rules(self) -> List[SkRule]:
+        """
+        Regras do sistema na ordem em que foram adicionadas.
+        """
+        return self.__rule_list
+
+    def addrule(self, rule: SkRule):
+        self.add_rules([rule])
+
+    def add_rules(self, rules: List[SkRule]):
+        """
+        Adiciona as regras ao sistema, ligando cada termo dos antecedentes à
+        regra e a regra a cada termo dos consequentes.
+
+        Parâmetros
+        ----------
+        rules : List[SkRule]
+            Lista com instâncias da classe skfuzzy.control.rule.Rule.
+        """
+        variables = dict()
+        edges = list()
+        for rule in rules:
+            if not isinstance(rule, SkRule):
+                raise Exception("O valor não é uma instância da classe Rule!")
+
+            for f_term in rule.antecedent_terms:
+                variables[id(f_term.parent)] = f_term.parent
+                edges.append((f_term, rule))
+
+            for f_con in rule.consequent:
+                variables[id(f_con.term.parent)] = f_con.term.parent
+                edges.append((rule, f_con.term))
+
+        for variable in variables.values():
+            self.graph.add_edges_from(variable.graph.edges())
+
+        self.graph.add_edges_from(edges)
+        self.__rule_list.extend(rules)
@@ -0,0 +1,207 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import numpy as np
+from continentalfuzzy.service.mamdani.CentroidDefuzzMethod import \
+    CentroidDefuzzMethod
+
+
+class RefinedDefuzzMethod:
+    """
+    Bissetor, média dos máximos (mom), menor dos máximos (som) e maior dos
+    máximos (lom) da saída Mamdani calculados para várias amostras de uma só
+    vez.
+
+    Como no scikit-fuzzy, o universo de cada amostra recebe os pontos em que
+    cada curva de pertinência cruza o seu corte. Os universos refinados são
+    guardados em um array amostra x ponto, completado com pontos repetidos
+    (de largura zero), assim o bissetor é encontrado com a soma acumulada das
+    áreas e os máximos com máscaras, sem laço por amostra.
+
+    Quando nenhuma regra ativa o consequente a curva agregada é vazia: o
+    bissetor é nan, pois o scikit-fuzzy não calcula o consequente, e no mom,
+    som e lom todos os pontos do universo são máximos, como no scikit-fuzzy
+    (média, primeiro e último ponto do universo).
+    """
+
+    @staticmethod
+    def calculate_refined_array(universe: np.ndarray,
+                                term_mfs: np.ndarray,
+                                cuts: np.ndarray):
+        """
+        Monta o universo refinado e a curva agregada de cada amostra.
+
+        Parâmetros
+        ----------
+        universe : np.ndarray
+            Universo do consequente.
+
+        term_mfs : np.ndarray
+            Array função de pertinência x universo do consequente, somente
+            com as funções de pertinência usadas pelas regras.
+
+        cuts : np.ndarray
+            Array função de pertinência x amostra com o corte de cada
+            função de pertinência.
+
+        Retorna
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            Retorna os arrays amostra x ponto com os pontos em ordem
+            crescente, o valor da curva agregada em cada ponto e a máscara
+            dos pontos que não são repetidos.
+        """
+        num_samples = cuts.shape[1]
+        aggregated = CentroidDefuzzMethod.calculate_aggregated_array(term_mfs,
+                                                                     cuts)
+        x = np.broadcast_to(universe, aggregated.shape)
+
+        sample, segment, position = CentroidDefuzzMethod.calculate_crossings(
+            universe, term_mfs, cuts)
+        if sample.size == 0:
+            return np.array(x), aggregated, np.ones(x.shape, dtype=bool)
+
+        value = CentroidDefuzzMethod.calculate_crossing_values(
+            universe, term_mfs, cuts, sample, segment, position)
+
+        # Posição de cada cruzamento entre os cruzamentos da sua amostra
+        order = np.argsort(sample, kind='stable')
+        sample = sample[order]
+        counts = np.bincount(sample, minlength=num_samples)
+        rank = np.arange(sample.shape[0]) - \
+            np.repeat(np.cumsum(counts) - counts, counts)
+
+        extra_x = np.full((num_samples, counts.max()), universe[-1])
+        extra_y = np.repeat(aggregated[:, -1:], counts.max(), axis=1)
+        extra_x[sample, rank] = position[order]
+        extra_y[sample, rank] = value[order]
+
+        x = np.concatenate((x, extra_x), axis=1)
+        y = np.concatenate((aggregated, extra_y), axis=1)
+
+        # Ordenação estável: um cruzamento sobre um ponto do universo fica
+        # depois dele e é descartado como repetido, como no np.union1d
+        order = np.argsort(x, axis=1, kind='stable')
+        x = np.take_along_axis(x, order, axis=1)
+        y = np.take_along_axis(y, order, axis=1)
+
+        valid = np.ones(x.shape, dtype=bool)
+        valid[:, 1:] = x[:, 1:] != x[:, :-1]
+
+        # Os pontos repetidos recebem o valor do primeiro ponto igual
+        index = np.maximum.accumulate(
+            np.where(valid, np.arange(x.shape[1]), 0), axis=1)
+        y = np.take_along_axis(y, index, axis=1)
+
+        return x, y, valid
+
+    @classmethod
+    def calculate_bisector_array(cls,
+                                 universe: np.ndarray,
+                                 term_mfs: np.ndarray,
+                                 cuts: np.ndarray) -> np.ndarray:
+        """
+        Calcula o ponto que divide a área da curva agregada de cada amostra
+        em duas partes iguais. Os parâmetros são os mesmos do
+        CentroidDefuzzMethod.calculate_centroid_array.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array com o bissetor de cada amostra, ou nan quando a
+            curva agregada é vazia.
+        """
+        x, y, _ = cls.calculate_refined_array(universe, term_mfs, cuts)
+
+        width = np.diff(x, axis=1)
+        accumulated = np.cumsum(width * (y[:, :-1] + y[:, 1:]) / 2, axis=1)
+        half = accumulated[:, -1:] / 2
+
+        # Primeiro segmento em que a área acumulada chega à metade
+        index = np.argmax(accumulated >= half, axis=1)[:, np.newaxis]
+        before = np.where(index > 0,
+                          np.take_along_axis(accumulated,
+                                             np.fmax(index - 1, 0), axis=1),
+                          0.0)
+        area = (half - before)[:, 0]
+
+        x_1 = np.take_along_axis(x, index, axis=1)[:, 0]
+        y_1 = np.take_along_axis(y, index, axis=1)[:, 0]
+        y_2 = np.take_along_axis(y, index + 1, axis=1)[:, 0]
+        dx = np.take_along_axis(width, index, axis=1)[:, 0]
+
+        # No segmento a curva é uma reta: a área a partir de x_1 é uma
+        # equação do segundo grau
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = (y_2 - y_1) / dx
+            root = np.sqrt(np.fmax(y_1 * y_1 + 2 * slope * area, 0.0))
+            result = np.where(y_1 == y_2,
+                              x_1 + area / y_1,
+                              x_1 - (y_1 - root) / slope)
+
+        result[~(half[:, 0] > 0)] = np.nan
+
+        return result
+
+    @classmethod
+    def calculate_maximum_mask(cls,
+                               universe: np.ndarray,
+                               term_mfs: np.ndarray,
+                               cuts: np.ndarray):
+        """
+        Pontos do universo refinado em que a curva agregada é máxima. Com a
+        curva vazia todos os pontos são máximos.
+
+        Retorna
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Retorna os pontos e a máscara dos máximos.
+        """
+        x, y, valid = cls.calculate_refined_array(universe, term_mfs, cuts)
+
+        y = np.where(valid, y, -np.inf)
+        maximum = y.max(axis=1, keepdims=True)
+
+        return x, y == maximum
+
+    @classmethod
+    def calculate_mom_array(cls,
+                            universe: np.ndarray,
+                            term_mfs: np.ndarray,
+                            cuts: np.ndarray) -> np.ndarray:
+        """
+        Calcula a média dos pontos em que a curva agregada de cada amostra é
+        máxima, ou a média do universo quando a curva é vazia.
+        """
+        x, mask = cls.calculate_maximum_mask(universe, term_mfs, cuts)
+
+        return np.where(mask, x, 0.0).sum(axis=1) / mask.sum(axis=1)
+
+    @classmethod
+    def calculate_som_array(cls,
+                            universe: np.ndarray,
+                            term_mfs: np.ndarray,
+                            cuts: np.ndarray) -> np.ndarray:
+        """
+        Calcula o menor ponto em que a curva agregada de cada amostra é
+        máxima, ou o primeiro ponto do universo quando a curva é vazia.
+        """
+        x, mask = cls.calculate_maximum_mask(universe, term_mfs, cuts)
+
+        return np.where(mask, x, np.inf).min(axis=1)
+
+    @classmethod
+    def calculate_lom_array(cls,
+                            universe: np.ndarray,
+                            term_mfs: np.ndarray,
+                            cuts: np.ndarray) -> np.ndarray:
+        """
+        Calcula o maior ponto em que a curva agregada de cada amostra é
+        máxima, ou o último ponto do universo quando a curva é vazia.
+        """
+        x, mask = cls.calculate_maximum_mask(universe, term_mfs, cuts)
+
+        return np.where(mask, x, -np.inf).max(axis=1)
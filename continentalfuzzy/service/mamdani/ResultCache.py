@@ -0,0 +1,166 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+
+class ResultCache:
+    """
+    Cache dos resultados do fuzzy_calc_single_value, com a chave formada
+    pelos valores dos antecedentes quantizados.
+
+    Cada antecedente pode ter uma tolerância: o valor é arredondado para o
+    múltiplo da tolerância mais próximo e o cálculo é feito com o valor
+    arredondado, assim o resultado não depende da ordem em que os valores
+    chegam. Sem tolerância o valor é usado sem arredondamento. O resultado
+    usado há mais tempo é descartado quando o cache passa de max_size
+    resultados.
+
+    Substitui o cache interno do scikit-fuzzy, que guarda o estado de todas
+    as simulações nas variáveis do controlador até o flush.
+    """
+
+    def __init__(self,
+                 max_size: int = 4096,
+                 tolerances: Optional[Dict[str, float]] = None):
+        self.__max_size = None
+        self.__tolerances = dict()
+        self.__cache = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = threading.Lock()
+
+        self.max_size = max_size
+
+        if tolerances is not None:
+            for name, tolerance in tolerances.items():
+                self.set_tolerance(name, tolerance)
+
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        if not isinstance(value, int) or value < 1:
+            raise Exception("O tamanho do cache precisa ser maior que zero!")
+
+        with self.__lock:
+            self.__max_size = value
+            self.evict()
+
+    @property
+    def tolerances(self) -> Dict[str, float]:
+        return dict(self.__tolerances)
+
+    def set_tolerance(self, name: str, tolerance: Optional[float]):
+        """
+        Define a tolerância do antecedente name. Com None o antecedente deixa
+        de ser arredondado. Os resultados guardados são descartados, pois
+        foram calculados com a tolerância anterior.
+        """
+        if tolerance is not None and not tolerance > 0:
+            raise Exception("A tolerância precisa ser maior que zero!")
+
+        if tolerance is None:
+            self.__tolerances.pop(name, None)
+        else:
+            self.__tolerances[name] = float(tolerance)
+
+        self.clear()
+
+    def quantize(self, dict_inputs: Dict[str, float]) \
+            -> Tuple[Tuple, Dict[str, float]]:
+        """
+        Arredonda os valores dos antecedentes para as tolerâncias.
+
+        Parâmetros
+        ----------
+        dict_inputs : Dict[str, float]
+            Dicionário com os valores dos antecedentes.
+
+        Retorna
+        -------
+        Tuple[Tuple, Dict[str, float]]
+            Retorna a chave do cache e o dicionário com os valores usados no
+            cálculo.
+        """
+        key = list()
+        values = dict()
+        for name in sorted(dict_inputs):
+            value = float(dict_inputs[name])
+            tolerance = self.__tolerances.get(name)
+            if tolerance is None:
+                key.append((name, value))
+            else:
+                step = round(value / tolerance)
+                key.append((name, step))
+                value = step * tolerance
+
+            values[name] = value
+
+        return tuple(key), values
+
+    def quantize_array(self, dict_inputs: Dict[str, np.ndarray]) \
+            -> Dict[str, np.ndarray]:
+        """
+        Arredonda arrays de valores dos antecedentes para as tolerâncias, com
+        o mesmo arredondamento do quantize, para o cálculo em lote ter o
+        mesmo resultado do cálculo com o cache.
+        """
+        values = dict()
+        for name, value in dict_inputs.items():
+            tolerance = self.__tolerances.get(name)
+            value = np.asarray(value, dtype=np.float64)
+            if tolerance is not None:
+                value = np.round(value / tolerance) * tolerance
+
+            values[name] = value
+
+        return values
+
+    def evict(self):
+        # Precisa ser chamado com o lock adquirido
+        while len(self.__cache) > self.__max_size:
+            self.__cache.popitem(last=False)
+
+    def get(self, key: Tuple) -> Optional[Dict[str, float]]:
+        """
+        Retorna os consequentes calculados para a chave, ou None quando a
+        chave não está no cache.
+        """
+        with self.__lock:
+            if key in self.__cache:
+                self.__hits += 1
+                self.__cache.move_to_end(key)
+                return self.__cache[key]
+
+            self.__misses += 1
+
+        return None
+
+    def put(self, key: Tuple, outputs: Dict[str, float]):
+        with self.__lock:
+            self.__cache[key] = dict(outputs)
+            self.__cache.move_to_end(key)
+            self.evict()
+
+    def get_cache_info(self) -> Dict[str, float]:
+        with self.__lock:
+            total = self.__hits + self.__misses
+            return {'hits': self.__hits,
+                    'misses': self.__misses,
+                    'size': len(self.__cache),
+                    'hit_rate': self.__hits / total if total else 0.0}
+
+    def clear(self):
+        with self.__lock:
+            self.__cache.clear()
+            self.__hits = 0
+            self.__misses = 0
@@ -0,0 +1,95 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import copy
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Optional
+from skfuzzy import control as ctrl
+
+
+class SimulatorPool:
+    """
+    Conjunto de simuladores do scikit-fuzzy criados a partir de um único
+    ControlSystem.
+
+    O ControlSystemSimulation guarda os valores dos antecedentes e dos
+    consequentes do último cálculo, então cada thread precisa do seu próprio
+    simulador. O scikit-fuzzy separa esse estado pelo id do ControlSystem e
+    pelos valores de entrada, e guarda a entrada 'current' nas próprias
+    variáveis, então dois simuladores do mesmo ControlSystem se misturam.
+    Por isso cada simulador recebe uma cópia do ControlSystem compilado, e os
+    simuladores são reutilizados entre as execuções.
+    """
+
+    def __init__(self,
+                 controller: ctrl.ControlSystem,
+                 max_size: Optional[int] = None):
+        if not isinstance(controller, ctrl.ControlSystem):
+            raise Exception("O valor não é uma instância da classe "
+                            "ControlSystem!")
+
+        if max_size is not None and max_size < 1:
+            raise Exception("O tamanho do pool precisa ser maior que zero!")
+
+        self.__controller = controller
+        self.__max_size = max_size
+        self.__free = queue.LifoQueue()
+        self.__created = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def controller(self) -> ctrl.ControlSystem:
+        return self.__controller
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """
+        Quantidade máxima de simuladores. Com None o pool cria um simulador
+        para cada thread que pedir um ao mesmo tempo.
+        """
+        return self.__max_size
+
+    @property
+    def created(self) -> int:
+        return self.__created
+
+    def get_simulator(self) -> ctrl.ControlSystemSimulation:
+        """
+        Retira um simulador do pool, criando um novo quando nenhum está
+        livre. Quando o pool está cheio espera um simulador ser devolvido.
+        """
+        try:
+            return self.__free.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self.__lock:
+            create = self.__max_size is None or \
+                self.__created < self.__max_size
+            if create:
+                self.__created += 1
+
+        if create:
+            return ctrl.ControlSystemSimulation(
+                copy.deepcopy(self.__controller), cache=False)
+
+        return self.__free.get()
+
+    def release_simulator(self, simulator: ctrl.ControlSystemSimulation):
+        self.__free.put(simulator)
+
+    @contextmanager
+    def simulator(self):
+        """
+        Empresta um simulador durante o bloco with.
+        """
+        simulator = self.get_simulator()
+        try:
+            yield simulator
+        finally:
+            self.release_simulator(simulator)
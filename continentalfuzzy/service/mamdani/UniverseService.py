@@ -0,0 +1,251 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+from continentalfuzzy.domain.MembershipFunction import MembershipFunction
+from continentalfuzzy.domain.definition.Functions import Functions
+from continentalfuzzy.domain.definition.mamdani.UniverseModes import \
+    UniverseModes
+from continentalfuzzy.domain.mamdani.UniverseResolution import \
+    UniverseResolution
+from continentalfuzzy.service.mamdani.CentroidDefuzzMethod import \
+    CentroidDefuzzMethod
+from continentalfuzzy.util.FuzzyUtil import FuzzyUtil
+
+
+class UniverseService:
+    """
+    Cria os universos das variáveis Mamdani de acordo com a política de
+    resolução do controlador.
+
+    Os universos ficam em cache, com a chave formada pelo range, pelas
+    funções de pertinência, pelo tipo da variável e pela política, assim as
+    variáveis iguais de vários controladores (e o controlador do
+    scikit-fuzzy e o motor vetorizado do mesmo controlador) usam o mesmo
+    array, que é somente leitura.
+    """
+
+    # Quantidade máxima de universos no cache. O universo usado há mais tempo
+    # é descartado primeiro
+    CACHE_SIZE = 256
+
+    # Quantidade de pontos inicial e máxima do modo adaptativo. Os universos
+    # de cada passo contêm os pontos do passo anterior
+    ADAPTIVE_INITIAL_POINTS = 17
+    ADAPTIVE_MAX_POINTS = 2 ** 14 + 1
+
+    # Dicionário com os parâmetros de cada função de pertinência, usados na
+    # chave do cache
+    DICT_MF_PARAMETERS = {
+        Functions.trimf: lambda f_mf: tuple(f_mf.abc),
+        Functions.trapmf: lambda f_mf: tuple(f_mf.abcd),
+        Functions.gaussmf: lambda f_mf: (f_mf.sigma, f_mf.mean),
+        Functions.gauss2mf: lambda f_mf: (f_mf.sigma1, f_mf.mean1,
+                                          f_mf.sigma2, f_mf.mean2)}
+
+    __cache = OrderedDict()
+    __hits = 0
+    __misses = 0
+    __lock = threading.Lock()
+
+    @classmethod
+    def get_mf_key(cls, f_mf: MembershipFunction) -> Tuple:
+        if f_mf.function not in cls.DICT_MF_PARAMETERS:
+            raise Exception("Função de pertinência não implementada!")
+
+        return (f_mf.function.name,
+                tuple(float(value) for value in
+                      cls.DICT_MF_PARAMETERS[f_mf.function](f_mf)))
+
+    @classmethod
+    def get_universe(cls,
+                     u_range: List[float],
+                     mfs: Dict[int, MembershipFunction],
+                     resolution: UniverseResolution,
+                     is_output: bool = False) -> np.ndarray:
+        """
+        Retorna o universo da variável, usando o cache quando a mesma
+        definição já foi criada.
+
+        Parâmetros
+        ----------
+        u_range : List[float]
+            Range da variável.
+
+        mfs : Dict[int, MembershipFunction]
+            Dicionário com as funções de pertinência da variável.
+
+        resolution : UniverseResolution
+            Política de resolução do universo.
+
+        is_output : bool
+            Indica se a variável é um consequente, o que define o erro usado
+            pelo modo adaptativo.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna uma numpy array somente leitura com o universo.
+        """
+        if not isinstance(resolution, UniverseResolution):
+            raise Exception("O valor não é uma instância da classe "
+                            "UniverseResolution!")
+
+        key = (tuple(float(value) for value in u_range),
+               tuple(cls.get_mf_key(f_mf) for f_mf in mfs.values()),
+               bool(is_output) and
+               resolution.mode == UniverseModes.adaptive,
+               resolution.key)
+
+        with cls.__lock:
+            if key in cls.__cache:
+                cls.__hits += 1
+                cls.__cache.move_to_end(key)
+                return cls.__cache[key]
+
+            cls.__misses += 1
+
+        # O universo é criado fora do lock, assim o modo adaptativo de uma
+        # variável não bloqueia as outras
+        universe = cls.create_universe(u_range, mfs, resolution, is_output)
+        universe.setflags(write=False)
+
+        with cls.__lock:
+            universe = cls.__cache.setdefault(key, universe)
+            cls.__cache.move_to_end(key)
+            while len(cls.__cache) > cls.CACHE_SIZE:
+                cls.__cache.popitem(last=False)
+
+        return universe
+
+    @classmethod
+    def create_universe(cls,
+                        u_range: List[float],
+                        mfs: Dict[int, MembershipFunction],
+                        resolution: UniverseResolution,
+                        is_output: bool = False) -> np.ndarray:
+        """
+        Cria o universo da variável sem usar o cache.
+        """
+        if resolution.mode == UniverseModes.default:
+            return FuzzyUtil.create_universe(u_range, mfs)
+
+        elif resolution.mode == UniverseModes.fixed:
+            if resolution.num_points is None:
+                raise Exception("O número de pontos não foi informado!")
+
+            return FuzzyUtil.create_universe_fixed(u_range, mfs,
+                                                   resolution.num_points)
+
+        if resolution.tolerance is None:
+            raise Exception("A tolerância não foi informada!")
+
+        return cls.create_adaptive_universe(u_range, mfs,
+                                            resolution.tolerance, is_output)
+
+    @classmethod
+    def create_adaptive_universe(cls,
+                                 u_range: List[float],
+                                 mfs: Dict[int, MembershipFunction],
+                                 tolerance: float,
+                                 is_output: bool = False) -> np.ndarray:
+        """
+        Dobra a quantidade de pontos do universo até o erro relativo ficar
+        abaixo da tolerância ou até ADAPTIVE_MAX_POINTS.
+
+        Nos consequentes o erro é estimado pela variação dos centroides de
+        referência (calc_probe_centroids) entre dois passos, dividida pela
+        largura do range. Nos antecedentes o erro é a maior diferença entre a
+        curva de pertinência e a sua interpolação linear no meio de cada
+        intervalo do universo.
+        """
+        width = float(u_range[1] - u_range[0])
+        num_points = cls.ADAPTIVE_INITIAL_POINTS
+        universe = FuzzyUtil.create_universe_fixed(u_range, mfs, num_points)
+
+        if is_output:
+            previous = cls.calc_probe_centroids(universe, mfs)
+
+        while num_points < cls.ADAPTIVE_MAX_POINTS:
+            if not is_output and \
+                    cls.calc_membership_error(universe, mfs) <= tolerance:
+                break
+
+            num_points = 2 * (num_points - 1) + 1
+            universe = FuzzyUtil.create_universe_fixed(u_range, mfs,
+                                                       num_points)
+
+            if is_output:
+                current = cls.calc_probe_centroids(universe, mfs)
+                difference = np.abs(current - previous)
+                if width <= 0 or np.all(np.isnan(difference)) or \
+                        np.nanmax(difference) / width <= tolerance:
+                    break
+                previous = current
+
+        return universe
+
+    @staticmethod
+    def calc_membership_error(universe: np.ndarray,
+                              mfs: Dict[int, MembershipFunction]) -> float:
+        """
+        Maior erro da interpolação linear das curvas de pertinência no meio
+        dos intervalos do universo. As triangulares e as trapezoidais são
+        exatas, pois os seus vértices fazem parte do universo (e os degraus
+        das trapezoidais com lados verticais não diminuem com mais pontos).
+        """
+        if universe.shape[0] < 2:
+            return 0.0
+
+        middle = (universe[:-1] + universe[1:]) / 2
+        error = 0.0
+        for f_mf in mfs.values():
+            if f_mf.function in (Functions.trimf, Functions.trapmf):
+                continue
+
+            values = FuzzyUtil.membership_function(mf=f_mf, univ=universe)
+            exact = FuzzyUtil.membership_function(mf=f_mf, univ=middle)
+            error = max(error, float(np.max(np.abs(
+                (values[:-1] + values[1:]) / 2 - exact))))
+
+        return error
+
+    @staticmethod
+    def calc_probe_centroids(universe: np.ndarray,
+                             mfs: Dict[int, MembershipFunction]) -> np.ndarray:
+        """
+        Centroides de referência do consequente: cada função de pertinência
+        sozinha com corte 1 e 0.5, e todas juntas com corte 0.5.
+        """
+        term_mfs = np.array([FuzzyUtil.membership_function(mf=f_mf,
+                                                           univ=universe)
+                             for f_mf in mfs.values()], dtype=np.float64)
+        num_mfs = term_mfs.shape[0]
+
+        cuts = np.concatenate((np.eye(num_mfs),
+                               np.eye(num_mfs) * 0.5,
+                               np.full((num_mfs, 1), 0.5)), axis=1)
+
+        return CentroidDefuzzMethod.calculate_centroid_array(universe,
+                                                             term_mfs,
+                                                             cuts)
+
+    @classmethod
+    def get_cache_info(cls) -> Dict[str, int]:
+        with cls.__lock:
+            return {'hits': cls.__hits,
+                    'misses': cls.__misses,
+                    'size': len(cls.__cache)}
+
+    @classmethod
+    def clear_cache(cls):
+        with cls.__lock:
+            cls.__cache.clear()
+            cls.__hits = 0
+            cls.__misses = 0
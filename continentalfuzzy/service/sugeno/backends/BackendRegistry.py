@@ -0,0 +1,165 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import importlib
+import os
+import warnings
+from typing import Dict, List, Optional
+
+
+class BackendRegistry:
+    """
+    Registro dos backends dos kernels das funções de pertinência e dos
+    operadores.
+
+    O backend pode ser escolhido pelo método set_backend ou pela variável de
+    ambiente CONTINENTALFUZZY_BACKEND. Sem escolha (ou com o valor 'auto') é
+    usado o primeiro backend disponível de AUTO_ORDER, assim o NumPy é usado
+    automaticamente quando o módulo compilado não existe.
+    """
+    ENV_VAR = 'CONTINENTALFUZZY_BACKEND'
+
+    AUTO = 'auto'
+
+    # Dicionário com o módulo de cada backend. A classe do backend tem o mesmo
+    # nome do módulo
+    DICT_BACKENDS = {
+        'numpy': 'continentalfuzzy.service.sugeno.backends.NumpyBackend',
+        'cython': 'continentalfuzzy.service.sugeno.backends.CythonBackend',
+        'numba': 'continentalfuzzy.service.sugeno.backends.NumbaBackend'}
+
+    # Ordem de preferência do modo automático. O Numba só é usado quando for
+    # escolhido, pois a primeira chamada de cada kernel inclui a compilação
+    AUTO_ORDER = ['cython', 'numpy']
+
+    __backend = None
+    __requested = None
+
+    @classmethod
+    def load_backend(cls, p_name: str):
+        """
+        Carrega a classe do backend.
+
+        Parâmetros
+        ----------
+        p_name : str
+            Nome do backend.
+
+        Retorna
+        -------
+        type
+            Retorna a classe do backend. Gera ImportError quando o backend
+            não está disponível.
+        """
+        if p_name not in cls.DICT_BACKENDS:
+            raise Exception(f"O backend {p_name} não existe!")
+
+        module_name = cls.DICT_BACKENDS[p_name]
+        module = importlib.import_module(module_name)
+
+        return getattr(module, module_name.rsplit('.', 1)[-1])
+
+    @classmethod
+    def is_available(cls, p_name: str) -> bool:
+        try:
+            cls.load_backend(p_name)
+        except ImportError:
+            return False
+
+        return True
+
+    @classmethod
+    def available_backends(cls) -> List[str]:
+        return [name for name in cls.DICT_BACKENDS if cls.is_available(name)]
+
+    @classmethod
+    def set_backend(cls, p_name: Optional[str] = None):
+        """
+        Escolhe o backend ativo.
+
+        Parâmetros
+        ----------
+        p_name : Optional[str]
+            Nome do backend ou 'auto'. Quando não informado é usado o valor da
+            variável de ambiente CONTINENTALFUZZY_BACKEND. Um backend escolhido
+            por este parâmetro precisa existir e estar disponível; um backend
+            escolhido pela variável de ambiente que não existe ou não está
+            disponível é trocado pelo modo automático com um aviso.
+
+        Retorna
+        -------
+        type
+            Retorna a classe do backend ativo.
+        """
+        from_env = p_name is None
+        if from_env:
+            p_name = os.environ.get(cls.ENV_VAR, cls.AUTO) or cls.AUTO
+
+        p_name = p_name.strip().lower()
+        cls.__requested = p_name
+
+        if from_env and p_name != cls.AUTO and \
+                p_name not in cls.DICT_BACKENDS:
+            warnings.warn(f"O backend {p_name} não existe, usando o modo "
+                          f"automático!")
+            p_name = cls.AUTO
+
+        if p_name != cls.AUTO:
+            try:
+                cls.__backend = cls.load_backend(p_name)
+                return cls.__backend
+
+            except ImportError as exc:
+                if not from_env:
+                    raise Exception(
+                        f"O backend {p_name} não está disponível!") from exc
+
+                warnings.warn(f"O backend {p_name} não está disponível, "
+                              f"usando o modo automático!")
+
+        for name in cls.AUTO_ORDER:
+            try:
+                cls.__backend = cls.load_backend(name)
+                return cls.__backend
+
+            except ImportError:
+                continue
+
+        raise Exception("Nenhum backend disponível!")
+
+    @classmethod
+    def get_backend(cls):
+        """
+        Retorna a classe do backend ativo, escolhendo o backend pela variável
+        de ambiente na primeira chamada.
+        """
+        if cls.__backend is None:
+            cls.set_backend()
+
+        return cls.__backend
+
+    @classmethod
+    def get_backend_name(cls) -> str:
+        return cls.get_backend().NAME
+
+    @classmethod
+    def get_backend_report(cls) -> Dict:
+        """
+        Retorna um dicionário com o backend ativo, o backend pedido e os
+        backends disponíveis.
+        """
+        return {'active': cls.get_backend_name(),
+                'requested': cls.__requested,
+                'available': cls.available_backends()}
+
+    @classmethod
+    def reset(cls):
+        """
+        Descarta o backend ativo. A próxima chamada de get_backend volta a ler
+        a variável de ambiente.
+        """
+        cls.__backend = None
+        cls.__requested = None
@@ -0,0 +1,48 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import numpy as np
+from continentalfuzzy.service.sugeno.backends.NumpyBackend import NumpyBackend
+from continentalfuzzy.service.sugeno.membership_functions.membership_functions import \
+    c_calculate_gaussmf, c_calculate_trimf, c_calculate_trapmf, \
+    c_calculate_gauss2mf, c_calculate_gaussmf_array, c_calculate_trimf_array, \
+    c_calculate_trapmf_array, c_calculate_gauss2mf_array, \
+    c_calculate_linear_array, c_calculate_constant_array, \
+    c_calculate_probor_array
+
+
+class CythonBackend(NumpyBackend):
+    """
+    Kernels compilados do módulo membership_functions. A importação deste
+    módulo falha quando a extensão não foi compilada (ver setup.py).
+
+    Os métodos AND min/prod e OR max continuam usando as reduções do NumPy,
+    que já são nativas e não precisam copiar os graus.
+    """
+    NAME = 'cython'
+
+    calculate_gaussmf = staticmethod(c_calculate_gaussmf)
+    calculate_trimf = staticmethod(c_calculate_trimf)
+    calculate_trapmf = staticmethod(c_calculate_trapmf)
+    calculate_gauss2mf = staticmethod(c_calculate_gauss2mf)
+    calculate_gaussmf_array = staticmethod(c_calculate_gaussmf_array)
+    calculate_trimf_array = staticmethod(c_calculate_trimf_array)
+    calculate_trapmf_array = staticmethod(c_calculate_trapmf_array)
+    calculate_gauss2mf_array = staticmethod(c_calculate_gauss2mf_array)
+    calculate_linear_array = staticmethod(c_calculate_linear_array)
+    calculate_constant_array = staticmethod(c_calculate_constant_array)
+
+    @staticmethod
+    def calculate_probor_or_array(degrees: np.ndarray, axis: int = 0):
+        degrees = np.moveaxis(np.asarray(degrees, dtype=np.float64), axis, 0)
+        shape = degrees.shape[1:]
+
+        result = np.empty(int(np.prod(shape)), dtype=np.float64)
+        c_calculate_probor_array(
+            np.ascontiguousarray(degrees.reshape((degrees.shape[0], -1))),
+            result)
+
+        return result.reshape(shape)
@@ -0,0 +1,128 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import math
+import numpy as np
+from numba import njit
+from continentalfuzzy.service.sugeno.backends.NumpyBackend import NumpyBackend
+
+
+@njit(cache=True)
+def _gaussmf(x, mean, sigma):
+    return math.exp(-((x - mean) * (x - mean)) / (2.0 * sigma * sigma))
+
+
+@njit(cache=True)
+def _trimf(x, a, b, c):
+    if a == b and b == c and c == x:
+        return 1.0
+    elif a < x <= b:
+        return (x - a) / (b - a)
+    elif b < x < c:
+        return (c - x) / (c - b)
+    return 0.0
+
+
+@njit(cache=True)
+def _trapmf(x, a, b, c, d):
+    if b <= x <= c:
+        return 1.0
+    elif a < x < b:
+        return (x - a) / (b - a)
+    elif c < x < d:
+        return (d - x) / (d - c)
+    return 0.0
+
+
+@njit(cache=True)
+def _gauss2mf(x, mean1, sigma1, mean2, sigma2):
+    if mean1 <= x <= mean2:
+        return 1.0
+
+    left_gauss = 1.0
+    right_gauss = 1.0
+
+    if x < mean1:
+        left_gauss = _gaussmf(x, mean1, sigma1)
+
+    if x > mean2:
+        right_gauss = _gaussmf(x, mean2, sigma2)
+
+    return left_gauss * right_gauss
+
+
+@njit(cache=True)
+def _gaussmf_array(x, mean, sigma, out):
+    for i in range(x.shape[0]):
+        out[i] = _gaussmf(x[i], mean, sigma)
+
+
+@njit(cache=True)
+def _trimf_array(x, a, b, c, out):
+    for i in range(x.shape[0]):
+        out[i] = _trimf(x[i], a, b, c)
+
+
+@njit(cache=True)
+def _trapmf_array(x, a, b, c, d, out):
+    for i in range(x.shape[0]):
+        out[i] = _trapmf(x[i], a, b, c, d)
+
+
+@njit(cache=True)
+def _gauss2mf_array(x, mean1, sigma1, mean2, sigma2, out):
+    for i in range(x.shape[0]):
+        out[i] = _gauss2mf(x[i], mean1, sigma1, mean2, sigma2)
+
+
+@njit(cache=True)
+def _linear_array(x, coefficients, out):
+    num_inputs = x.shape[0]
+    for j in range(x.shape[1]):
+        result = 0.0
+        for i in range(num_inputs):
+            result += coefficients[i] * x[i, j]
+        out[j] = result + coefficients[num_inputs]
+
+
+@njit(cache=True)
+def _probor_array(degrees, out):
+    for j in range(degrees.shape[1]):
+        result = degrees[0, j]
+        for i in range(1, degrees.shape[0]):
+            result = (result + degrees[i, j]) - (result * degrees[i, j])
+        out[j] = result
+
+
+class NumbaBackend(NumpyBackend):
+    """
+    Kernels compilados sob demanda pelo Numba. Só está disponível quando o
+    pacote numba está instalado. A primeira chamada de cada kernel inclui o
+    tempo de compilação.
+    """
+    NAME = 'numba'
+
+    calculate_gaussmf = staticmethod(_gaussmf)
+    calculate_trimf = staticmethod(_trimf)
+    calculate_trapmf = staticmethod(_trapmf)
+    calculate_gauss2mf = staticmethod(_gauss2mf)
+    calculate_gaussmf_array = staticmethod(_gaussmf_array)
+    calculate_trimf_array = staticmethod(_trimf_array)
+    calculate_trapmf_array = staticmethod(_trapmf_array)
+    calculate_gauss2mf_array = staticmethod(_gauss2mf_array)
+    calculate_linear_array = staticmethod(_linear_array)
+
+    @staticmethod
+    def calculate_probor_or_array(degrees: np.ndarray, axis: int = 0):
+        degrees = np.moveaxis(np.asarray(degrees, dtype=np.float64), axis, 0)
+        shape = degrees.shape[1:]
+
+        result = np.empty(int(np.prod(shape)), dtype=np.float64)
+        _probor_array(
+            np.ascontiguousarray(degrees.reshape((degrees.shape[0], -1))),
+            result)
+
+        return result.reshape(shape)
@@ -0,0 +1,143 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import numpy as np
+
+
+class NumpyBackend:
+    """
+    Kernels das funções de pertinência e dos operadores escritos em Python e
+    NumPy. Não depende de nenhum módulo compilado e é usado quando os demais
+    backends não estão disponíveis.
+
+    As funções de array recebem arrays contíguos de uma dimensão e escrevem o
+    resultado no array out. A validação dos parâmetros é feita pelas classes
+    das funções de pertinência.
+    """
+    NAME = 'numpy'
+
+    @staticmethod
+    def calculate_gaussmf(x: float, mean: float, sigma: float) -> float:
+        return float(np.exp(-((x - mean) * (x - mean)) /
+                            (2.0 * sigma * sigma)))
+
+    @staticmethod
+    def calculate_trimf(x: float, a: float, b: float, c: float) -> float:
+        if a == b == c == x:
+            return 1.0
+        elif a < x <= b:
+            return (x - a) / (b - a)
+        elif b < x < c:
+            return (c - x) / (c - b)
+
+        return 0.0
+
+    @staticmethod
+    def calculate_trapmf(x: float, a: float, b: float, c: float,
+                         d: float) -> float:
+        if b <= x <= c:
+            return 1.0
+        elif a < x < b:
+            return (x - a) / (b - a)
+        elif c < x < d:
+            return (d - x) / (d - c)
+
+        return 0.0
+
+    @classmethod
+    def calculate_gauss2mf(cls, x: float, mean1: float, sigma1: float,
+                           mean2: float, sigma2: float) -> float:
+        if mean1 <= x <= mean2:
+            return 1.0
+
+        left_gauss = 1.0
+        right_gauss = 1.0
+
+        if x < mean1:
+            left_gauss = cls.calculate_gaussmf(x, mean1, sigma1)
+
+        if x > mean2:
+            right_gauss = cls.calculate_gaussmf(x, mean2, sigma2)
+
+        return left_gauss * right_gauss
+
+    @staticmethod
+    def calculate_gaussmf_array(x: np.ndarray, mean: float, sigma: float,
+                                out: np.ndarray):
+        np.exp(-((x - mean) * (x - mean)) / (2.0 * sigma * sigma), out=out)
+
+    @staticmethod
+    def calculate_trimf_array(x: np.ndarray, a: float, b: float, c: float,
+                              out: np.ndarray):
+        out[:] = 0.0
+        if a == b == c:
+            out[x == a] = 1.0
+            return
+
+        rising = (a < x) & (x <= b)
+        out[rising] = (x[rising] - a) / (b - a)
+
+        falling = (b < x) & (x < c)
+        out[falling] = (c - x[falling]) / (c - b)
+
+    @staticmethod
+    def calculate_trapmf_array(x: np.ndarray, a: float, b: float, c: float,
+                               d: float, out: np.ndarray):
+        out[:] = 0.0
+        out[(b <= x) & (x <= c)] = 1.0
+
+        rising = (a < x) & (x < b)
+        out[rising] = (x[rising] - a) / (b - a)
+
+        falling = (c < x) & (x < d)
+        out[falling] = (d - x[falling]) / (d - c)
+
+    @classmethod
+    def calculate_gauss2mf_array(cls, x: np.ndarray, mean1: float,
+                                 sigma1: float, mean2: float, sigma2: float,
+                                 out: np.ndarray):
+        out[:] = 1.0
+
+        left = x < mean1
+        out[left] = np.exp(-((x[left] - mean1) * (x[left] - mean1)) /
+                           (2.0 * sigma1 * sigma1))
+
+        right = x > mean2
+        out[right] *= np.exp(-((x[right] - mean2) * (x[right] - mean2)) /
+                             (2.0 * sigma2 * sigma2))
+
+    @staticmethod
+    def calculate_linear_array(x_array: np.ndarray, coefficients: np.ndarray,
+                               out: np.ndarray):
+        out[:] = 0.0
+        for num_input, values in enumerate(x_array):
+            out += coefficients[num_input] * values
+        out += coefficients[-1]
+
+    @staticmethod
+    def calculate_constant_array(value: float, out: np.ndarray):
+        out[:] = value
+
+    @staticmethod
+    def calculate_min_and_array(degrees: np.ndarray, axis: int = 0):
+        return np.minimum.reduce(degrees, axis=axis)
+
+    @staticmethod
+    def calculate_prod_and_array(degrees: np.ndarray, axis: int = 0):
+        return np.multiply.reduce(degrees, axis=axis)
+
+    @staticmethod
+    def calculate_max_or_array(degrees: np.ndarray, axis: int = 0):
+        return np.maximum.reduce(degrees, axis=axis)
+
+    @staticmethod
+    def calculate_probor_or_array(degrees: np.ndarray, axis: int = 0):
+        degrees = np.moveaxis(np.asarray(degrees), axis, 0)
+        final_result = degrees[0]
+        for result in degrees[1:]:
+            final_result = (final_result + result) - (final_result * result)
+
+        return final_result
@@ -0,0 +1,56 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+from math import exp
+import numpy as np
+from continentalfuzzy.domain.membership_function.Gauss2MF import Gauss2MF
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
+
+
+class Gauss2MFEvaluator:
+    """
+    Avaliador da função de pertinência de duas gaussianas combinadas. Os
+    fatores -1/(2 sigma²) de cada gaussiana são calculados uma única vez.
+    """
+    __slots__ = ('mean1', 'sigma1', 'factor1', 'mean2', 'sigma2', 'factor2')
+
+    def __init__(self, p_mf: Gauss2MF):
+        if not isinstance(p_mf, Gauss2MF):
+            raise Exception("O valor não é uma instância da classe Gauss2MF!")
+
+        if not p_mf.sigma1 or not p_mf.sigma2:
+            raise Exception("O desvio padrão não pode ser zero!")
+
+        self.mean1 = p_mf.mean1
+        self.sigma1 = p_mf.sigma1
+        self.factor1 = -1.0 / (2.0 * p_mf.sigma1 * p_mf.sigma1)
+        self.mean2 = p_mf.mean2
+        self.sigma2 = p_mf.sigma2
+        self.factor2 = -1.0 / (2.0 * p_mf.sigma2 * p_mf.sigma2)
+
+    def __call__(self, x: float) -> float:
+        if x < self.mean1:
+            left_gauss = exp((x - self.mean1) * (x - self.mean1) *
+                             self.factor1)
+            if x > self.mean2:
+                return left_gauss * exp((x - self.mean2) * (x - self.mean2) *
+                                        self.factor2)
+            return left_gauss
+        elif x > self.mean2:
+            return exp((x - self.mean2) * (x - self.mean2) * self.factor2)
+
+        return 1.0
+
+    def calculate_array(self, x: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        Calcula o grau de pertinência de um array contíguo de uma dimensão,
+        escrevendo o resultado em out.
+        """
+        BackendRegistry.get_backend().calculate_gauss2mf_array(
+            x, self.mean1, self.sigma1, self.mean2, self.sigma2, out)
+
+        return out
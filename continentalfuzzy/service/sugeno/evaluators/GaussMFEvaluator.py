@@ -0,0 +1,43 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+from math import exp
+import numpy as np
+from continentalfuzzy.domain.membership_function.GaussMF import GaussMF
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
+
+
+class GaussMFEvaluator:
+    """
+    Avaliador da função de pertinência gaussiana. O fator -1/(2 sigma²) é
+    calculado uma única vez.
+    """
+    __slots__ = ('mean', 'sigma', 'factor')
+
+    def __init__(self, p_mf: GaussMF):
+        if not isinstance(p_mf, GaussMF):
+            raise Exception("O valor não é uma instância da classe GaussMF!")
+
+        if not p_mf.sigma:
+            raise Exception("O desvio padrão não pode ser zero!")
+
+        self.mean = p_mf.mean
+        self.sigma = p_mf.sigma
+        self.factor = -1.0 / (2.0 * p_mf.sigma * p_mf.sigma)
+
+    def __call__(self, x: float) -> float:
+        return exp((x - self.mean) * (x - self.mean) * self.factor)
+
+    def calculate_array(self, x: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        Calcula o grau de pertinência de um array contíguo de uma dimensão,
+        escrevendo o resultado em out.
+        """
+        BackendRegistry.get_backend().calculate_gaussmf_array(
+            x, self.mean, self.sigma, out)
+
+        return out
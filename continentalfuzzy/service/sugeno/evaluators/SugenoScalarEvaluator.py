@@ -0,0 +1,160 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+from typing import Dict
+from continentalfuzzy.domain.definition.AndMethods import AndMethods
+from continentalfuzzy.domain.definition.DefuzzMethods import DefuzzMethods
+from continentalfuzzy.domain.definition.OrMethods import OrMethods
+from continentalfuzzy.domain.sugeno.SugenoCompiledRules import \
+    SugenoCompiledRules
+
+
+class SugenoScalarEvaluator:
+    """
+    Avaliador Sugeno de uma única amostra. Calcula o disparo, o consequente e
+    a média ponderada de cada regra em uma única passagem sobre listas
+    montadas a partir da base de regras compilada, sem criar arrays e sem
+    remontar a lista de pesos a cada chamada.
+
+    Cada avaliador calcula um consequente. As regras sem este consequente
+    (0 no arquivo .fis, output_mask) não participam da soma, como no cálculo
+    em lote.
+    """
+    __slots__ = ('input_names', 'mf_terms', 'terms', 'rules',
+                 'linear', 'and_prod', 'or_probor', 'defuzz_method')
+
+    def __init__(self,
+                 p_compiled: SugenoCompiledRules,
+                 p_and_method: AndMethods,
+                 p_or_method: OrMethods,
+                 p_defuzz_method: DefuzzMethods,
+                 p_num_output: int = 0):
+        if not isinstance(p_compiled, SugenoCompiledRules):
+            raise Exception("O valor não é uma instância da classe "
+                            "SugenoCompiledRules!")
+
+        if not 0 <= p_num_output < p_compiled.num_outputs:
+            raise Exception("O consequente não existe!")
+
+        for num_input, num_mf in p_compiled.mf_terms.tolist():
+            if p_compiled.input_mfs[num_input][num_mf].get('evaluator') is None:
+                raise Exception("Uma das funções de pertinência não possui "
+                                "avaliador!")
+
+        self.input_names = tuple(p_compiled.input_names)
+        self.mf_terms = tuple(
+            (num_input, p_compiled.input_mfs[num_input][num_mf]['evaluator'])
+            for num_input, num_mf in p_compiled.mf_terms.tolist())
+        self.terms = tuple(zip(p_compiled.term_mf.tolist(),
+                               p_compiled.term_not.tolist()))
+
+        # Cada regra é representada por (primeiro termo, demais termos, OR,
+        # peso, coeficientes, termo constante)
+        coefficients = p_compiled.output_coefficients[p_num_output].tolist()
+        self.rules = tuple(
+            (terms[0], tuple(terms[1:]), rule_or, weight,
+             tuple(rule_coefficients[:-1]), rule_coefficients[-1])
+            for terms, rule_or, weight, rule_coefficients, rule_output in
+            zip(p_compiled.rule_terms, p_compiled.or_mask.tolist(),
+                p_compiled.weights.tolist(), coefficients,
+                p_compiled.output_mask[p_num_output].tolist())
+            if rule_output)
+        self.linear = not p_compiled.constant_consequents
+
+        self.and_prod = p_and_method == AndMethods.prod
+        self.or_probor = p_or_method == OrMethods.probor
+        self.defuzz_method = p_defuzz_method
+
+    def __call__(self, v_inputs: Dict[str, float]) -> float:
+        """
+        Calcula o consequente Sugeno de uma amostra.
+
+        Parâmetros
+        ----------
+        v_inputs : Dict[str, float]
+            Dicionário com as chaves sendo o nome dos antecedentes e os
+            valores sendo números float.
+
+        Retorna
+        -------
+        float
+            Retorna o resultado da defuzzificação, nan quando nenhuma regra
+            dispara na média ponderada, ou -1 quando o método de
+            defuzzificação não é wtaver nem wtsum.
+        """
+        if self.defuzz_method == DefuzzMethods.wtaver:
+            wtaver = True
+        elif self.defuzz_method == DefuzzMethods.wtsum:
+            wtaver = False
+        else:
+            return -1
+
+        # As listas são locais: o avaliador é compartilhado pelas threads que
+        # usam o mesmo controlador
+        values = list()
+        for name in self.input_names:
+            try:
+                values.append(v_inputs[name])
+            except KeyError:
+                raise Exception(f"O antecedente {name} não foi informado!")
+
+        mf_degrees = [evaluator(values[num_input])
+                      for num_input, evaluator in self.mf_terms]
+
+        term_degrees = [1 - mf_degrees[num_mf] if var_not
+                        else mf_degrees[num_mf]
+                        for num_mf, var_not in self.terms]
+
+        and_prod = self.and_prod
+        or_probor = self.or_probor
+        linear = self.linear
+
+        numerator = 0.0
+        denominator = 0.0
+        for first_term, other_terms, rule_or, weight, coefficients, \
+                constant in self.rules:
+            firing = term_degrees[first_term]
+            if rule_or:
+                for term in other_terms:
+                    degree = term_degrees[term]
+                    if or_probor:
+                        firing = (firing + degree) - (firing * degree)
+                    elif degree > firing:
+                        firing = degree
+            else:
+                # O AND min/prod termina no primeiro grau zero
+                for term in other_terms:
+                    if firing == 0:
+                        break
+                    degree = term_degrees[term]
+                    if and_prod:
+                        firing *= degree
+                    elif firing > degree:
+                        firing = degree
+
+            # Regras que não disparam não contribuem para a soma
+            if firing == 0:
+                continue
+
+            if linear:
+                output_level = 0.0
+                for coefficient, value in zip(coefficients, values):
+                    output_level += coefficient * value
+                output_level += constant
+            else:
+                output_level = constant
+
+            firing *= weight
+            numerator += firing * output_level
+            denominator += firing
+
+        if not wtaver:
+            return numerator
+
+        if denominator == 0:
+            return float('nan')
+
+        return numerator / denominator
@@ -0,0 +1,54 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import numpy as np
+from continentalfuzzy.domain.membership_function.TrapMF import TrapMF
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
+
+
+class TrapMFEvaluator:
+    """
+    Avaliador da função de pertinência trapezoidal. Os parâmetros são
+    validados uma única vez e as inclinações são guardadas como recíprocos.
+    """
+    __slots__ = ('a', 'b', 'c', 'd', 'inv_left', 'inv_right')
+
+    def __init__(self, p_mf: TrapMF):
+        if not isinstance(p_mf, TrapMF):
+            raise Exception("O valor não é uma instância da classe TrapMF!")
+
+        a, b, c, d = p_mf.abcd
+
+        if (a > b) or (b > c) or (c > d):
+            raise Exception("Os parâmetros não estão em ordem crescente!")
+
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+        self.inv_left = 1.0 / (b - a) if b > a else 0.0
+        self.inv_right = 1.0 / (d - c) if d > c else 0.0
+
+    def __call__(self, x: float) -> float:
+        if self.b <= x <= self.c:
+            return 1.0
+        elif self.a < x < self.b:
+            return (x - self.a) * self.inv_left
+        elif self.c < x < self.d:
+            return (self.d - x) * self.inv_right
+
+        return 0.0
+
+    def calculate_array(self, x: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        Calcula o grau de pertinência de um array contíguo de uma dimensão,
+        escrevendo o resultado em out.
+        """
+        BackendRegistry.get_backend().calculate_trapmf_array(
+            x, self.a, self.b, self.c, self.d, out)
+
+        return out
@@ -0,0 +1,55 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import numpy as np
+from continentalfuzzy.domain.membership_function.TriMF import TriMF
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
+
+
+class TriMFEvaluator:
+    """
+    Avaliador da função de pertinência triangular. Os parâmetros são
+    validados uma única vez e as inclinações são guardadas como recíprocos,
+    assim cada chamada faz apenas comparações e operações com números float.
+    """
+    __slots__ = ('a', 'b', 'c', 'inv_left', 'inv_right', 'degenerate')
+
+    def __init__(self, p_mf: TriMF):
+        if not isinstance(p_mf, TriMF):
+            raise Exception("O valor não é uma instância da classe TriMF!")
+
+        a, b, c = p_mf.abc
+
+        if (a > b) or (b > c):
+            raise Exception("Os parâmetros não estão em ordem crescente!")
+
+        self.a = a
+        self.b = b
+        self.c = c
+        self.inv_left = 1.0 / (b - a) if b > a else 0.0
+        self.inv_right = 1.0 / (c - b) if c > b else 0.0
+        self.degenerate = a == b == c
+
+    def __call__(self, x: float) -> float:
+        if self.a < x <= self.b:
+            return (x - self.a) * self.inv_left
+        elif self.b < x < self.c:
+            return (self.c - x) * self.inv_right
+        elif self.degenerate and x == self.a:
+            return 1.0
+
+        return 0.0
+
+    def calculate_array(self, x: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        Calcula o grau de pertinência de um array contíguo de uma dimensão,
+        escrevendo o resultado em out.
+        """
+        BackendRegistry.get_backend().calculate_trimf_array(
+            x, self.a, self.b, self.c, out)
+
+        return out
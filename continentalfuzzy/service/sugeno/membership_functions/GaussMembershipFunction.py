@@ -4,9 +4,20 @@ author: Rudi César Comiotto Modena
 email: rmodena@unisinos.br
 date: July, 2020
 """
-from continentalfuzzy.service.sugeno.membership_functions.membership_functions import c_calculate_gaussmf
+import numpy as np
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
 
 class GaussMembershipFunction:
     @staticmethod
     def calculate_gaussmf(x: float, mean: float, sigma: float):
-        return c_calculate_gaussmf(x, mean, sigma)
+        return BackendRegistry.get_backend().calculate_gaussmf(x, mean, sigma)
+
+    @staticmethod
+    def calculate_gaussmf_array(x: np.ndarray, mean: float, sigma: float):
+        x = np.asarray(x, dtype=np.float64)
+        result = np.empty(x.shape, dtype=np.float64)
+        BackendRegistry.get_backend().calculate_gaussmf_array(
+            np.ascontiguousarray(x).ravel(), mean, sigma, result.ravel())
+
+        return result
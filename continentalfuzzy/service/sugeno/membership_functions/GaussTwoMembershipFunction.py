@@ -4,22 +4,24 @@ author: Rudi César Comiotto Modena
 email: rmodena@unisinos.br
 date: July, 2020
 """
-from continentalfuzzy.service.sugeno.membership_functions.membership_functions import c_calculate_gaussmf
+import numpy as np
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
 
 class GaussTwoMembershipFunction:
     @staticmethod
     def calculate_gauss2mf(x: float, mean1: float, sigma1: float,
                            mean2: float, sigma2: float):
+        return BackendRegistry.get_backend().calculate_gauss2mf(
+            x, mean1, sigma1, mean2, sigma2)
 
-        if (x >= mean1) and (x <= mean2):
-            return 1
-        left_gauss = 1
-        right_gauss = 1
-
-        if x < mean1:
-            left_gauss = c_calculate_gaussmf(x, mean1, sigma1)
-
-        if x > mean2:
-            right_gauss = c_calculate_gaussmf(x, mean2, sigma2)
+    @staticmethod
+    def calculate_gauss2mf_array(x: np.ndarray, mean1: float, sigma1: float,
+                                 mean2: float, sigma2: float) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float64)
+        result = np.empty(x.shape, dtype=np.float64)
+        BackendRegistry.get_backend().calculate_gauss2mf_array(
+            np.ascontiguousarray(x).ravel(), mean1, sigma1, mean2, sigma2,
+            result.ravel())
 
-        return left_gauss * right_gauss
+        return result
@@ -5,16 +5,56 @@ email: rmodena@unisinos.br
 date: July, 2020
 """
 from typing import List, Dict
+import numpy as np
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
 
 
 class LinearMembershipFunction:
     @staticmethod
     def calculate_linear(params: Dict[str, float],
                          inputs: Dict[str, float]):
-
+        # O cálculo escalar fica em Python: converter os dicionários em arrays
+        # a cada chamada custa mais que o laço com poucos antecedentes
         result = 0
         for key, value in inputs.items():
             result += (params[key] * inputs[key])
         result += params['__constant__']
 
         return result
+
+    @staticmethod
+    def calculate_linear_array(coefficients: np.ndarray,
+                               x_array: np.ndarray) -> np.ndarray:
+        """
+        Calcula a função linear para várias amostras.
+
+        Parâmetros
+        ----------
+        coefficients : np.ndarray
+            Array com um coeficiente por antecedente seguido do termo
+            constante.
+
+        x_array : np.ndarray
+            Array antecedente x amostra com os valores dos antecedentes.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna um array com o resultado de cada amostra.
+        """
+        coefficients = np.ascontiguousarray(coefficients, dtype=np.float64)
+        x_array = np.ascontiguousarray(x_array, dtype=np.float64)
+
+        if coefficients.shape[0] != x_array.shape[0] + 1:
+            raise Exception("Número de coeficientes inválido!")
+
+        result = np.empty(x_array.shape[1], dtype=np.float64)
+        if not coefficients[:-1].any():
+            BackendRegistry.get_backend().calculate_constant_array(
+                coefficients[-1], result)
+        else:
+            BackendRegistry.get_backend().calculate_linear_array(
+                x_array, coefficients, result)
+
+        return result
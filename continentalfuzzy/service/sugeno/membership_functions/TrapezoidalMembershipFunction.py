@@ -6,8 +6,8 @@ date: July, 2020
 """
 from typing import List
 import numpy as np
-from continentalfuzzy.service.sugeno.membership_functions.TriangularMembershipFuntion import \
-    TriangularMembershipFunction
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
 
 
 class TrapezoidalMembershipFunction:
@@ -30,19 +30,22 @@ class TrapezoidalMembershipFunction:
         if (a > b) or (b > c) or (c > d):
             raise Exception("Os parâmetros não estão em ordem crescente!")
 
-        trimf = TriangularMembershipFunction()
+        return BackendRegistry.get_backend().calculate_trapmf(x, a, b, c, d)
 
-        if a == b == c == d == x:
-            return 1
+    @staticmethod
+    def calculate_trapmf_array(x: np.ndarray, abcd: List[float]) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float64)
+
+        if len(abcd) != 4:
+            raise Exception("O parâmetro abc necessita de 4 valores!")
 
-        elif (x >= b) and (x <= c):
-            return 1
+        a, b, c, d = (float(val) for val in abcd)
 
-        elif (x > a) and (x < b):
-            return trimf.calculate_trimf(x, [a, b, c])
+        if (a > b) or (b > c) or (c > d):
+            raise Exception("Os parâmetros não estão em ordem crescente!")
 
-        elif (x > c) and (x < d):
-            return trimf.calculate_trimf(x, [b, c, d])
+        result = np.empty(x.shape, dtype=np.float64)
+        BackendRegistry.get_backend().calculate_trapmf_array(
+            np.ascontiguousarray(x).ravel(), a, b, c, d, result.ravel())
 
-        else:
-            return 0
+        return result
@@ -6,6 +6,8 @@ date: July, 2020
 """
 from typing import List
 import numpy as np
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
 
 
 class TriangularMembershipFunction:
@@ -27,11 +29,22 @@ class TriangularMembershipFunction:
         if (a > b) or (b > c):
             raise Exception("Os parâmetros não estão em ordem crescente!")
 
-        if a == b == c == x:
-            return 1
-        elif a < x <= b:
-            return (x - a)/(b - a)
-        elif b < x < c:
-            return (c - x)/(c - b)
-        else:
-            return 0
+        return BackendRegistry.get_backend().calculate_trimf(x, a, b, c)
+
+    @staticmethod
+    def calculate_trimf_array(x: np.ndarray, abc: List[float]) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float64)
+
+        if len(abc) != 3:
+            raise Exception("O parâmetro abc necessita de 3 valores!")
+
+        a, b, c = (float(val) for val in abc)
+
+        if (a > b) or (b > c):
+            raise Exception("Os parâmetros não estão em ordem crescente!")
+
+        result = np.empty(x.shape, dtype=np.float64)
+        BackendRegistry.get_backend().calculate_trimf_array(
+            np.ascontiguousarray(x).ravel(), a, b, c, result.ravel())
+
+        return result
@@ -1,4 +1,144 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Kernels nativos das funções de pertinência Sugeno.
+
+As funções escalares recebem e retornam números float. As funções de array
+recebem memoryviews contíguas e escrevem o resultado no array de saída sem
+segurar o GIL. A validação dos parâmetros é feita pelas classes que chamam
+estes kernels.
+"""
 from libc.math cimport exp
 
+
+cdef inline double _gaussmf(double x, double mean, double sigma) nogil:
+    return exp(-((x - mean) * (x - mean)) / (2.0 * sigma * sigma))
+
+
+cdef inline double _trimf(double x, double a, double b, double c) nogil:
+    if a == b and b == c and c == x:
+        return 1.0
+    elif a < x <= b:
+        return (x - a) / (b - a)
+    elif b < x < c:
+        return (c - x) / (c - b)
+    return 0.0
+
+
+cdef inline double _trapmf(double x, double a, double b, double c,
+                           double d) nogil:
+    if b <= x <= c:
+        return 1.0
+    elif a < x < b:
+        return (x - a) / (b - a)
+    elif c < x < d:
+        return (d - x) / (d - c)
+    return 0.0
+
+
+cdef inline double _gauss2mf(double x, double mean1, double sigma1,
+                             double mean2, double sigma2) nogil:
+    cdef double left_gauss = 1.0
+    cdef double right_gauss = 1.0
+
+    if mean1 <= x <= mean2:
+        return 1.0
+
+    if x < mean1:
+        left_gauss = _gaussmf(x, mean1, sigma1)
+
+    if x > mean2:
+        right_gauss = _gaussmf(x, mean2, sigma2)
+
+    return left_gauss * right_gauss
+
+
 def c_calculate_gaussmf(double x, double mean, double sigma):
-    return exp(-((x - mean) * (x - mean)) / (2.0 * sigma * sigma))
\ No newline at end of file
+    return _gaussmf(x, mean, sigma)
+
+
+def c_calculate_trimf(double x, double a, double b, double c):
+    return _trimf(x, a, b, c)
+
+
+def c_calculate_trapmf(double x, double a, double b, double c, double d):
+    return _trapmf(x, a, b, c, d)
+
+
+def c_calculate_gauss2mf(double x, double mean1, double sigma1,
+                         double mean2, double sigma2):
+    return _gauss2mf(x, mean1, sigma1, mean2, sigma2)
+
+
+def c_calculate_gaussmf_array(const double[::1] x, double mean, double sigma,
+                              double[::1] out):
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(x.shape[0]):
+            out[i] = _gaussmf(x[i], mean, sigma)
+
+
+def c_calculate_trimf_array(const double[::1] x, double a, double b, double c,
+                            double[::1] out):
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(x.shape[0]):
+            out[i] = _trimf(x[i], a, b, c)
+
+
+def c_calculate_trapmf_array(const double[::1] x, double a, double b,
+                             double c, double d, double[::1] out):
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(x.shape[0]):
+            out[i] = _trapmf(x[i], a, b, c, d)
+
+
+def c_calculate_gauss2mf_array(const double[::1] x, double mean1,
+                               double sigma1, double mean2, double sigma2,
+                               double[::1] out):
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(x.shape[0]):
+            out[i] = _gauss2mf(x[i], mean1, sigma1, mean2, sigma2)
+
+
+def c_calculate_linear_array(const double[:, ::1] x,
+                             const double[::1] coefficients,
+                             double[::1] out):
+    """
+    x é um array antecedente x amostra e coefficients possui um coeficiente
+    por antecedente seguido do termo constante.
+    """
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t num_inputs = x.shape[0]
+    cdef double result
+
+    with nogil:
+        for j in range(x.shape[1]):
+            result = 0.0
+            for i in range(num_inputs):
+                result += coefficients[i] * x[i, j]
+            out[j] = result + coefficients[num_inputs]
+
+
+def c_calculate_constant_array(double value, double[::1] out):
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(out.shape[0]):
+            out[i] = value
+
+
+def c_calculate_probor_array(const double[:, ::1] degrees, double[::1] out):
+    """
+    degrees é um array termo x amostra. O resultado do OR probabilístico de
+    cada amostra é escrito em out.
+    """
+    cdef Py_ssize_t i, j
+    cdef double result
+
+    with nogil:
+        for j in range(degrees.shape[1]):
+            result = degrees[0, j]
+            for i in range(1, degrees.shape[0]):
+                result = (result + degrees[i, j]) - (result * degrees[i, j])
+            out[j] = result
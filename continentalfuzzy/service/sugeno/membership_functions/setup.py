@@ -1,4 +1,44 @@
-from setuptools import setup
-from Cython.Build import cythonize
-
-setup(name="membership_functions", ext_modules=cythonize('membership_functions.pyx'),)
\ No newline at end of file
+"""
+Compila os kernels nativos das funções de pertinência.
+
+Uso (a partir deste diretório ou de qualquer outro):
+
+    python setup.py build_ext --inplace
+
+O módulo é compilado com o nome completo do pacote e copiado para este
+diretório. Quando o Cython não está instalado é usado o arquivo .c gerado.
+"""
+import os
+import sys
+from setuptools import setup, Extension
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.abspath(os.path.join(HERE, '..', '..', '..', '..'))
+MODULE = 'continentalfuzzy.service.sugeno.membership_functions.' \
+         'membership_functions'
+SOURCE = os.path.join('continentalfuzzy', 'service', 'sugeno',
+                      'membership_functions', 'membership_functions')
+
+# O build_ext --inplace copia o módulo para o caminho do pacote, relativo ao
+# diretório atual
+os.chdir(ROOT)
+
+if sys.platform == 'win32':
+    extra_compile_args = ['/O2']
+else:
+    extra_compile_args = ['-O3']
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = [Extension(MODULE,
+                             [SOURCE + '.c'],
+                             extra_compile_args=extra_compile_args)]
+else:
+    ext_modules = cythonize(
+        [Extension(MODULE,
+                   [SOURCE + '.pyx'],
+                   extra_compile_args=extra_compile_args)],
+        compiler_directives={'language_level': 3})
+
+setup(name="membership_functions", ext_modules=ext_modules)
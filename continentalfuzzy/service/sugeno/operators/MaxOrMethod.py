@@ -4,6 +4,8 @@ author: Rudi César Comiotto Modena
 email: rmodena@unisinos.br
 date: July, 2020
 """
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
 from continentalfuzzy.service.sugeno.operators.NotMethod import NotMethod
 
 
@@ -21,4 +23,13 @@ class MaxOrMethod:
             else:
                 results.append(result)
 
-        return max(results)
\ No newline at end of file
+        return max(results)
+
+    @classmethod
+    def calculate_max_or_degrees(cls, degrees):
+        return max(degrees)
+
+    @classmethod
+    def calculate_max_or_array(cls, degrees, axis=0):
+        backend = BackendRegistry.get_backend()
+        return backend.calculate_max_or_array(degrees, axis)
@@ -4,6 +4,8 @@ author: Rudi César Comiotto Modena
 email: rmodena@unisinos.br
 date: July, 2020
 """
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
 from continentalfuzzy.service.sugeno.operators.NotMethod import NotMethod
 
 
@@ -30,4 +32,25 @@ class MinAndMethod:
             elif min_value > result:
                 min_value = result
 
+            # Com um grau zero o mínimo é zero, os demais antecedentes não
+            # precisam ser calculados
+            if min_value == 0:
+                break
+
         return min_value
+
+    @classmethod
+    def calculate_min_and_degrees(cls, degrees):
+        min_value = 0
+        for num, result in enumerate(degrees):
+            if num == 0 or min_value > result:
+                min_value = result
+            if min_value == 0:
+                break
+
+        return min_value
+
+    @classmethod
+    def calculate_min_and_array(cls, degrees, axis=0):
+        backend = BackendRegistry.get_backend()
+        return backend.calculate_min_and_array(degrees, axis)
@@ -4,6 +4,8 @@ author: Rudi César Comiotto Modena
 email: rmodena@unisinos.br
 date: July, 2020
 """
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
 from continentalfuzzy.service.sugeno.operators.NotMethod import NotMethod
 
 
@@ -26,3 +28,19 @@ class ProborOrMethod:
                 final_result = (final_result + result) - (final_result * result)
 
         return final_result
+
+    @classmethod
+    def calculate_probor_or_degrees(cls, degrees):
+        final_result = 0
+        for num, result in enumerate(degrees):
+            if num == 0:
+                final_result = result
+            else:
+                final_result = (final_result + result) - (final_result * result)
+
+        return final_result
+
+    @classmethod
+    def calculate_probor_or_array(cls, degrees, axis=0):
+        backend = BackendRegistry.get_backend()
+        return backend.calculate_probor_or_array(degrees, axis)
@@ -5,6 +5,8 @@ email: rmodena@unisinos.br
 date: July, 2020
 """
 import numpy as np
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
 from continentalfuzzy.service.sugeno.operators.NotMethod import NotMethod
 
 
@@ -22,4 +24,24 @@ class ProdAndMethod:
             else:
                 results.append(result)
 
-        return np.prod(results)
\ No newline at end of file
+            # Com um grau zero o produto é zero, os demais antecedentes não
+            # precisam ser calculados
+            if results[-1] == 0:
+                break
+
+        return np.prod(results)
+
+    @classmethod
+    def calculate_prod_and_degrees(cls, degrees):
+        prod_value = 1.0
+        for result in degrees:
+            prod_value *= result
+            if result == 0:
+                break
+
+        return prod_value
+
+    @classmethod
+    def calculate_prod_and_array(cls, degrees, axis=0):
+        backend = BackendRegistry.get_backend()
+        return backend.calculate_prod_and_array(degrees, axis)
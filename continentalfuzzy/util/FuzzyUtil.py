@@ -46,6 +46,64 @@ class FuzzyUtil:
 
         return np.sort(np.array(list(universe_set)))
 
+    @classmethod
+    def create_universe_fixed(cls,
+                              u_range: List[float],
+                              mfs: Dict[int, MembershipFunction],
+                              num_points: int) -> np.ndarray:
+        """
+        Cria um universo com num_points pontos igualmente espaçados no range,
+        mais os pontos notáveis das funções de pertinência (vértices das
+        triangulares e trapezoidais e médias das gaussianas), para que as
+        curvas lineares por partes continuem exatas.
+
+        Parâmetros
+        ----------
+        u_range : List[float]
+            Range da variável.
+
+        mfs : Dict[int, MembershipFunction]
+            Dicionário com as funções de pertinência da variável.
+
+        num_points : int
+            Quantidade de pontos igualmente espaçados.
+
+        Retorna
+        -------
+        np.ndarray
+            Retorna uma numpy array ordenada com o universo.
+        """
+        values = [np.linspace(u_range[0], u_range[1], num=num_points,
+                              endpoint=True)]
+        for f_mf in mfs.values():
+            values.append(np.asarray(cls.get_breakpoint_values(f_mf),
+                                     dtype=np.float64))
+
+        universe = np.concatenate(values)
+        universe = universe[(universe >= u_range[0]) &
+                            (universe <= u_range[1])]
+
+        return np.unique(universe)
+
+    @staticmethod
+    def get_breakpoint_values(f_mf: MembershipFunction) -> List[float]:
+        """
+        Pontos em que a curva de pertinência muda de forma.
+        """
+        if f_mf.function == Functions.trimf:
+            return list(f_mf.abc)
+
+        elif f_mf.function == Functions.trapmf:
+            return list(f_mf.abcd)
+
+        elif f_mf.function == Functions.gaussmf:
+            return [f_mf.mean]
+
+        elif f_mf.function == Functions.gauss2mf:
+            return [f_mf.mean1, f_mf.mean2]
+
+        raise Exception("Função de pertinência não implementada!")
+
     @staticmethod
     def get_trimf_values(f_mf: TriMF) -> List[float]:
         return f_mf.abc
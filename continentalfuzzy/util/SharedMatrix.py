@@ -0,0 +1,107 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+from multiprocessing import shared_memory
+from typing import Tuple
+import numpy as np
+
+
+class SharedMatrix:
+    """
+    Matriz numpy guardada em um segmento de memória compartilhada, usada
+    pelos processos do process_fuzzy_matrix_parallel sem cópia.
+
+    O processo que cria a matriz (owner) é o responsável por remover o
+    segmento com o close. Os processos que se conectam pelo descriptor só
+    fecham o acesso. Os processos filhos usam o resource_tracker do processo
+    principal, então o segmento continua registrado uma única vez e é
+    removido mesmo se o processo principal terminar sem o close.
+    """
+
+    def __init__(self,
+                 shape: Tuple[int, ...],
+                 dtype=np.float64,
+                 name: str = None):
+        self.__dtype = np.dtype(dtype)
+        self.__shape = tuple(int(value) for value in shape)
+        self.__owner = name is None
+
+        if self.__owner:
+            size = max(1, int(np.prod(self.__shape)) * self.__dtype.itemsize)
+            self.__memory = shared_memory.SharedMemory(create=True,
+                                                       size=size)
+        else:
+            self.__memory = shared_memory.SharedMemory(name=name)
+
+        self.__array = np.ndarray(self.__shape, dtype=self.__dtype,
+                                  buffer=self.__memory.buf)
+
+    @classmethod
+    def from_array(cls, array) -> 'SharedMatrix':
+        """
+        Cria uma matriz compartilhada com uma cópia do array.
+        """
+        array = np.asarray(array)
+        matrix = cls(array.shape, array.dtype)
+        matrix.array[...] = array
+
+        return matrix
+
+    @classmethod
+    def attach(cls, descriptor: Tuple[str, Tuple[int, ...], str]) \
+            -> 'SharedMatrix':
+        """
+        Conecta a uma matriz criada em outro processo.
+
+        Parâmetros
+        ----------
+        descriptor : Tuple[str, Tuple[int, ...], str]
+            Nome do segmento, formato e tipo da matriz, como retornado pelo
+            descriptor da matriz original.
+        """
+        name, shape, dtype = descriptor
+        return cls(shape, dtype, name)
+
+    @property
+    def array(self) -> np.ndarray:
+        return self.__array
+
+    @property
+    def descriptor(self) -> Tuple[str, Tuple[int, ...], str]:
+        """
+        Nome do segmento, formato e tipo da matriz, enviados aos processos
+        no lugar do conteúdo.
+        """
+        return self.__memory.name, self.__shape, self.__dtype.str
+
+    def close(self):
+        """
+        Fecha o acesso ao segmento e, no processo que criou a matriz, remove
+        o segmento. O array não pode mais ser usado.
+        """
+        if self.__memory is None:
+            return
+
+        memory = self.__memory
+        self.__memory = None
+        self.__array = None
+
+        # O segmento é removido antes do close, que falha quando ainda
+        # existem arrays usando o buffer; nesse caso a memória é liberada
+        # quando esses arrays são descartados
+        if self.__owner:
+            memory.unlink()
+
+        try:
+            memory.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
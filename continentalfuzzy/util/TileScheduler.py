@@ -0,0 +1,157 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import math
+import os
+import queue
+from typing import List, Optional, Tuple
+
+
+class TileScheduler:
+    """
+    Divide uma matriz em blocos (tiles) de linhas x colunas, entregues aos
+    workers por uma fila: cada worker pega o próximo bloco quando termina o
+    anterior, assim os blocos mais baratos (sem dados, poucas regras
+    ativadas) não deixam workers parados.
+
+    Cada bloco é uma tupla (linha inicial, linha final, coluna inicial,
+    coluna final), com os finais exclusivos.
+    """
+
+    # Tamanho máximo dos blocos quando o tamanho não é informado
+    DEFAULT_TILE_SHAPE = (64, 64)
+
+    # Quantidade mínima de blocos por worker quando o tamanho não é
+    # informado. Os blocos são reduzidos até chegar nessa quantidade
+    TILES_PER_WORKER = 4
+
+    # Arquivos com a cota de CPU do cgroup v2 e do cgroup v1
+    CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+    CGROUP_V1_CPU_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+    CGROUP_V1_CPU_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+    def __init__(self,
+                 num_rows: int,
+                 num_cols: int,
+                 tile_shape: Optional[Tuple[int, int]] = None,
+                 number_of_workers: int = 1):
+        if num_rows < 0 or num_cols < 0:
+            raise Exception("A dimensão da matriz não pode ser negativa!")
+
+        if number_of_workers < 1:
+            raise Exception("O número de workers precisa ser maior que "
+                            "zero!")
+
+        if tile_shape is None:
+            tile_shape = self.get_tile_shape(num_rows, num_cols,
+                                             number_of_workers)
+
+        if len(tile_shape) != 2 or min(tile_shape) < 1:
+            raise Exception("O tamanho dos blocos precisa ser maior que "
+                            "zero!")
+
+        self.__num_rows = num_rows
+        self.__num_cols = num_cols
+        self.__tile_shape = (int(tile_shape[0]), int(tile_shape[1]))
+
+    @property
+    def tile_shape(self) -> Tuple[int, int]:
+        return self.__tile_shape
+
+    @property
+    def tiles(self) -> List[Tuple[int, int, int, int]]:
+        """
+        Blocos da matriz, em ordem de linhas.
+        """
+        tile_rows, tile_cols = self.__tile_shape
+        return [(row, min(row + tile_rows, self.__num_rows),
+                 col, min(col + tile_cols, self.__num_cols))
+                for row in range(0, self.__num_rows, tile_rows)
+                for col in range(0, self.__num_cols, tile_cols)]
+
+    @property
+    def num_tiles(self) -> int:
+        return math.ceil(self.__num_rows / self.__tile_shape[0]) * \
+            math.ceil(self.__num_cols / self.__tile_shape[1])
+
+    def create_queue(self) -> queue.Queue:
+        """
+        Fila com todos os blocos, consumida pelos workers com get_nowait
+        até ficar vazia.
+        """
+        work_queue = queue.Queue()
+        for tile in self.tiles:
+            work_queue.put(tile)
+
+        return work_queue
+
+    @classmethod
+    def get_tile_shape(cls,
+                       num_rows: int,
+                       num_cols: int,
+                       number_of_workers: int) -> Tuple[int, int]:
+        """
+        Tamanho dos blocos: parte de DEFAULT_TILE_SHAPE limitado à matriz e
+        divide a maior dimensão ao meio até existirem TILES_PER_WORKER blocos
+        por worker ou os blocos terem uma única célula.
+        """
+        tile_rows = max(1, min(cls.DEFAULT_TILE_SHAPE[0], num_rows))
+        tile_cols = max(1, min(cls.DEFAULT_TILE_SHAPE[1], num_cols))
+        min_tiles = cls.TILES_PER_WORKER * number_of_workers
+
+        while math.ceil(num_rows / tile_rows) * \
+                math.ceil(num_cols / tile_cols) < min_tiles and \
+                (tile_rows > 1 or tile_cols > 1):
+            if tile_rows >= tile_cols:
+                tile_rows = math.ceil(tile_rows / 2)
+            else:
+                tile_cols = math.ceil(tile_cols / 2)
+
+        return tile_rows, tile_cols
+
+    @classmethod
+    def get_cgroup_cpu_limit(cls) -> Optional[float]:
+        """
+        Cota de CPU do cgroup (quota / period), ou None quando o processo
+        não possui cota.
+        """
+        try:
+            with open(cls.CGROUP_V2_CPU_MAX) as file:
+                quota, period = file.read().split()[:2]
+            if quota != 'max':
+                return int(quota) / int(period)
+            return None
+        except (OSError, ValueError):
+            pass
+
+        try:
+            with open(cls.CGROUP_V1_CPU_QUOTA) as file:
+                quota = int(file.read())
+            with open(cls.CGROUP_V1_CPU_PERIOD) as file:
+                period = int(file.read())
+            if quota > 0 and period > 0:
+                return quota / period
+        except (OSError, ValueError):
+            pass
+
+        return None
+
+    @classmethod
+    def get_available_cpus(cls) -> int:
+        """
+        Quantidade de CPUs que o processo pode usar: as CPUs da afinidade do
+        processo, limitadas pela cota do cgroup (arredondada para cima).
+        """
+        try:
+            cpus = len(os.sched_getaffinity(0))
+        except AttributeError:
+            cpus = os.cpu_count() or 1
+
+        limit = cls.get_cgroup_cpu_limit()
+        if limit is not None:
+            cpus = min(cpus, math.ceil(limit))
+
+        return max(1, cpus)
@@ -0,0 +1,90 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+
+Benchmark dos controladores substitutos por tabela.
+
+Para cada arquivo .fis cria a tabela com a grade informada, mede o tempo da
+amostragem, do cálculo de uma matriz pelo motor do controlador e pela
+interpolação da tabela, e informa o erro máximo e RMS da validação.
+
+Uso, no diretório raiz do projeto:
+
+    $ python -m tests.benchmark.lookup_table_benchmark [pontos_grade] [linhas] [colunas] [arquivo.fis ...]
+"""
+import sys
+import time
+import warnings
+import numpy as np
+from continentalfuzzy.domain.definition.ControllerType import ControllerType
+from continentalfuzzy.service.LookupTableService import LookupTableService
+from continentalfuzzy.service.MamdaniControllerService import \
+    MamdaniControllerService
+from continentalfuzzy.service.SugenoControllerService import \
+    SugenoControllerService
+from continentalfuzzy.service.SystemService import SystemService
+
+DEFAULT_FILENAMES = ["tests/test_data/Shelf.fis",
+                     "tests/test_data/Ramp.fis",
+                     "tests/test_data/Ramp_Arid.fis"]
+
+DEFAULT_GRID_POINTS = 17
+DEFAULT_ROWS = 200
+DEFAULT_COLS = 200
+
+
+def run(p_filename: str, p_grid_points: int, p_rows: int, p_cols: int):
+    fis_system = SystemService().import_file(p_filename)
+    if fis_system.type == ControllerType.mamdani:
+        controller = MamdaniControllerService()
+    else:
+        controller = SugenoControllerService()
+    controller.create_from_fis_system(fis_system)
+    service = LookupTableService(controller)
+
+    start = time.perf_counter()
+    service.create_table(p_grid_points)
+    table_s = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    inputs = {f_input.name: rng.uniform(*f_input.range, size=(p_rows, p_cols))
+              for f_input in fis_system.inputs.values()}
+
+    start = time.perf_counter()
+    service.calc_exact({name: np.ravel(value)
+                        for name, value in inputs.items()})
+    exact_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    service.interpolate_outputs(inputs)
+    table_eval_s = time.perf_counter() - start
+
+    print(f"{p_filename} (grade {service.table.grid_shape}, "
+          f"matriz {p_rows}x{p_cols})")
+    print(f"criação da tabela:    {table_s:8.3f} s")
+    print(f"motor do controlador: {exact_s:8.3f} s")
+    print(f"interpolação:         {table_eval_s:8.3f} s "
+          f"({exact_s / table_eval_s:.1f}x)")
+    for name, report in service.validate().items():
+        print(f"{name}: erro máximo {report['max_error']:.3e}, "
+              f"RMS {report['rms_error']:.3e}")
+
+
+def main(args):
+    grid_points = int(args[0]) if len(args) > 0 else DEFAULT_GRID_POINTS
+    rows = int(args[1]) if len(args) > 1 else DEFAULT_ROWS
+    cols = int(args[2]) if len(args) > 2 else DEFAULT_COLS
+    filenames = args[3:] if len(args) > 3 else DEFAULT_FILENAMES
+
+    warnings.simplefilter('ignore', DeprecationWarning)
+
+    for filename in filenames:
+        run(filename, grid_points, rows, cols)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,124 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+
+Benchmark do cálculo Mamdani de uma matriz.
+
+Compara o laço por célula do process_fuzzy_matrix (uma chamada de
+fuzzy_calc_single_value por célula) com o cálculo em lote do scikit-fuzzy
+(fuzzy_calc_batch) e com o motor vetorizado (fuzzy_calc_native), e informa o
+tempo total e a maior diferença em relação ao laço por célula.
+
+O EnvironmentMamdani3.fis possui os blocos dos consequentes fora de ordem e
+não é importado pelo SystemService; no lugar dele é usado o
+EnvironmentMamdani.fis, que possui o mesmo sistema.
+
+Uso, no diretório raiz do projeto:
+
+    $ python -m tests.benchmark.mamdani_batch_benchmark [linhas] [colunas] [arquivo.fis ...]
+"""
+import sys
+import time
+import warnings
+import numpy as np
+from continentalfuzzy.dto.FuzzyControlCommandInput import \
+    FuzzyControlCommandInput
+from continentalfuzzy.service.MamdaniControllerService import \
+    MamdaniControllerService
+from continentalfuzzy.service.SystemService import SystemService
+
+DEFAULT_FILENAMES = ["tests/test_data/Shelf.fis",
+                     "tests/test_data/EnvironmentMamdani.fis"]
+
+DEFAULT_ROWS = 20
+DEFAULT_COLS = 20
+
+
+def get_command_input(p_service: MamdaniControllerService,
+                      p_rows: int,
+                      p_cols: int) -> FuzzyControlCommandInput:
+    rng = np.random.default_rng(0)
+    command_input = FuzzyControlCommandInput()
+    command_input.set_matrix_dimension(p_rows, p_cols)
+
+    for f_input in p_service.fuzzy_machine.fis_system.inputs.values():
+        values = rng.uniform(*f_input.range, size=(p_rows, p_cols))
+        for row in range(p_rows):
+            for col in range(p_cols):
+                command_input.add_fuzzy_inputs_matrix(row, col, f_input.name,
+                                                      values[row][col])
+
+    return command_input
+
+
+def calc_per_cell(p_service: MamdaniControllerService,
+                  p_command_input: FuzzyControlCommandInput,
+                  p_output: str) -> np.ndarray:
+    """
+    Mesmo laço do process_fuzzy_matrix, com o nome do consequente do
+    sistema no lugar do 'output1' fixo.
+    """
+    result = np.full((p_command_input.get_num_rows(),
+                      p_command_input.get_num_cols()), np.nan)
+    for row in range(p_command_input.get_num_rows()):
+        for col in range(p_command_input.get_num_cols()):
+            temp_input = FuzzyControlCommandInput()
+            for name, matrix in \
+                    p_command_input.get_fuzzy_inputs_matrix().items():
+                temp_input.add_fuzzy_inputs(name, matrix[row][col])
+            try:
+                result[row][col] = p_service.fuzzy_calc_single_value(
+                    temp_input.fuzzy_inputs, p_output)
+            except Exception:
+                pass
+
+    return result
+
+
+def run(p_filename: str, p_rows: int, p_cols: int):
+    service = MamdaniControllerService()
+    service.create_from_fis_system(SystemService().import_file(p_filename))
+    output = service.fuzzy_machine.compiled_rules.output_names[0]
+    command_input = get_command_input(service, p_rows, p_cols)
+    matrix_inputs = command_input.get_fuzzy_inputs_matrix()
+
+    start = time.perf_counter()
+    per_cell = calc_per_cell(service, command_input, output)
+    per_cell_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = service.fuzzy_calc_batch(matrix_inputs, output)
+    batch_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    native = service.fuzzy_calc_native(matrix_inputs, output)
+    native_s = time.perf_counter() - start
+
+    print(f"{p_filename} ({p_rows}x{p_cols})")
+    print(f"process_fuzzy_matrix (por célula): {per_cell_s:8.3f} s")
+    print(f"fuzzy_calc_batch:                  {batch_s:8.3f} s "
+          f"({per_cell_s / batch_s:.1f}x, diferença máxima "
+          f"{np.nanmax(np.abs(batch - per_cell)):.2e})")
+    print(f"fuzzy_calc_native:                 {native_s:8.3f} s "
+          f"({per_cell_s / native_s:.1f}x, diferença máxima "
+          f"{np.nanmax(np.abs(native - per_cell)):.2e})")
+
+
+def main(args):
+    rows = int(args[0]) if len(args) > 0 else DEFAULT_ROWS
+    cols = int(args[1]) if len(args) > 1 else DEFAULT_COLS
+    filenames = args[2:] if len(args) > 2 else DEFAULT_FILENAMES
+
+    # O scikit-fuzzy gera avisos de depreciação do NumPy a cada amostra
+    warnings.simplefilter('ignore', DeprecationWarning)
+
+    for filename in filenames:
+        run(filename, rows, cols)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
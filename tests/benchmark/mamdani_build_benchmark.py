@@ -0,0 +1,136 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+
+Benchmark da criação do controlador Mamdani para bases de regras grandes.
+
+Gera sistemas sintéticos com todas as combinações das funções de pertinência
+dos antecedentes (1000 e 10000 regras por padrão) e informa o tempo da
+importação do arquivo .fis, da criação das regras do scikit-fuzzy, da criação
+do MamdaniControlSystem e da compilação das regras do motor vetorizado.
+
+Uso, no diretório raiz do projeto:
+
+    $ python -m tests.benchmark.mamdani_build_benchmark [num_regras ...]
+"""
+import itertools
+import os
+import sys
+import tempfile
+import time
+from continentalfuzzy.service.MamdaniControllerService import \
+    MamdaniControllerService
+from continentalfuzzy.service.mamdani.MamdaniControlSystem import \
+    MamdaniControlSystem
+from continentalfuzzy.service.SystemService import SystemService
+
+DEFAULT_NUM_RULES = [1000, 10000]
+
+# Cada antecedente possui 10 funções de pertinência, então o sistema com
+# 10 ** n regras possui n antecedentes
+NUM_MFS = 10
+
+
+def create_fis_text(p_num_rules: int) -> str:
+    """
+    Cria o texto de um arquivo .fis Mamdani com p_num_rules regras.
+    """
+    num_inputs = 1
+    while NUM_MFS ** num_inputs < p_num_rules:
+        num_inputs += 1
+
+    lines = ["[System]",
+             "Name='Synthetic'",
+             "Type='mamdani'",
+             "Version=2.0",
+             f"NumInputs={num_inputs}",
+             "NumOutputs=1",
+             f"NumRules={p_num_rules}",
+             "AndMethod='min'",
+             "OrMethod='max'",
+             "ImpMethod='min'",
+             "AggMethod='max'",
+             "DefuzzMethod='centroid'",
+             ""]
+
+    for num_input in range(1, num_inputs + 1):
+        lines += [f"[Input{num_input}]",
+                  f"Name='input{num_input}'",
+                  f"Range=[0 {NUM_MFS - 1}]",
+                  f"NumMFs={NUM_MFS}"]
+        lines += [f"MF{num_mf + 1}='mf{num_mf + 1}':'trimf',"
+                  f"[{num_mf - 1} {num_mf} {num_mf + 1}]"
+                  for num_mf in range(NUM_MFS)]
+        lines.append("")
+
+    lines += ["[Output1]",
+              "Name='output1'",
+              f"Range=[0 {NUM_MFS - 1}]",
+              f"NumMFs={NUM_MFS}"]
+    lines += [f"MF{num_mf + 1}='mf{num_mf + 1}':'trimf',"
+              f"[{num_mf - 1} {num_mf} {num_mf + 1}]"
+              for num_mf in range(NUM_MFS)]
+    lines += ["", "[Rules]"]
+
+    combinations = itertools.product(range(1, NUM_MFS + 1),
+                                     repeat=num_inputs)
+    for antecedents in itertools.islice(combinations, p_num_rules):
+        output = sum(antecedents) % NUM_MFS + 1
+        lines.append(" ".join(str(value) for value in antecedents)
+                     + f", {output} (1) : 1")
+
+    return "\n".join(lines) + "\n"
+
+
+def run(p_num_rules: int):
+    with tempfile.NamedTemporaryFile('w', suffix='.fis',
+                                     delete=False) as file:
+        file.write(create_fis_text(p_num_rules))
+
+    try:
+        start = time.perf_counter()
+        fis_system = SystemService().import_file(file.name)
+        import_s = time.perf_counter() - start
+    finally:
+        os.remove(file.name)
+
+    service = MamdaniControllerService()
+    service.create_inputs_from_fis(fis_system.inputs)
+    service.create_outputs_from_fis(fis_system.defuzz_method,
+                                    fis_system.outputs)
+
+    start = time.perf_counter()
+    service.create_rules_from_fis(fis_system.and_method,
+                                  fis_system.or_method,
+                                  fis_system.rules)
+    rules_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    MamdaniControlSystem(service.fuzzy_machine.rules)
+    controller_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    service.compile_rules(fis_system)
+    compile_s = time.perf_counter() - start
+
+    print(f"{p_num_rules} regras")
+    print(f"import_file:           {import_s:8.3f} s")
+    print(f"create_rules_from_fis: {rules_s:8.3f} s")
+    print(f"MamdaniControlSystem:  {controller_s:8.3f} s")
+    print(f"compile_rules:         {compile_s:8.3f} s")
+
+
+def main(args):
+    num_rules = [int(value) for value in args] if args else \
+        DEFAULT_NUM_RULES
+
+    for value in num_rules:
+        run(value)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,85 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+
+Benchmark dos métodos de defuzzificação do motor vetorizado.
+
+Calcula as mesmas amostras com cada método de defuzzificação
+(fuzzy_calc_native) e informa o tempo total e a maior diferença em relação
+ao simulador do scikit-fuzzy, calculado somente nas primeiras amostras.
+
+Uso, no diretório raiz do projeto:
+
+    $ python -m tests.benchmark.mamdani_defuzz_benchmark [amostras] [arquivo.fis ...]
+"""
+import sys
+import time
+import warnings
+import numpy as np
+from continentalfuzzy.service.MamdaniControllerService import \
+    MamdaniControllerService
+from continentalfuzzy.service.SystemService import SystemService
+
+DEFAULT_FILENAMES = ["tests/test_data/Shelf.fis",
+                     "tests/test_data/EnvironmentMamdani.fis"]
+
+DEFAULT_SAMPLES = 100000
+
+# Amostras calculadas pelo simulador do scikit-fuzzy para a comparação
+REFERENCE_SAMPLES = 200
+
+
+def run(p_filename: str, p_samples: int):
+    print(f"{p_filename} ({p_samples} amostras)")
+
+    for method in MamdaniControllerService.DICT_DEFUZZ_METHODS:
+        system = SystemService().import_file(p_filename)
+        system.defuzz_method = method
+        service = MamdaniControllerService()
+        service.result_cache = None
+        service.create_from_fis_system(system)
+
+        compiled = service.fuzzy_machine.compiled_rules
+        output = compiled.output_names[0]
+        rng = np.random.default_rng(0)
+        inputs = {name: rng.uniform(universe[0], universe[-1], p_samples)
+                  for name, universe in zip(compiled.input_names,
+                                            compiled.input_universes)}
+
+        start = time.perf_counter()
+        native = service.fuzzy_calc_native(inputs, output)
+        native_s = time.perf_counter() - start
+
+        reference = np.full(REFERENCE_SAMPLES, np.nan)
+        for num in range(min(REFERENCE_SAMPLES, p_samples)):
+            try:
+                reference[num] = service.fuzzy_calc_single_value(
+                    {name: values[num] for name, values in inputs.items()},
+                    output)
+            except Exception:
+                pass
+
+        difference = np.nanmax(np.abs(native[:REFERENCE_SAMPLES] -
+                                      reference))
+        print(f"{method.name:>8}: {native_s:8.3f} s "
+              f"({p_samples / native_s:10.0f} amostras/s, diferença máxima "
+              f"{difference:.2e})")
+
+
+def main(args):
+    samples = int(args[0]) if len(args) > 0 else DEFAULT_SAMPLES
+    filenames = args[1:] if len(args) > 1 else DEFAULT_FILENAMES
+
+    # O scikit-fuzzy gera avisos de depreciação do NumPy a cada amostra
+    warnings.simplefilter('ignore', DeprecationWarning)
+
+    for filename in filenames:
+        run(filename, samples)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
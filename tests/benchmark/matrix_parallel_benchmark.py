@@ -0,0 +1,133 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+
+Benchmark do cálculo de uma matriz em threads, em processos e com o motor
+vetorizado.
+
+Calcula a mesma matriz com o process_fuzzy_matrix (serial), com o
+process_fuzzy_matrix_multithread, com o process_fuzzy_matrix_parallel e com
+o process_fuzzy_matrix_vectorized, e informa o tempo de cada um, o ganho em
+relação ao serial e às threads e se os resultados são iguais (no vetorizado,
+a maior diferença). O tempo do paralelo inclui a criação dos processos e dos
+controladores em cada processo.
+
+Uso, no diretório raiz do projeto:
+
+    $ python -m tests.benchmark.matrix_parallel_benchmark [linhas] [colunas] [workers] [arquivo.fis ...]
+"""
+import sys
+import time
+import warnings
+import numpy as np
+from continentalfuzzy.applicationservice.FuzzyControlApplicationService \
+    import FuzzyControlApplicationService
+from continentalfuzzy.dto.FuzzyControlCommandInput import \
+    FuzzyControlCommandInput
+from continentalfuzzy.service.ControllerCacheService import \
+    ControllerCacheService
+from continentalfuzzy.service.SystemService import SystemService
+from continentalfuzzy.util.TileScheduler import TileScheduler
+
+DEFAULT_FILENAMES = ["tests/test_data/EnvironmentMamdani.fis"]
+
+DEFAULT_ROWS = 100
+DEFAULT_COLS = 100
+
+
+def create_service(p_filename: str) -> FuzzyControlApplicationService:
+    # O process_fuzzy_matrix usa o consequente 'output1' e o
+    # init_fuzzy_control só importa o Mamdani sem o dicionário de fácies,
+    # então o sistema é importado direto
+    fis_system = SystemService().import_file(p_filename)
+    service = FuzzyControlApplicationService()
+    service.fisSystem = fis_system
+    service.fuzzyController = ControllerCacheService.create_controller(
+        fis_system)
+
+    # Sem o cache de resultados, para medir o cálculo de todas as células
+    if hasattr(service.fuzzyController, 'result_cache'):
+        service.fuzzyController.result_cache = None
+
+    return service
+
+
+def get_command_input(p_service: FuzzyControlApplicationService,
+                      p_rows: int,
+                      p_cols: int) -> FuzzyControlCommandInput:
+    rng = np.random.default_rng(0)
+    command_input = FuzzyControlCommandInput()
+    command_input.set_matrix_dimension(p_rows, p_cols)
+
+    for f_input in p_service.fisSystem.inputs.values():
+        values = rng.uniform(*f_input.range, size=(p_rows, p_cols))
+        for row in range(p_rows):
+            for col in range(p_cols):
+                command_input.add_fuzzy_inputs_matrix(row, col, f_input.name,
+                                                      values[row][col])
+
+    return command_input
+
+
+def get_output_matrix(p_service: FuzzyControlApplicationService,
+                      p_rows: int,
+                      p_cols: int) -> np.ndarray:
+    return np.array([[p_service.get_fuzzy_output_matrix(row, col)
+                      for col in range(p_cols)] for row in range(p_rows)])
+
+
+def run(p_filename: str, p_rows: int, p_cols: int, p_workers: int):
+    results = dict()
+    times = dict()
+    for name, method in [
+            ('serial', FuzzyControlApplicationService.process_fuzzy_matrix),
+            ('threads', FuzzyControlApplicationService.
+             process_fuzzy_matrix_multithread),
+            ('processos', lambda service, command_input:
+             service.process_fuzzy_matrix_parallel(command_input)),
+            ('vetorizado', FuzzyControlApplicationService.
+             process_fuzzy_matrix_vectorized)]:
+        service = create_service(p_filename)
+        service.number_of_workers = p_workers
+        command_input = get_command_input(service, p_rows, p_cols)
+
+        start = time.perf_counter()
+        method(service, command_input)
+        times[name] = time.perf_counter() - start
+        results[name] = get_output_matrix(service, p_rows, p_cols)
+
+    print(f"{p_filename} ({p_rows}x{p_cols}, {p_workers} workers, "
+          f"{TileScheduler.get_available_cpus()} CPUs)")
+    print(f"serial:     {times['serial']:8.3f} s")
+    print(f"threads:    {times['threads']:8.3f} s "
+          f"({times['serial'] / times['threads']:.2f}x o serial, "
+          f"iguais: {np.array_equal(results['serial'], results['threads'])})")
+    print(f"processos:  {times['processos']:8.3f} s "
+          f"({times['serial'] / times['processos']:.2f}x o serial, "
+          f"{times['threads'] / times['processos']:.2f}x as threads, "
+          f"iguais: {np.array_equal(results['serial'], results['processos'])})")
+    print(f"vetorizado: {times['vetorizado']:8.3f} s "
+          f"({times['serial'] / times['vetorizado']:.2f}x o serial, "
+          f"diferença máxima "
+          f"{np.max(np.abs(results['serial'] - results['vetorizado'])):.2e})")
+
+
+def main(args):
+    rows = int(args[0]) if len(args) > 0 else DEFAULT_ROWS
+    cols = int(args[1]) if len(args) > 1 else DEFAULT_COLS
+    workers = int(args[2]) if len(args) > 2 else TileScheduler.get_available_cpus()
+    filenames = args[3:] if len(args) > 3 else DEFAULT_FILENAMES
+
+    # O scikit-fuzzy gera avisos de depreciação do NumPy a cada amostra
+    warnings.simplefilter('ignore', DeprecationWarning)
+
+    for filename in filenames:
+        run(filename, rows, cols, workers)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
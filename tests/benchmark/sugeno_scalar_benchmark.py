@@ -0,0 +1,71 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+
+Benchmark do cálculo Sugeno de uma única amostra.
+
+Compara sugeno_calc_single_value com o avaliador fundido
+(sugeno_calc_fused) e informa o tempo médio por chamada em microssegundos.
+Retorna código de saída 1 quando o avaliador fundido passa do alvo.
+
+Uso, no diretório raiz do projeto:
+
+    $ python -m tests.benchmark.sugeno_scalar_benchmark [arquivo.fis] [alvo_us]
+"""
+import sys
+import timeit
+import numpy as np
+from continentalfuzzy.service.SugenoControllerService import \
+    SugenoControllerService
+from continentalfuzzy.service.SystemService import SystemService
+
+# Sistema Sugeno com o tamanho do Ramp.fis (rampa árida, 2 antecedentes e 9
+# regras)
+DEFAULT_FILENAME = "tests/test_data/Ramp_Arid.fis"
+
+# Alvo em microssegundos por chamada do avaliador fundido
+DEFAULT_TARGET_US = 10.0
+
+NUM_SAMPLES = 1000
+NUM_REPEATS = 5
+
+
+def get_samples(p_service: SugenoControllerService):
+    rng = np.random.default_rng(0)
+    inputs = p_service.sugeno_controller.fis_system.inputs.values()
+
+    return [{f_input.name: float(rng.uniform(*f_input.range))
+             for f_input in inputs}
+            for _ in range(NUM_SAMPLES)]
+
+
+def time_per_call(p_func, p_samples) -> float:
+    timer = timeit.Timer(lambda: [p_func(sample) for sample in p_samples])
+    best = min(timer.repeat(NUM_REPEATS, 1))
+
+    return best / len(p_samples) * 1e6
+
+
+def main(args):
+    filename = args[0] if len(args) > 0 else DEFAULT_FILENAME
+    target_us = float(args[1]) if len(args) > 1 else DEFAULT_TARGET_US
+
+    service = SugenoControllerService()
+    service.create_from_fis_system(SystemService().import_file(filename))
+    samples = get_samples(service)
+
+    single_us = time_per_call(service.sugeno_calc_single_value, samples)
+    fused_us = time_per_call(service.sugeno_calc_fused, samples)
+
+    print(f"{filename}")
+    print(f"sugeno_calc_single_value: {single_us:8.2f} us/chamada")
+    print(f"sugeno_calc_fused:        {fused_us:8.2f} us/chamada "
+          f"(alvo {target_us:.2f} us, {single_us / fused_us:.1f}x)")
+
+    return 0 if fused_us <= target_us else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
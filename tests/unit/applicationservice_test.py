@@ -5,9 +5,14 @@ email: rmodena@unisinos.br
 date: July, 2020
 """
 import unittest
+import numpy as np
 from continentalfuzzy.applicationservice.FuzzyControlApplicationService import FuzzyControlApplicationService
 from continentalfuzzy.dto.FuzzyControlCommandInput import FuzzyControlCommandInput
 from continentalfuzzy.dto.ProcessResult import ProcessResult
+from continentalfuzzy.service.MamdaniControllerService import MamdaniControllerService
+from continentalfuzzy.service.SugenoControllerService import SugenoControllerService
+from continentalfuzzy.service.SystemService import SystemService
+from continentalfuzzy.service.mamdani.SimulatorPool import SimulatorPool
 
 
 class FuzzyControlApplicationServiceTest(unittest.TestCase):
@@ -79,3 +84,296 @@ class FuzzyControlApplicationServiceTest(unittest.TestCase):
 
         self.assertEqual(round(result, 4), 0.0,
                          msg='Test result')
+
+    @staticmethod
+    def create_matrix_input(p_rows: int, p_cols: int):
+        my_generator = np.random.default_rng(7)
+        fuzzyControlCommandInput = FuzzyControlCommandInput()
+        fuzzyControlCommandInput.set_matrix_dimension(p_rows, p_cols)
+        for my_name, my_range in [('Distance', (0, 1)),
+                                  ('Slope', (0, 0.07)),
+                                  ('Depth', (0, 300))]:
+            my_values = my_generator.uniform(*my_range, (p_rows, p_cols))
+            for my_row in range(p_rows):
+                for my_col in range(p_cols):
+                    fuzzyControlCommandInput.add_fuzzy_inputs_matrix(
+                        my_row, my_col, my_name, my_values[my_row][my_col])
+
+        return fuzzyControlCommandInput
+
+    @staticmethod
+    def create_matrix_service(p_filename: str):
+        # O init_fuzzy_control importa com o dicionário de fácies, que só
+        # existe no Sugeno
+        my_system = SystemService().import_file(p_filename)
+        my_controller = MamdaniControllerService()
+        my_controller.create_from_fis_system(my_system)
+
+        fuzzyControlApplicationService = FuzzyControlApplicationService()
+        fuzzyControlApplicationService.fisSystem = my_system
+        fuzzyControlApplicationService.fuzzyController = my_controller
+
+        return fuzzyControlApplicationService
+
+    @staticmethod
+    def get_output_matrix(p_service, p_rows: int, p_cols: int):
+        return np.array([[p_service.get_fuzzy_output_matrix(my_row, my_col)
+                          for my_col in range(p_cols)]
+                         for my_row in range(p_rows)])
+
+    def test_process_fuzzy_matrix_multithread(self):
+        fuzzyControlCommandInput = self.create_matrix_input(8, 3)
+
+        my_sequential = self.create_matrix_service(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_sequential.process_fuzzy_matrix(fuzzyControlCommandInput)
+
+        my_threads = self.create_matrix_service(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_threads.number_of_workers = 4
+        my_threads.process_fuzzy_matrix_multithread(fuzzyControlCommandInput)
+
+        self.assertTrue(np.array_equal(
+            self.get_output_matrix(my_sequential, 8, 3),
+            self.get_output_matrix(my_threads, 8, 3)),
+            msg='Test process_fuzzy_matrix_multithread')
+        self.assertEqual(my_threads.get_fuzzy_errors(),
+                         my_sequential.get_fuzzy_errors(),
+                         msg='Test process_fuzzy_matrix_multithread errors')
+        self.assertLessEqual(
+            my_threads.fuzzyController.simulator_pool.created, 4,
+            msg='Test process_fuzzy_matrix_multithread pool size')
+
+    def test_process_fuzzy_matrix_multithread_tiles(self):
+        # Menos linhas que workers e blocos que não dividem a matriz
+        fuzzyControlCommandInput = self.create_matrix_input(3, 5)
+
+        my_sequential = self.create_matrix_service(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_sequential.process_fuzzy_matrix(fuzzyControlCommandInput)
+
+        my_threads = self.create_matrix_service(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_threads.number_of_workers = 8
+        my_threads.tile_shape = (2, 2)
+        my_threads.process_fuzzy_matrix_multithread(fuzzyControlCommandInput)
+
+        self.assertTrue(np.array_equal(
+            self.get_output_matrix(my_sequential, 3, 5),
+            self.get_output_matrix(my_threads, 3, 5)),
+            msg='Test process_fuzzy_matrix_multithread_tiles')
+
+    def test_number_of_workers_exception_1(self):
+        my_service = FuzzyControlApplicationService()
+
+        with self.assertRaises(Exception) as context:
+            my_service.number_of_workers = 0
+
+        self.assertEqual(str(context.exception),
+                         "O número de workers precisa ser maior que zero!",
+                         msg='Test number_of_workers exception 1')
+
+    def test_process_fuzzy_matrix_parallel(self):
+        fuzzyControlCommandInput = self.create_matrix_input(7, 3)
+
+        my_sequential = self.create_matrix_service(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_sequential.process_fuzzy_matrix(fuzzyControlCommandInput)
+
+        my_processes = self.create_matrix_service(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_processes.process_fuzzy_matrix_parallel(fuzzyControlCommandInput,
+                                                   2)
+
+        self.assertTrue(np.array_equal(
+            self.get_output_matrix(my_sequential, 7, 3),
+            self.get_output_matrix(my_processes, 7, 3)),
+            msg='Test process_fuzzy_matrix_parallel')
+
+        my_errors = self.create_matrix_service(
+            "tests/test_data/Tip_mamdani.fis")
+        my_errors.process_fuzzy_matrix_parallel(fuzzyControlCommandInput, 2)
+        self.assertEqual(len(my_errors.get_fuzzy_errors()), 21,
+                         msg='Test process_fuzzy_matrix_parallel errors')
+
+    def test_process_fuzzy_matrix_vectorized(self):
+        fuzzyControlCommandInput = self.create_matrix_input(9, 4)
+
+        my_sequential = self.create_matrix_service(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_sequential.process_fuzzy_matrix(fuzzyControlCommandInput)
+
+        my_vectorized = self.create_matrix_service(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_vectorized.MATRIX_CHUNK_CELLS = 8
+        my_vectorized.process_fuzzy_matrix_vectorized(fuzzyControlCommandInput)
+
+        self.assertTrue(np.allclose(
+            self.get_output_matrix(my_sequential, 9, 4),
+            self.get_output_matrix(my_vectorized, 9, 4), atol=1e-9),
+            msg='Test process_fuzzy_matrix_vectorized')
+        self.assertEqual(my_vectorized.get_fuzzy_errors(), [],
+                         msg='Test process_fuzzy_matrix_vectorized errors')
+
+    def test_process_fuzzy_matrix_vectorized_overlap(self):
+        # Consequente com funções de pertinência trapezoidais sobrepostas,
+        # em que o centroide analítico difere do centroide do scikit-fuzzy
+        my_generator = np.random.default_rng(5)
+        fuzzyControlCommandInput = FuzzyControlCommandInput()
+        fuzzyControlCommandInput.set_matrix_dimension(10, 10)
+        for my_name in ['service', 'food']:
+            fuzzyControlCommandInput.set_fuzzy_inputs_matrix(
+                my_name, my_generator.uniform(0, 10, (10, 10)))
+
+        my_sequential = self.create_matrix_service(
+            "tests/test_data/Tip_mamdani_overlap_output1.fis")
+        my_sequential.process_fuzzy_matrix(fuzzyControlCommandInput)
+
+        my_vectorized = self.create_matrix_service(
+            "tests/test_data/Tip_mamdani_overlap_output1.fis")
+        my_vectorized.process_fuzzy_matrix_vectorized(fuzzyControlCommandInput)
+
+        self.assertTrue(np.allclose(
+            self.get_output_matrix(my_sequential, 10, 10),
+            self.get_output_matrix(my_vectorized, 10, 10), atol=1e-9),
+            msg='Test process_fuzzy_matrix_vectorized overlap')
+        self.assertEqual(my_vectorized.get_fuzzy_errors(),
+                         my_sequential.get_fuzzy_errors(),
+                         msg='Test process_fuzzy_matrix_vectorized overlap '
+                             'errors')
+
+    def test_process_fuzzy_matrix_vectorized_facies(self):
+        my_generator = np.random.default_rng(3)
+        fuzzyControlCommandInput = FuzzyControlCommandInput()
+        fuzzyControlCommandInput.set_matrix_dimension(6, 5)
+        fuzzyControlCommandInput.set_fuzzy_inputs_matrix(
+            'Depth', my_generator.uniform(0, 3000, (6, 5)))
+        fuzzyControlCommandInput.set_fuzzy_inputs_matrix(
+            'EnergyDissipation', my_generator.uniform(0, 1, (6, 5)))
+
+        my_services = list()
+        for _ in range(2):
+            my_system = SystemService().import_file(
+                "tests/test_data/Ramp_Arid.fis", True)
+            my_controller = SugenoControllerService()
+            my_controller.create_from_fis_system(my_system)
+
+            my_service = FuzzyControlApplicationService()
+            my_service.fisSystem = my_system
+            my_service.fuzzyController = my_controller
+            my_services.append(my_service)
+
+        my_services[0].process_fuzzy_matrix(fuzzyControlCommandInput)
+        my_services[1].process_fuzzy_matrix_vectorized(fuzzyControlCommandInput)
+
+        self.assertTrue(np.array_equal(
+            self.get_output_matrix(my_services[0], 6, 5),
+            self.get_output_matrix(my_services[1], 6, 5), equal_nan=True),
+            msg='Test process_fuzzy_matrix_vectorized facies')
+
+    def test_process_fuzzy_matrix_vectorized_errors(self):
+        fuzzyControlCommandInput = self.create_matrix_input(3, 2)
+        fuzzyControlCommandInput.set_fuzzy_inputs_matrix('Width',
+                                                         np.zeros((3, 2)))
+
+        # O antecedente a mais é um erro em todas as células
+        my_sequential = self.create_matrix_service(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_sequential.process_fuzzy_matrix(fuzzyControlCommandInput)
+
+        my_vectorized = self.create_matrix_service(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_vectorized.process_fuzzy_matrix_vectorized(fuzzyControlCommandInput)
+
+        self.assertEqual(len(my_vectorized.get_fuzzy_errors()), 6,
+                         msg='Test process_fuzzy_matrix_vectorized errors')
+        self.assertEqual(my_vectorized.get_fuzzy_errors(),
+                         my_sequential.get_fuzzy_errors(),
+                         msg='Test process_fuzzy_matrix_vectorized same errors')
+
+    def test_process_fuzzy_matrix_nodata(self):
+        fuzzyControlCommandInput = self.create_matrix_input(4, 5)
+        fuzzyControlCommandInput.get_fuzzy_inputs_matrix()['Depth'][1] = -1
+        fuzzyControlCommandInput.set_nodata_value('Depth', -1)
+        my_mask = np.zeros((4, 5), dtype=bool)
+        my_mask[:, 0] = True
+        fuzzyControlCommandInput.set_fuzzy_inputs_mask('Slope', my_mask)
+
+        my_all = self.create_matrix_service(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_all.process_fuzzy_matrix(self.create_matrix_input(4, 5))
+
+        for my_method in ['process_fuzzy_matrix',
+                          'process_fuzzy_matrix_multithread',
+                          'process_fuzzy_matrix_parallel',
+                          'process_fuzzy_matrix_vectorized']:
+            my_service = self.create_matrix_service(
+                "tests/test_data/EnvironmentMamdani.fis")
+            my_service.fill_value = np.nan
+            getattr(my_service, my_method)(fuzzyControlCommandInput)
+
+            my_skipped = my_service.get_fuzzy_output_mask()
+            self.assertEqual(int(my_skipped.sum()), 5 + 4 - 1,
+                             msg=f'Test {my_method} nodata mask')
+            self.assertTrue(np.isnan(my_service.get_fuzzy_output()[my_skipped]).all(),
+                            msg=f'Test {my_method} nodata fill_value')
+            self.assertTrue(np.allclose(
+                my_service.get_fuzzy_output()[~my_skipped],
+                self.get_output_matrix(my_all, 4, 5)[~my_skipped], atol=1e-9),
+                msg=f'Test {my_method} nodata active cells')
+
+    def test_get_fuzzy_output_mask_errors(self):
+        fuzzyControlCommandInput = self.create_matrix_input(2, 3)
+
+        # O consequente do Tip_mamdani.fis não se chama output1
+        my_service = self.create_matrix_service(
+            "tests/test_data/Tip_mamdani.fis")
+        my_service.fill_value = -1
+        my_service.process_fuzzy_matrix_vectorized(fuzzyControlCommandInput)
+
+        self.assertTrue(my_service.get_fuzzy_output_mask().all(),
+                        msg='Test get_fuzzy_output_mask errors')
+        self.assertTrue((my_service.get_fuzzy_output() == -1).all(),
+                        msg='Test get_fuzzy_output fill_value')
+
+    def test_fill_value_exception_1(self):
+        my_service = FuzzyControlApplicationService()
+
+        with self.assertRaises(Exception) as context:
+            my_service.fill_value = 'nodata'
+
+        self.assertEqual(str(context.exception),
+                         "O valor de preenchimento precisa ser um número!",
+                         msg='Test fill_value exception 1')
+
+    def test_process_fuzzy_matrix_errors(self):
+        fuzzyControlCommandInput = self.create_matrix_input(4, 2)
+
+        # O consequente do Tip_mamdani.fis não se chama output1
+        my_service = self.create_matrix_service(
+            "tests/test_data/Tip_mamdani.fis")
+        my_service.number_of_workers = 2
+        my_service.process_fuzzy_matrix_multithread(fuzzyControlCommandInput)
+
+        my_errors = my_service.get_fuzzy_errors()
+        self.assertEqual(len(my_errors), 8,
+                         msg='Test process_fuzzy_matrix_errors')
+        self.assertEqual(my_errors[0][:2], (0, 0),
+                         msg='Test process_fuzzy_matrix_errors cell')
+
+    def test_simulator_pool(self):
+        my_service = self.create_matrix_service(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_pool = SimulatorPool(my_service.fuzzyController.fuzzy_machine
+                                .controller, max_size=2)
+
+        with my_pool.simulator() as my_first:
+            with my_pool.simulator() as my_second:
+                self.assertIsNot(my_first, my_second,
+                                 msg='Test simulator_pool distinct')
+
+        with my_pool.simulator() as my_third:
+            self.assertIn(my_third, (my_first, my_second),
+                          msg='Test simulator_pool reuse')
+
+        self.assertEqual(my_pool.created, 2, msg='Test simulator_pool created')
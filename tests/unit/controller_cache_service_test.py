@@ -0,0 +1,134 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from continentalfuzzy.applicationservice.FuzzyControlApplicationService import FuzzyControlApplicationService
+from continentalfuzzy.dto.FuzzyControlCommandInput import FuzzyControlCommandInput
+from continentalfuzzy.service.ControllerCacheService import \
+    ControllerCacheService
+from continentalfuzzy.service.MamdaniControllerService import \
+    MamdaniControllerService
+from continentalfuzzy.service.SugenoControllerService import \
+    SugenoControllerService
+
+
+class ControllerCacheServiceTest(unittest.TestCase):
+    def setUp(self):
+        ControllerCacheService.clear_cache()
+
+    def tearDown(self):
+        ControllerCacheService.CACHE_SIZE = 16
+        ControllerCacheService.clear_cache()
+
+    def test_get_controller(self):
+        my_first = ControllerCacheService.get_controller(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_second = ControllerCacheService.get_controller(
+            "tests/test_data/EnvironmentMamdani.fis")
+
+        self.assertIsInstance(my_first[1], MamdaniControllerService,
+                              msg='Test get_controller mamdani')
+        self.assertIs(my_first[1], my_second[1],
+                      msg='Test get_controller cache')
+        self.assertEqual(ControllerCacheService.get_cache_info(),
+                         {'hits': 1, 'misses': 1, 'size': 1},
+                         msg='Test get_controller cache info')
+
+        my_sugeno = ControllerCacheService.get_controller(
+            "tests/test_data/Tip_fuzzylite_2.fis")
+        self.assertIsInstance(my_sugeno[1], SugenoControllerService,
+                              msg='Test get_controller sugeno')
+
+    def test_get_controller_facies(self):
+        my_first = ControllerCacheService.get_controller(
+            "tests/test_data/Ramp_Arid.fis", False)
+        my_second = ControllerCacheService.get_controller(
+            "tests/test_data/Ramp_Arid.fis", True)
+
+        self.assertIsNot(my_first[1], my_second[1],
+                         msg='Test get_controller facies')
+        self.assertTrue(my_second[0].use_dict_facies_association,
+                        msg='Test get_controller facies flag')
+
+    def test_get_controller_modified(self):
+        my_dir = tempfile.mkdtemp()
+        try:
+            my_filename = os.path.join(my_dir, "Tip_mamdani.fis")
+            shutil.copy("tests/test_data/Tip_mamdani.fis", my_filename)
+            my_first = ControllerCacheService.get_controller(my_filename)
+
+            with open(my_filename, 'a') as my_file:
+                my_file.write("\n")
+            my_second = ControllerCacheService.get_controller(my_filename)
+
+            self.assertIsNot(my_first[1], my_second[1],
+                             msg='Test get_controller modified')
+            self.assertEqual(ControllerCacheService.get_cache_info()['misses'],
+                             2, msg='Test get_controller modified misses')
+        finally:
+            shutil.rmtree(my_dir)
+
+    def test_get_controller_lru(self):
+        ControllerCacheService.CACHE_SIZE = 2
+        ControllerCacheService.get_controller(
+            "tests/test_data/Tip_mamdani.fis")
+        ControllerCacheService.get_controller(
+            "tests/test_data/Tip_fuzzylite_1.fis")
+        ControllerCacheService.get_controller(
+            "tests/test_data/Tip_mamdani.fis")
+        ControllerCacheService.get_controller(
+            "tests/test_data/Tip_fuzzylite_2.fis")
+
+        self.assertEqual(ControllerCacheService.get_cache_info(),
+                         {'hits': 1, 'misses': 3, 'size': 2},
+                         msg='Test get_controller lru')
+
+        # Tip_fuzzylite_1.fis foi usado há mais tempo e foi descartado
+        ControllerCacheService.get_controller(
+            "tests/test_data/Tip_mamdani.fis")
+        ControllerCacheService.get_controller(
+            "tests/test_data/Tip_fuzzylite_1.fis")
+
+        self.assertEqual(ControllerCacheService.get_cache_info(),
+                         {'hits': 2, 'misses': 4, 'size': 2},
+                         msg='Test get_controller lru evicted')
+
+    def test_process_fuzzy_control_cache(self):
+        my_input = FuzzyControlCommandInput()
+        my_input.filename = "tests/test_data/EnvironmentMamdani.fis"
+        my_input.set_use_dict_facies_association(False)
+        my_input.fuzzy_inputs = {'Distance': 0.3, 'Slope': 0.0015,
+                                 'Depth': 50}
+        my_input.fuzzy_output = 'output1'
+
+        my_first = FuzzyControlApplicationService.process_fuzzy_control(
+            my_input)
+        my_second = FuzzyControlApplicationService.process_fuzzy_control(
+            my_input)
+
+        self.assertEqual(round(my_first, 4), 1.6539,
+                         msg='Test process_fuzzy_control_cache result')
+        self.assertEqual(my_first, my_second,
+                         msg='Test process_fuzzy_control_cache')
+        self.assertEqual(ControllerCacheService.get_cache_info(),
+                         {'hits': 1, 'misses': 1, 'size': 1},
+                         msg='Test process_fuzzy_control_cache info')
+
+    def test_get_controller_exception_1(self):
+        with self.assertRaises(Exception) as context:
+            ControllerCacheService.get_controller(
+                "tests/test_data/Missing.fis")
+
+        self.assertEqual(str(context.exception),
+                         "O arquivo tests/test_data/Missing.fis não existe!",
+                         msg='Test get_controller exception 1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ email: rmodena@unisinos.br
 date: July, 2020
 """
 import unittest
+import numpy as np
 from continentalfuzzy.dto.FuzzyControlCommandInput import \
     FuzzyControlCommandInput
 
@@ -89,4 +90,58 @@ class FuzzyControlCommandInputTest(unittest.TestCase):
 
         self.assertEqual(my_use_dict_facies_association,
                          my_command_input.use_dict_facies_association,
-                         msg='Test set_use_dict_facies_association')
\ No newline at end of file
+                         msg='Test set_use_dict_facies_association')
+
+    def test_set_fuzzy_inputs_matrix(self):
+        my_command_input = FuzzyControlCommandInput()
+        my_command_input.set_matrix_dimension(2, 3)
+        my_matrix = np.arange(6, dtype=np.float64).reshape((2, 3))
+        my_command_input.set_fuzzy_inputs_matrix('Depth', my_matrix)
+
+        self.assertIs(my_command_input.get_fuzzy_inputs_matrix()['Depth'],
+                      my_matrix,
+                      msg='Test set_fuzzy_inputs_matrix')
+
+    def test_set_fuzzy_inputs_matrix_exception_1(self):
+        my_command_input = FuzzyControlCommandInput()
+        my_command_input.set_matrix_dimension(2, 3)
+
+        with self.assertRaises(Exception) as context:
+            my_command_input.set_fuzzy_inputs_matrix('Depth', np.zeros(6))
+
+        self.assertEqual(str(context.exception),
+                         "A matriz não possui a dimensão informada!",
+                         msg='Test set_fuzzy_inputs_matrix exception 1')
+
+    def test_get_inactive_mask(self):
+        my_command_input = FuzzyControlCommandInput()
+        my_command_input.set_matrix_dimension(2, 3)
+        my_command_input.set_fuzzy_inputs_matrix(
+            'Depth', np.array([[-1.0, 10, 20], [30, -1.0, 40]]))
+        my_command_input.set_fuzzy_inputs_matrix(
+            'Slope', np.array([[0.1, np.nan, 0.2], [0.3, 0.4, 0.5]]))
+        my_command_input.set_nodata_value('Depth', -1)
+        my_command_input.set_nodata_value('Slope', np.nan)
+        my_command_input.set_fuzzy_inputs_mask(
+            'Depth', [[False, False, False], [False, False, True]])
+
+        self.assertEqual(my_command_input.get_inactive_mask().tolist(),
+                         [[True, True, False], [False, True, True]],
+                         msg='Test get_inactive_mask')
+
+        my_command_input.set_nodata_value('Depth', None)
+        my_command_input.set_fuzzy_inputs_mask('Depth', None)
+        self.assertEqual(my_command_input.get_inactive_mask().tolist(),
+                         [[False, True, False], [False, False, False]],
+                         msg='Test get_inactive_mask removed')
+
+    def test_set_fuzzy_inputs_mask_exception_1(self):
+        my_command_input = FuzzyControlCommandInput()
+        my_command_input.set_matrix_dimension(2, 3)
+
+        with self.assertRaises(Exception) as context:
+            my_command_input.set_fuzzy_inputs_mask('Depth', np.zeros((3, 2)))
+
+        self.assertEqual(str(context.exception),
+                         "A máscara não possui a dimensão informada!",
+                         msg='Test set_fuzzy_inputs_mask exception 1')
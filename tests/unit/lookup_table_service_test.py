@@ -0,0 +1,173 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from continentalfuzzy.domain.LookupTable import LookupTable
+from continentalfuzzy.service.LookupTableService import LookupTableService
+from continentalfuzzy.service.MamdaniControllerService import \
+    MamdaniControllerService
+from continentalfuzzy.service.SugenoControllerService import \
+    SugenoControllerService
+from continentalfuzzy.service.SystemService import SystemService
+
+
+class LookupTableServiceTest(unittest.TestCase):
+    @staticmethod
+    def create_service(p_filename: str) -> LookupTableService:
+        my_system = SystemService().import_file(p_filename)
+        if my_system.type.name == 'mamdani':
+            my_controller = MamdaniControllerService()
+        else:
+            my_controller = SugenoControllerService()
+        my_controller.create_from_fis_system(my_system)
+
+        return LookupTableService(my_controller)
+
+    def test_create_table(self):
+        my_service = self.create_service(
+            "tests/test_data/Tip_fuzzylite_multi.fis")
+        my_table = my_service.create_table([5, 7])
+
+        self.assertEqual(my_table.grid_shape, (5, 7),
+                         msg='Test create_table grid_shape')
+        self.assertEqual(my_table.values.shape, (2, 5, 7),
+                         msg='Test create_table values')
+        self.assertEqual(my_table.output_names, ['Tip', 'TipLinear'],
+                         msg='Test create_table output_names')
+
+        # Nos pontos da grade a interpolação é o próprio valor do controlador
+        my_grid = np.meshgrid(*my_table.axes, indexing='ij')
+        my_inputs = dict(zip(my_table.input_names, my_grid))
+        my_controller = my_service.controller_service
+        my_exact = my_controller.sugeno_calc_batch_outputs(my_inputs)
+        for my_output in my_table.output_names:
+            np.testing.assert_allclose(
+                my_service.interpolate(my_inputs, my_output),
+                my_exact[my_output], atol=1e-12,
+                err_msg='Test create_table interpolate grid')
+
+    def test_interpolate(self):
+        my_service = self.create_service("tests/test_data/Tip_mamdani.fis")
+        my_table = my_service.create_table(3)
+        my_axes = my_table.axes
+
+        # Ponto no centro de uma célula: média dos vértices
+        my_inputs = {my_table.input_names[0]: np.mean(my_axes[0][:2]),
+                     my_table.input_names[1]: np.mean(my_axes[1][:2])}
+        my_expected = np.mean(my_table.values[0, :2, :2])
+
+        self.assertAlmostEqual(my_service.interpolate(my_inputs),
+                               my_expected, places=12,
+                               msg='Test interpolate')
+
+        # Valores fora dos ranges são limitados aos ranges
+        my_outside = {my_table.input_names[0]: my_axes[0][0] - 100,
+                      my_table.input_names[1]: my_axes[1][0] - 100}
+        self.assertAlmostEqual(my_service.interpolate(my_outside),
+                               my_table.values[0, 0, 0], places=12,
+                               msg='Test interpolate outside')
+
+    def test_validate(self):
+        my_service = self.create_service(
+            "tests/test_data/Tip_fuzzylite_multi.fis")
+
+        my_service.create_table(5)
+        my_coarse = my_service.validate(num_samples=200)
+        my_service.create_table(33)
+        my_fine = my_service.validate(num_samples=200)
+
+        for my_output in ['Tip', 'TipLinear']:
+            self.assertEqual(my_fine[my_output]['num_samples'], 200,
+                             msg='Test validate num_samples')
+            self.assertLessEqual(my_fine[my_output]['rms_error'],
+                                 my_fine[my_output]['max_error'],
+                                 msg='Test validate rms_error')
+            self.assertLess(my_fine[my_output]['rms_error'],
+                            my_coarse[my_output]['rms_error'],
+                            msg='Test validate grid_points')
+
+    def test_save_load(self):
+        my_dir = tempfile.mkdtemp()
+        try:
+            my_filename = os.path.join(my_dir, "Tip_mamdani.fis")
+            shutil.copy("tests/test_data/Tip_mamdani.fis", my_filename)
+
+            my_service = self.create_service(my_filename)
+            my_table = my_service.create_table(9)
+            my_saved = my_service.save()
+
+            self.assertEqual(my_saved,
+                             os.path.join(my_dir, "Tip_mamdani.lut.npz"),
+                             msg='Test save filename')
+
+            my_new_service = self.create_service(my_filename)
+            my_loaded = my_new_service.load()
+
+            self.assertEqual(my_loaded.input_names, my_table.input_names,
+                             msg='Test load input_names')
+            self.assertEqual(my_loaded.fis_hash, my_table.fis_hash,
+                             msg='Test load fis_hash')
+            np.testing.assert_array_equal(my_loaded.values, my_table.values,
+                                          err_msg='Test load values')
+
+            # A tabela não é usada quando o arquivo .fis foi alterado
+            with open(my_filename, 'a') as my_file:
+                my_file.write("\n")
+
+            with self.assertRaises(Exception) as context:
+                my_new_service.load()
+
+            self.assertEqual(str(context.exception),
+                             "A tabela não corresponde ao arquivo .fis!",
+                             msg='Test load exception')
+        finally:
+            shutil.rmtree(my_dir)
+
+    def test_lookup_table_exception_1(self):
+        with self.assertRaises(Exception) as context:
+            LookupTable(t_axes=[np.array([1.0, 0.0])])
+
+        self.assertEqual(str(context.exception),
+                         "O eixo da tabela não é crescente!",
+                         msg='Test lookup_table exception 1')
+
+    def test_lookup_table_service_exception_1(self):
+        with self.assertRaises(Exception) as context:
+            LookupTableService(100)
+
+        self.assertEqual(str(context.exception),
+                         "O controlador não é uma instância das classes "
+                         "MamdaniControllerService ou "
+                         "SugenoControllerService!",
+                         msg='Test lookup_table_service exception 1')
+
+    def test_lookup_table_service_exception_2(self):
+        my_service = self.create_service("tests/test_data/Tip_mamdani.fis")
+
+        with self.assertRaises(Exception) as context:
+            my_service.interpolate({'service': 1.0, 'food': 1.0})
+
+        self.assertEqual(str(context.exception), "A tabela não foi criada!",
+                         msg='Test lookup_table_service exception 2')
+
+    def test_lookup_table_service_exception_3(self):
+        my_service = self.create_service("tests/test_data/Tip_mamdani.fis")
+
+        with self.assertRaises(Exception) as context:
+            my_service.create_table([5])
+
+        self.assertEqual(str(context.exception),
+                         "A quantidade de pontos da grade não corresponde "
+                         "aos antecedentes!",
+                         msg='Test lookup_table_service exception 3')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,524 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import unittest
+import numpy as np
+from skfuzzy import centroid, interp_membership, trimf
+from continentalfuzzy.domain.definition.DefuzzMethods import DefuzzMethods
+from continentalfuzzy.domain.definition.ImpMethods import ImpMethods
+from continentalfuzzy.domain.definition.mamdani.CentroidModes import \
+    CentroidModes
+from continentalfuzzy.domain.definition.mamdani.UniverseModes import \
+    UniverseModes
+from continentalfuzzy.domain.mamdani.MamdaniCompiledRules import \
+    MamdaniCompiledRules
+from continentalfuzzy.domain.mamdani.UniverseResolution import \
+    UniverseResolution
+from continentalfuzzy.service.MamdaniControllerService import \
+    MamdaniControllerService
+from continentalfuzzy.service.SystemService import SystemService
+from continentalfuzzy.service.mamdani.CentroidDefuzzMethod import \
+    CentroidDefuzzMethod
+from continentalfuzzy.service.mamdani.LinearCentroidDefuzzMethod import \
+    LinearCentroidDefuzzMethod
+from continentalfuzzy.service.mamdani.MamdaniControlSystem import \
+    MamdaniControlSystem
+from continentalfuzzy.service.mamdani.RefinedDefuzzMethod import \
+    RefinedDefuzzMethod
+
+
+class MamdaniControllerServiceTest(unittest.TestCase):
+    @staticmethod
+    def create_controller(p_filename: str) -> MamdaniControllerService:
+        my_system = SystemService().import_file(p_filename)
+        my_controller = MamdaniControllerService()
+        my_controller.create_from_fis_system(my_system)
+
+        return my_controller
+
+    @staticmethod
+    def calc_reference(p_controller: MamdaniControllerService,
+                       p_inputs: dict,
+                       p_output: str) -> np.ndarray:
+        my_shape = next(iter(p_inputs.values())).shape
+        my_result = list()
+        for my_values in zip(*[np.ravel(value) for value in
+                               p_inputs.values()]):
+            my_result.append(p_controller.fuzzy_calc_single_value(
+                dict(zip(p_inputs.keys(), my_values)), p_output))
+
+        return np.array(my_result).reshape(my_shape)
+
+    def test_create_rules_from_fis(self):
+        my_controller = self.create_controller(
+            "tests/test_data/Tip_mamdani.fis")
+        my_rules = my_controller.fuzzy_machine.rules
+
+        self.assertEqual(len(my_rules), 5,
+                         msg='Test create_rules_from_fis')
+        self.assertEqual(my_rules[0].antecedent.kind, 'or',
+                         msg='Test create_rules_from_fis or')
+        self.assertEqual(my_rules[3].antecedent.kind, 'and',
+                         msg='Test create_rules_from_fis and')
+        self.assertEqual(my_rules[4].antecedent.term1.kind, 'not',
+                         msg='Test create_rules_from_fis not')
+        self.assertEqual(my_rules[2].consequent[0].weight, 0.5,
+                         msg='Test create_rules_from_fis weight')
+
+    def test_mamdani_control_system(self):
+        my_controller = self.create_controller(
+            "tests/test_data/Tip_mamdani.fis")
+        my_control_system = my_controller.fuzzy_machine.controller
+
+        self.assertIsInstance(my_control_system, MamdaniControlSystem,
+                              msg='Test mamdani_control_system')
+        self.assertEqual(list(my_control_system.rules),
+                         my_controller.fuzzy_machine.rules,
+                         msg='Test mamdani_control_system rules')
+        self.assertEqual(sorted(my_input.label for my_input in
+                                my_control_system.antecedents),
+                         ['food', 'service'],
+                         msg='Test mamdani_control_system antecedents')
+        self.assertEqual([my_output.label for my_output in
+                          my_control_system.consequents], ['tip'],
+                         msg='Test mamdani_control_system consequents')
+
+    def test_compile_rules(self):
+        my_controller = self.create_controller(
+            "tests/test_data/Tip_mamdani.fis")
+        my_compiled = my_controller.fuzzy_machine.compiled_rules
+
+        self.assertIsInstance(my_compiled, MamdaniCompiledRules,
+                              msg='Test compile_rules')
+        self.assertEqual(my_compiled.num_rules, 5,
+                         msg='Test compile_rules num_rules')
+        self.assertEqual(my_compiled.output_names, ['tip'],
+                         msg='Test compile_rules output_names')
+        self.assertEqual(my_compiled.output_mf_index.tolist(),
+                         [[0, 1, 2, 2, 1]],
+                         msg='Test compile_rules output_mf_index')
+        self.assertEqual(my_compiled.or_mask.tolist(),
+                         [True, False, True, False, False],
+                         msg='Test compile_rules or_mask')
+        self.assertEqual(my_compiled.term_index[1].tolist(),
+                         [2, MamdaniCompiledRules.DONT_CARE],
+                         msg='Test compile_rules term_index')
+        self.assertEqual(my_compiled.term_not.tolist(),
+                         [False, False, False, False, False, True, True],
+                         msg='Test compile_rules term_not')
+
+    def test_fuzzy_calc_native(self):
+        my_controller = self.create_controller(
+            "tests/test_data/Tip_mamdani.fis")
+        my_grid = np.linspace(-1, 11, 13)
+        my_inputs = dict(zip(['service', 'food'],
+                             np.meshgrid(my_grid, my_grid)))
+
+        my_result = my_controller.fuzzy_calc_native(my_inputs, 'tip')
+        my_expected = self.calc_reference(my_controller, my_inputs, 'tip')
+
+        self.assertEqual(my_result.shape, (13, 13),
+                         msg='Test fuzzy_calc_native shape')
+        self.assertTrue(np.allclose(my_result, my_expected),
+                        msg='Test fuzzy_calc_native')
+
+    def test_fuzzy_calc_native_single_value(self):
+        my_controller = self.create_controller(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_inputs = {'Distance': 0.3, 'Slope': 0.0015, 'Depth': 50}
+
+        my_result = my_controller.fuzzy_calc_native(my_inputs, 'output1')
+
+        self.assertIsInstance(my_result, float,
+                              msg='Test fuzzy_calc_native_single_value type')
+        self.assertAlmostEqual(
+            my_result,
+            my_controller.fuzzy_calc_single_value(my_inputs, 'output1'),
+            msg='Test fuzzy_calc_native_single_value')
+
+    def test_fuzzy_calc_native_gauss(self):
+        my_controller = self.create_controller("tests/test_data/Shelf.fis")
+        my_generator = np.random.default_rng(11)
+        my_inputs = {'Climate': my_generator.uniform(0, 1, 40),
+                     'Depth': my_generator.uniform(0, 3000, 40),
+                     'WaveEnergy': my_generator.uniform(0, 1, 40)}
+
+        my_result = my_controller.fuzzy_calc_native(my_inputs,
+                                                    'FaciesAssociation')
+        my_expected = self.calc_reference(my_controller, my_inputs,
+                                          'FaciesAssociation')
+
+        self.assertTrue(np.allclose(my_result, my_expected),
+                        msg='Test fuzzy_calc_native_gauss')
+
+    def test_fuzzy_calc_native_chunks(self):
+        my_controller = self.create_controller(
+            "tests/test_data/Tip_mamdani.fis")
+        my_generator = np.random.default_rng(5)
+        my_inputs = {'service': my_generator.uniform(0, 10, 50),
+                     'food': my_generator.uniform(0, 10, 50)}
+
+        my_expected = my_controller.fuzzy_calc_native(my_inputs, 'tip')
+        my_controller.BATCH_CHUNK_ELEMENTS = 32
+        my_result = my_controller.fuzzy_calc_native(my_inputs, 'tip')
+
+        self.assertTrue(np.allclose(my_result, my_expected),
+                        msg='Test fuzzy_calc_native_chunks')
+
+    def test_fuzzy_calc_native_analytic(self):
+        my_filename = "tests/test_data/Tip_mamdani_overlap.fis"
+        my_controller = self.create_controller(my_filename)
+        my_reference = MamdaniControllerService()
+        my_reference.universe_resolution = UniverseResolution(
+            UniverseModes.fixed, r_num_points=200001)
+        my_reference.centroid_mode = CentroidModes.sampled
+        my_reference.create_from_fis_system(
+            SystemService().import_file(my_filename))
+
+        my_grid = np.linspace(0, 10, 11)
+        my_inputs = dict(zip(['service', 'food'],
+                             np.meshgrid(my_grid, my_grid)))
+
+        self.assertTrue(my_controller.use_analytic_centroid(0),
+                        msg='Test fuzzy_calc_native_analytic automatic')
+        my_result = my_controller.fuzzy_calc_native(my_inputs, 'tip')
+        my_expected = my_reference.fuzzy_calc_native(my_inputs, 'tip')
+
+        # O universo fino só se aproxima do degrau do trapézio 'average'
+        self.assertTrue(np.allclose(my_result, my_expected, atol=1e-4),
+                        msg='Test fuzzy_calc_native_analytic')
+
+    def test_fuzzy_calc_native_centroid_mode(self):
+        my_filename = "tests/test_data/Tip_mamdani_overlap.fis"
+        my_controller = self.create_controller(my_filename)
+        my_sampled = MamdaniControllerService()
+        my_sampled.centroid_mode = CentroidModes.sampled
+        my_sampled.create_from_fis_system(
+            SystemService().import_file(my_filename))
+
+        my_grid = np.linspace(0, 10, 11)
+        my_inputs = dict(zip(['service', 'food'],
+                             np.meshgrid(my_grid, my_grid)))
+
+        # O modo informado vale somente para o cálculo
+        self.assertTrue(np.array_equal(
+            my_controller.fuzzy_calc_native(my_inputs, 'tip',
+                                            CentroidModes.sampled),
+            my_sampled.fuzzy_calc_native(my_inputs, 'tip')),
+            msg='Test fuzzy_calc_native centroid_mode')
+        self.assertEqual(my_controller.centroid_mode, CentroidModes.automatic,
+                         msg='Test fuzzy_calc_native centroid_mode unchanged')
+
+    def test_fuzzy_calc_native_analytic_sampled(self):
+        my_controller = self.create_controller("tests/test_data/Shelf.fis")
+
+        self.assertFalse(my_controller.use_analytic_centroid(0),
+                         msg='Test fuzzy_calc_native_analytic_sampled')
+
+        my_controller = self.create_controller(
+            "tests/test_data/Tip_mamdani.fis")
+        my_generator = np.random.default_rng(3)
+        my_inputs = {'service': my_generator.uniform(0, 10, 50),
+                     'food': my_generator.uniform(0, 10, 50)}
+
+        # Sem interseções entre as funções de pertinência o universo do
+        # scikit-fuzzy já contém todos os pontos de quebra
+        my_analytic = my_controller.fuzzy_calc_native(my_inputs, 'tip')
+        my_controller.centroid_mode = CentroidModes.sampled
+        my_sampled = my_controller.fuzzy_calc_native(my_inputs, 'tip')
+
+        self.assertTrue(np.allclose(my_analytic, my_sampled),
+                        msg='Test fuzzy_calc_native_analytic_sampled tip')
+
+    def test_calculate_linear_centroid_array(self):
+        my_trapezoids = np.array([[0.0, 2.0, 2.0, 6.0],
+                                  [3.0, 5.0, 7.0, 8.0]])
+        my_cuts = np.array([[1.0, 0.6, 0.0],
+                            [0.3, 0.8, 0.0]])
+        my_universe = np.linspace(0, 10, 100001)
+
+        my_result = LinearCentroidDefuzzMethod.calculate_centroid_array(
+            [0.0, 10.0], my_trapezoids, my_cuts)
+
+        for my_sample in range(2):
+            my_aggregated = np.max(np.minimum(
+                my_cuts[:, my_sample, np.newaxis],
+                LinearCentroidDefuzzMethod.calculate_membership(
+                    my_trapezoids, my_universe)), axis=0)
+            self.assertAlmostEqual(my_result[my_sample],
+                                   centroid(my_universe, my_aggregated),
+                                   places=6,
+                                   msg='Test calculate_linear_centroid_array')
+
+        self.assertTrue(np.isnan(my_result[2]),
+                        msg='Test calculate_linear_centroid_array empty')
+
+    def test_fuzzy_calc_native_analytic_exception_1(self):
+        my_controller = self.create_controller("tests/test_data/Shelf.fis")
+        my_controller.centroid_mode = CentroidModes.analytic
+
+        with self.assertRaises(Exception) as exc:
+            my_controller.fuzzy_calc_native(
+                {'Climate': 0.3, 'Depth': 50, 'WaveEnergy': 0.5},
+                'FaciesAssociation')
+
+        self.assertEqual(str(exc.exception),
+                         "O centroide analítico exige funções de "
+                         "pertinência triangulares ou trapezoidais!",
+                         msg='Test fuzzy_calc_native_analytic_exception_1')
+
+    def test_fuzzy_calc_batch(self):
+        my_controller = self.create_controller("tests/test_data/Shelf.fis")
+        my_generator = np.random.default_rng(3)
+        my_inputs = {'Climate': my_generator.uniform(0, 1, (4, 5)),
+                     'Depth': my_generator.uniform(0, 3000, (4, 5)),
+                     'WaveEnergy': my_generator.uniform(0, 1, (4, 5))}
+
+        my_result = my_controller.fuzzy_calc_batch(my_inputs,
+                                                   'FaciesAssociation')
+        my_expected = self.calc_reference(my_controller, my_inputs,
+                                          'FaciesAssociation')
+
+        self.assertEqual(my_result.shape, (4, 5),
+                         msg='Test fuzzy_calc_batch shape')
+        self.assertTrue(np.allclose(my_result, my_expected),
+                        msg='Test fuzzy_calc_batch')
+
+        my_result = my_controller.fuzzy_calc_batch(my_inputs,
+                                                   ['FaciesAssociation'])
+
+        self.assertEqual(list(my_result.keys()), ['FaciesAssociation'],
+                         msg='Test fuzzy_calc_batch outputs')
+        self.assertTrue(np.allclose(my_result['FaciesAssociation'],
+                                    my_expected),
+                        msg='Test fuzzy_calc_batch outputs values')
+
+    def test_fuzzy_calc_batch_empty(self):
+        my_controller = self.create_controller(
+            "tests/test_data/Tip_mamdani_partial.fis")
+        my_inputs = {'service': np.array([1.0, 9.0, 9.0]),
+                     'food': np.array([9.0, 9.0, 1.0])}
+
+        my_result = my_controller.fuzzy_calc_batch(my_inputs, 'tip')
+
+        self.assertTrue(np.isnan(my_result[[0, 2]]).all(),
+                        msg='Test fuzzy_calc_batch_empty nan')
+        self.assertAlmostEqual(
+            my_result[1],
+            my_controller.fuzzy_calc_single_value({'service': 9.0,
+                                                   'food': 9.0}, 'tip'),
+            msg='Test fuzzy_calc_batch_empty')
+        self.assertTrue(np.allclose(
+            my_result,
+            my_controller.fuzzy_calc_native(my_inputs, 'tip'),
+            equal_nan=True), msg='Test fuzzy_calc_batch_empty native')
+
+    def test_fuzzy_calc_batch_exception_1(self):
+        my_controller = self.create_controller(
+            "tests/test_data/Tip_mamdani.fis")
+
+        with self.assertRaises(Exception) as exc:
+            my_controller.fuzzy_calc_batch({'service': [1.0], 'food': [2.0]},
+                                           ['tip', 'price'])
+
+        self.assertEqual(str(exc.exception),
+                         "O consequente price não existe!",
+                         msg='Test fuzzy_calc_batch_exception_1')
+
+    def test_calculate_centroid_array(self):
+        my_universe = np.array([0, 5, 10, 15, 20, 25, 30], dtype=np.float64)
+        my_term_mfs = np.array([[0, 1, 0, 0, 0, 0, 0],
+                                [0, 0, 0, 1, 0, 0, 0],
+                                [0, 0, 0, 0, 0, 1, 1]], dtype=np.float64)
+        my_cuts = np.array([[0.3, 0.0, 1.0, 0.0],
+                            [0.6, 0.0, 0.2, 0.0],
+                            [0.1, 0.0, 0.0, 1.0]])
+
+        my_result = CentroidDefuzzMethod.calculate_centroid_array(
+            my_universe, my_term_mfs, my_cuts)
+
+        for my_sample in (0, 2, 3):
+            my_points = set(my_universe.tolist())
+            for my_term_mf, my_cut in zip(my_term_mfs, my_cuts[:, my_sample]):
+                for my_index in range(my_universe.shape[0] - 1):
+                    my_y1, my_y2 = my_term_mf[my_index:my_index + 2]
+                    if (my_y1 >= my_cut) != (my_y2 >= my_cut):
+                        my_points.add(my_universe[my_index] + 5 *
+                                      (my_cut - my_y1) / (my_y2 - my_y1))
+            my_points = np.array(sorted(my_points))
+            my_aggregated = np.max(
+                [np.minimum(my_cut, interp_membership(my_universe, my_term_mf,
+                                                      my_points))
+                 for my_term_mf, my_cut in zip(my_term_mfs,
+                                               my_cuts[:, my_sample])],
+                axis=0)
+
+            self.assertAlmostEqual(my_result[my_sample],
+                                   centroid(my_points, my_aggregated),
+                                   msg=f'Test calculate_centroid_array '
+                                       f'{my_sample}')
+
+        self.assertTrue(np.isnan(my_result[1]),
+                        msg='Test calculate_centroid_array empty')
+
+    def test_fuzzy_calc_native_defuzz_methods(self):
+        my_generator = np.random.default_rng(11)
+        for my_filename, my_output in [
+                ("tests/test_data/EnvironmentMamdani.fis", 'output1'),
+                ("tests/test_data/Tip_mamdani_overlap.fis", 'tip')]:
+            for my_method in [DefuzzMethods.bisector, DefuzzMethods.mom,
+                              DefuzzMethods.som, DefuzzMethods.lom]:
+                my_system = SystemService().import_file(my_filename)
+                my_system.defuzz_method = my_method
+                my_controller = MamdaniControllerService()
+                my_controller.create_from_fis_system(my_system)
+
+                my_compiled = my_controller.fuzzy_machine.compiled_rules
+                my_inputs = {my_name: my_generator.uniform(
+                    my_universe[0], my_universe[-1], 40)
+                    for my_name, my_universe in
+                    zip(my_compiled.input_names,
+                        my_compiled.input_universes)}
+
+                self.assertTrue(np.allclose(
+                    my_controller.fuzzy_calc_native(my_inputs, my_output),
+                    self.calc_reference(my_controller, my_inputs, my_output),
+                    rtol=0, atol=1e-9),
+                    msg=f'Test fuzzy_calc_native {my_method.name}')
+
+    def test_calculate_refined_defuzz_arrays(self):
+        my_universe = np.linspace(0, 10, 11)
+        my_term_mfs = np.array([trimf(my_universe, [0, 5, 10])])
+        my_cuts = np.array([[1.0, 0.5, 0.0]])
+
+        my_bisector = RefinedDefuzzMethod.calculate_bisector_array(
+            my_universe, my_term_mfs, my_cuts)
+        self.assertTrue(np.allclose(my_bisector[:2], [5, 5]),
+                        msg='Test calculate_bisector_array')
+
+        # Com o corte 0.5 o máximo vai de 2.5 a 7.5, e a média usa os
+        # pontos do universo refinado
+        my_som = RefinedDefuzzMethod.calculate_som_array(
+            my_universe, my_term_mfs, my_cuts)
+        my_lom = RefinedDefuzzMethod.calculate_lom_array(
+            my_universe, my_term_mfs, my_cuts)
+        my_mom = RefinedDefuzzMethod.calculate_mom_array(
+            my_universe, my_term_mfs, my_cuts)
+        self.assertTrue(np.allclose(my_som[:2], [5, 2.5]),
+                        msg='Test calculate_som_array')
+        self.assertTrue(np.allclose(my_lom[:2], [5, 7.5]),
+                        msg='Test calculate_lom_array')
+        self.assertTrue(np.allclose(my_mom[:2], [5, 5]),
+                        msg='Test calculate_mom_array')
+
+        # Com a curva vazia todos os pontos são máximos, como no
+        # scikit-fuzzy, e o bissetor não existe
+        self.assertTrue(np.isnan(my_bisector[2]),
+                        msg='Test calculate_bisector_array empty')
+        self.assertEqual([my_som[2], my_lom[2], my_mom[2]], [0, 10, 5],
+                         msg='Test calculate refined empty')
+
+    def test_fuzzy_calc_native_no_rule(self):
+        # Parte das amostras do Tip_mamdani_partial.fis não ativa nenhuma
+        # regra
+        my_generator = np.random.default_rng(0)
+        my_inputs = {'service': my_generator.uniform(0, 10, 60),
+                     'food': my_generator.uniform(0, 10, 60)}
+
+        for my_method in MamdaniControllerService.DICT_DEFUZZ_METHODS:
+            my_system = SystemService().import_file(
+                "tests/test_data/Tip_mamdani_partial.fis")
+            my_system.defuzz_method = my_method
+            my_controller = MamdaniControllerService()
+            my_controller.create_from_fis_system(my_system)
+
+            my_native = my_controller.fuzzy_calc_native(my_inputs, 'tip')
+            my_reference = np.full(60, np.nan)
+            for my_num in range(60):
+                try:
+                    my_reference[my_num] = \
+                        my_controller.fuzzy_calc_single_value(
+                            {my_name: my_values[my_num]
+                             for my_name, my_values in my_inputs.items()},
+                            'tip')
+                except KeyError:
+                    # O scikit-fuzzy não calcula o consequente
+                    pass
+
+            # Somente o centroide e o bissetor ficam sem resultado
+            self.assertEqual(np.isnan(my_native).any(),
+                             my_method in (DefuzzMethods.centroid,
+                                           DefuzzMethods.bisector),
+                             msg=f'Test fuzzy_calc_native no rule '
+                                 f'{my_method.name} nan')
+            self.assertTrue(np.allclose(my_native, my_reference, rtol=0,
+                                        atol=1e-9, equal_nan=True),
+                            msg=f'Test fuzzy_calc_native no rule '
+                                f'{my_method.name}')
+
+    def test_fuzzy_calc_native_exception_1(self):
+        my_controller = self.create_controller(
+            "tests/test_data/Tip_mamdani.fis")
+
+        with self.assertRaises(Exception) as exc:
+            my_controller.fuzzy_calc_native({'service': 1.0}, 'tip')
+
+        self.assertEqual(str(exc.exception),
+                         "O antecedente food não foi informado!",
+                         msg='Test fuzzy_calc_native_exception_1')
+
+    def test_fuzzy_calc_native_exception_2(self):
+        my_controller = self.create_controller(
+            "tests/test_data/Tip_mamdani.fis")
+
+        with self.assertRaises(Exception) as exc:
+            my_controller.fuzzy_calc_native({'service': 1.0, 'food': 2.0},
+                                            'price')
+
+        self.assertEqual(str(exc.exception),
+                         "O consequente price não existe!",
+                         msg='Test fuzzy_calc_native_exception_2')
+
+    def test_fuzzy_calc_native_exception_3(self):
+        my_controller = self.create_controller(
+            "tests/test_data/Tip_mamdani.fis")
+        my_controller.fuzzy_machine.fis_system.imp_method = ImpMethods.prod
+
+        with self.assertRaises(Exception) as exc:
+            my_controller.fuzzy_calc_native({'service': 1.0, 'food': 2.0},
+                                            'tip')
+
+        self.assertEqual(str(exc.exception),
+                         "Método de implicação não implementado!",
+                         msg='Test fuzzy_calc_native_exception_3')
+
+    def test_fuzzy_calc_native_exception_5(self):
+        my_controller = self.create_controller(
+            "tests/test_data/Tip_mamdani.fis")
+        my_controller.fuzzy_machine.fis_system.defuzz_method = \
+            DefuzzMethods.wtaver
+
+        with self.assertRaises(Exception) as exc:
+            my_controller.fuzzy_calc_native({'service': 1.0, 'food': 2.0},
+                                            'tip')
+
+        self.assertEqual(str(exc.exception),
+                         "Método de defuzzificação não implementado!",
+                         msg='Test fuzzy_calc_native_exception_5')
+
+    def test_fuzzy_calc_native_exception_4(self):
+        my_controller = MamdaniControllerService()
+
+        with self.assertRaises(Exception) as exc:
+            my_controller.fuzzy_calc_native({'service': 1.0}, 'tip')
+
+        self.assertEqual(str(exc.exception),
+                         "O controlador não foi criado!",
+                         msg='Test fuzzy_calc_native_exception_4')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import unittest
+from continentalfuzzy.service.MamdaniControllerService import \
+    MamdaniControllerService
+from continentalfuzzy.service.SystemService import SystemService
+from continentalfuzzy.service.mamdani.ResultCache import ResultCache
+
+
+class ResultCacheTest(unittest.TestCase):
+    @staticmethod
+    def create_controller(p_cache):
+        my_system = SystemService().import_file(
+            "tests/test_data/EnvironmentMamdani.fis")
+        my_controller = MamdaniControllerService()
+        my_controller.result_cache = p_cache
+        my_controller.create_from_fis_system(my_system)
+
+        return my_controller
+
+    def test_quantize(self):
+        my_cache = ResultCache(tolerances={'Depth': 0.5})
+        my_key, my_values = my_cache.quantize({'Slope': 0.0015,
+                                               'Depth': 50.3})
+
+        self.assertEqual(my_key, (('Depth', 101), ('Slope', 0.0015)),
+                         msg='Test quantize key')
+        self.assertEqual(my_values, {'Depth': 50.5, 'Slope': 0.0015},
+                         msg='Test quantize values')
+        self.assertEqual(my_cache.quantize({'Depth': 50.6, 'Slope': 0.0015}),
+                         (my_key, my_values),
+                         msg='Test quantize same key')
+
+    def test_quantize_array(self):
+        my_cache = ResultCache(tolerances={'Depth': 0.5})
+        my_values = my_cache.quantize_array({'Slope': [0.0015, 0.0025],
+                                             'Depth': [50.3, 50.6]})
+
+        self.assertEqual(my_values['Depth'].tolist(), [50.5, 50.5],
+                         msg='Test quantize_array values')
+        self.assertEqual(my_values['Slope'].tolist(), [0.0015, 0.0025],
+                         msg='Test quantize_array without tolerance')
+        self.assertEqual(my_cache.quantize_array({'Depth': [50.3]})['Depth'][0],
+                         my_cache.quantize({'Depth': 50.3})[1]['Depth'],
+                         msg='Test quantize_array same as quantize')
+
+    def test_fuzzy_calc_single_value(self):
+        my_cache = ResultCache(tolerances={'Depth': 1, 'Slope': 1e-4,
+                                           'Distance': 0.01})
+        my_controller = self.create_controller(my_cache)
+        my_exact = self.create_controller(None)
+
+        my_first = my_controller.fuzzy_calc_single_value(
+            {'Distance': 0.301, 'Slope': 0.00152, 'Depth': 50.2}, 'output1')
+        my_second = my_controller.fuzzy_calc_single_value(
+            {'Distance': 0.299, 'Slope': 0.00148, 'Depth': 49.9}, 'output1')
+
+        self.assertEqual(my_first, my_second,
+                         msg='Test fuzzy_calc_single_value cache')
+        self.assertAlmostEqual(my_first, my_exact.fuzzy_calc_single_value(
+            {'Distance': 0.3, 'Slope': 0.0015, 'Depth': 50}, 'output1'),
+            places=10, msg='Test fuzzy_calc_single_value quantized')
+        self.assertEqual(my_cache.get_cache_info(),
+                         {'hits': 1, 'misses': 1, 'size': 1,
+                          'hit_rate': 0.5},
+                         msg='Test fuzzy_calc_single_value cache info')
+
+    def test_fuzzy_calc_single_value_lru(self):
+        my_cache = ResultCache(max_size=2)
+        my_controller = self.create_controller(my_cache)
+
+        for my_depth in [10, 20, 10, 30, 20]:
+            my_controller.fuzzy_calc_single_value(
+                {'Distance': 0.3, 'Slope': 0.0015, 'Depth': my_depth},
+                'output1')
+
+        # Depth 20 foi descartado quando Depth 30 foi calculado
+        self.assertEqual(my_cache.get_cache_info(),
+                         {'hits': 1, 'misses': 4, 'size': 2,
+                          'hit_rate': 0.2},
+                         msg='Test fuzzy_calc_single_value lru')
+
+    def test_set_tolerance(self):
+        my_cache = ResultCache()
+        my_cache.put((('Depth', 1.0),), {'output1': 1.0})
+        my_cache.set_tolerance('Depth', 2)
+
+        self.assertEqual(my_cache.tolerances, {'Depth': 2.0},
+                         msg='Test set_tolerance')
+        self.assertEqual(my_cache.get_cache_info()['size'], 0,
+                         msg='Test set_tolerance clear')
+
+    def test_result_cache_exception_1(self):
+        with self.assertRaises(Exception) as context:
+            ResultCache(max_size=0)
+
+        self.assertEqual(str(context.exception),
+                         "O tamanho do cache precisa ser maior que zero!",
+                         msg='Test result_cache exception 1')
+
+    def test_result_cache_exception_2(self):
+        with self.assertRaises(Exception) as context:
+            ResultCache(tolerances={'Depth': -1})
+
+        self.assertEqual(str(context.exception),
+                         "A tolerância precisa ser maior que zero!",
+                         msg='Test result_cache exception 2')
+
+
+if __name__ == '__main__':
+    unittest.main()
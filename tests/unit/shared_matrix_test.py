@@ -0,0 +1,43 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import unittest
+import numpy as np
+from continentalfuzzy.util.SharedMatrix import SharedMatrix
+
+
+class SharedMatrixTest(unittest.TestCase):
+    def test_from_array(self):
+        my_array = np.arange(12, dtype=np.float64).reshape((3, 4))
+
+        with SharedMatrix.from_array(my_array) as my_matrix:
+            self.assertTrue(np.array_equal(my_matrix.array, my_array),
+                            msg='Test from_array')
+            self.assertEqual(my_matrix.descriptor[1:], ((3, 4), '<f8'),
+                             msg='Test from_array descriptor')
+
+    def test_attach(self):
+        with SharedMatrix((2, 2)) as my_matrix:
+            my_attached = SharedMatrix.attach(my_matrix.descriptor)
+            my_attached.array[1, 0] = 7.0
+            my_attached.close()
+
+            self.assertEqual(my_matrix.array[1, 0], 7.0,
+                             msg='Test attach')
+
+    def test_close(self):
+        my_matrix = SharedMatrix((2, 2))
+        my_descriptor = my_matrix.descriptor
+        my_matrix.close()
+        my_matrix.close()
+
+        self.assertIsNone(my_matrix.array, msg='Test close array')
+        with self.assertRaises(FileNotFoundError):
+            SharedMatrix.attach(my_descriptor)
+
+
+if __name__ == '__main__':
+    unittest.main()
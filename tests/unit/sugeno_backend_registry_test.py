@@ -0,0 +1,141 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import os
+import unittest
+import warnings
+import numpy as np
+from continentalfuzzy.service.sugeno.backends.BackendRegistry import \
+    BackendRegistry
+from continentalfuzzy.service.sugeno.backends.NumpyBackend import NumpyBackend
+from continentalfuzzy.service.sugeno.membership_functions.GaussTwoMembershipFunction import \
+    GaussTwoMembershipFunction
+from continentalfuzzy.service.sugeno.membership_functions.TriangularMembershipFuntion import \
+    TriangularMembershipFunction
+from continentalfuzzy.service.sugeno.operators.ProborOrMethod import \
+    ProborOrMethod
+
+
+class BackendRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.my_env = os.environ.pop(BackendRegistry.ENV_VAR, None)
+        BackendRegistry.reset()
+
+    def tearDown(self):
+        if self.my_env is None:
+            os.environ.pop(BackendRegistry.ENV_VAR, None)
+        else:
+            os.environ[BackendRegistry.ENV_VAR] = self.my_env
+        BackendRegistry.reset()
+
+    def test_set_backend_numpy(self):
+        BackendRegistry.set_backend('numpy')
+
+        self.assertIs(BackendRegistry.get_backend(), NumpyBackend,
+                      msg='Test set_backend_numpy')
+        self.assertEqual(BackendRegistry.get_backend_name(), 'numpy',
+                         msg='Test set_backend_numpy name')
+
+    def test_set_backend_auto(self):
+        BackendRegistry.set_backend('auto')
+
+        my_expected = [name for name in BackendRegistry.AUTO_ORDER
+                       if BackendRegistry.is_available(name)][0]
+
+        self.assertEqual(BackendRegistry.get_backend_name(), my_expected,
+                         msg='Test set_backend_auto')
+
+    def test_set_backend_env(self):
+        os.environ[BackendRegistry.ENV_VAR] = 'numpy'
+
+        self.assertEqual(BackendRegistry.get_backend_name(), 'numpy',
+                         msg='Test set_backend_env')
+
+    def test_set_backend_env_fallback(self):
+        BackendRegistry.DICT_BACKENDS['missing'] = \
+            'continentalfuzzy.service.sugeno.backends.MissingBackend'
+        os.environ[BackendRegistry.ENV_VAR] = 'missing'
+
+        try:
+            with warnings.catch_warnings(record=True) as my_warnings:
+                warnings.simplefilter('always')
+                my_name = BackendRegistry.get_backend_name()
+        finally:
+            del BackendRegistry.DICT_BACKENDS['missing']
+
+        self.assertIn(my_name, BackendRegistry.AUTO_ORDER,
+                      msg='Test set_backend_env_fallback')
+        self.assertEqual(len(my_warnings), 1,
+                         msg='Test set_backend_env_fallback warning')
+
+    def test_set_backend_env_unknown(self):
+        os.environ[BackendRegistry.ENV_VAR] = 'cyton'
+
+        with warnings.catch_warnings(record=True) as my_warnings:
+            warnings.simplefilter('always')
+            my_name = BackendRegistry.get_backend_name()
+
+        self.assertIn(my_name, BackendRegistry.AUTO_ORDER,
+                      msg='Test set_backend_env_unknown')
+        self.assertEqual(len(my_warnings), 1,
+                         msg='Test set_backend_env_unknown warning')
+        self.assertEqual(str(my_warnings[0].message),
+                         "O backend cyton não existe, usando o modo "
+                         "automático!",
+                         msg='Test set_backend_env_unknown message')
+
+    def test_get_backend_report(self):
+        BackendRegistry.set_backend('numpy')
+        my_report = BackendRegistry.get_backend_report()
+
+        self.assertEqual(my_report['active'], 'numpy',
+                         msg='Test get_backend_report active')
+        self.assertEqual(my_report['requested'], 'numpy',
+                         msg='Test get_backend_report requested')
+        self.assertIn('numpy', my_report['available'],
+                      msg='Test get_backend_report available')
+
+    def test_set_backend_exception_1(self):
+        with self.assertRaises(Exception) as exc:
+            BackendRegistry.set_backend('fortran')
+
+        self.assertEqual(str(exc.exception), "O backend fortran não existe!",
+                         msg='Test set_backend_exception_1')
+
+    def test_set_backend_exception_2(self):
+        BackendRegistry.DICT_BACKENDS['missing'] = \
+            'continentalfuzzy.service.sugeno.backends.MissingBackend'
+
+        try:
+            with self.assertRaises(Exception) as exc:
+                BackendRegistry.set_backend('missing')
+        finally:
+            del BackendRegistry.DICT_BACKENDS['missing']
+
+        self.assertEqual(str(exc.exception),
+                         "O backend missing não está disponível!",
+                         msg='Test set_backend_exception_2')
+
+    def test_backends_results(self):
+        my_x = np.linspace(-1, 11, 49)
+        my_degrees = np.random.default_rng(7).random((3, 4, 5))
+
+        my_results = list()
+        for my_name in BackendRegistry.available_backends():
+            BackendRegistry.set_backend(my_name)
+            my_results.append((
+                my_name,
+                TriangularMembershipFunction.calculate_trimf_array(
+                    my_x, [2, 5, 8]),
+                GaussTwoMembershipFunction.calculate_gauss2mf_array(
+                    my_x, 3, 1.5, 8, 2.7),
+                ProborOrMethod.calculate_probor_or_array(my_degrees, axis=1)))
+
+        for my_result in my_results[1:]:
+            for my_expected, my_value in zip(my_results[0][1:],
+                                             my_result[1:]):
+                self.assertTrue(np.allclose(my_expected, my_value),
+                                msg=f'Test backends_results {my_result[0]}')
@@ -0,0 +1,81 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import unittest
+import numpy as np
+from continentalfuzzy.domain.sugeno.SugenoCompiledRules import \
+    SugenoCompiledRules
+
+
+class SugenoCompiledRulesTest(unittest.TestCase):
+    def test_create_sugeno_compiled_rules(self):
+        my_mf_index = np.array([[0, SugenoCompiledRules.DONT_CARE],
+                                [1, 0]])
+        my_not_mask = np.array([[False, False], [True, False]])
+        my_or_mask = np.array([False, True])
+        my_weights = np.array([1.0, 0.5])
+        my_coefficients = np.array([[0, 0, 5.0], [1.0, 2.0, 3.0]])
+
+        my_compiled = SugenoCompiledRules(['Depth', 'Slope'],
+                                          [[], []],
+                                          my_mf_index,
+                                          my_not_mask,
+                                          my_or_mask,
+                                          my_weights,
+                                          my_coefficients)
+
+        self.assertEqual(2, my_compiled.num_rules, msg='Test num_rules')
+        self.assertEqual(2, my_compiled.num_inputs, msg='Test num_inputs')
+        self.assertIs(my_mf_index, my_compiled.mf_index,
+                      msg='Test mf_index')
+        self.assertIs(my_coefficients, my_compiled.coefficients,
+                      msg='Test coefficients')
+
+    def test_property_weights_exception_1(self):
+        my_compiled = SugenoCompiledRules()
+
+        my_exception = f"O parâmetro não é um numpy array!"
+        with self.assertRaises(Exception) as context:
+            my_compiled.weights = [1.0, 0.5]
+
+        self.assertEqual(my_exception, context.exception.args[0],
+                         msg='Test weights exception 1')
+
+    def test_property_mf_index_exception_1(self):
+        my_compiled = SugenoCompiledRules()
+
+        my_exception = f"O array precisa ter 2 dimensões!"
+        with self.assertRaises(Exception) as context:
+            my_compiled.mf_index = np.array([0, 1])
+
+        self.assertEqual(my_exception, context.exception.args[0],
+                         msg='Test mf_index exception 1')
+
+    def test_property_output_coefficients(self):
+        my_compiled = SugenoCompiledRules()
+        my_output_coefficients = np.array([[[0, 0, 5.0], [0, 0, 15.0]],
+                                           [[0, 0, 1.0], [1.0, 2.0, 3.0]]])
+        my_compiled.output_coefficients = my_output_coefficients
+
+        self.assertEqual(2, my_compiled.num_outputs, msg='Test num_outputs')
+        self.assertTrue(np.array_equal(my_output_coefficients[0],
+                                       my_compiled.coefficients),
+                        msg='Test output_coefficients coefficients')
+        self.assertEqual([[True, True], [True, True]],
+                         my_compiled.output_mask.tolist(),
+                         msg='Test output_coefficients output_mask')
+        self.assertFalse(my_compiled.constant_consequents,
+                         msg='Test output_coefficients constant_consequents')
+
+    def test_property_output_coefficients_exception_1(self):
+        my_compiled = SugenoCompiledRules()
+
+        my_exception = f"O array precisa ter 3 dimensões!"
+        with self.assertRaises(Exception) as context:
+            my_compiled.output_coefficients = np.array([[0, 0, 5.0]])
+
+        self.assertEqual(my_exception, context.exception.args[0],
+                         msg='Test output_coefficients exception 1')
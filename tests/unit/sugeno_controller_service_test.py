@@ -4,7 +4,10 @@ author: Rudi César Comiotto Modena
 email: rmodena@unisinos.br
 date: July, 2020
 """
+import sys
+import threading
 import unittest
+import numpy as np
 from continentalfuzzy.domain.Rule import Rule
 from continentalfuzzy.domain.SugenoController import SugenoController
 from continentalfuzzy.domain.definition.Connections import Connections
@@ -585,6 +588,100 @@ class SugenoControllerServiceTest(unittest.TestCase):
                          sugeno_rule_4.connection_func,
                          msg='Test Rule 4 connection_func')
 
+    def test_compile_rules(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_3.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_compiled = my_service.sugeno_controller.compiled_rules
+
+        self.assertEqual(['service', 'food'], my_compiled.input_names,
+                         msg='Test compile_rules input_names')
+        self.assertEqual([[0, 0], [0, -1], [2, 1], [2, 1]],
+                         my_compiled.mf_index.tolist(),
+                         msg='Test compile_rules mf_index')
+        self.assertEqual([[False, False], [True, False],
+                          [False, False], [False, False]],
+                         my_compiled.not_mask.tolist(),
+                         msg='Test compile_rules not_mask')
+        self.assertEqual([True, False, True, False],
+                         my_compiled.or_mask.tolist(),
+                         msg='Test compile_rules or_mask')
+        self.assertEqual([1.0, 1.0, 0.5, 1.0],
+                         my_compiled.weights.tolist(),
+                         msg='Test compile_rules weights')
+        self.assertEqual([[0, 0, 5], [0, 0, 15], [0, 0, 25], [0, 0, 25]],
+                         my_compiled.coefficients.tolist(),
+                         msg='Test compile_rules coefficients')
+
+    def test_compile_rules_terms(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_3.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_compiled = my_service.sugeno_controller.compiled_rules
+
+        self.assertEqual([[0, 0], [0, 2], [1, 0], [1, 1]],
+                         my_compiled.mf_terms.tolist(),
+                         msg='Test compile_rules mf_terms')
+        self.assertEqual([0, 0, 1, 2, 3],
+                         my_compiled.term_mf.tolist(),
+                         msg='Test compile_rules term_mf')
+        self.assertEqual([False, True, False, False, False],
+                         my_compiled.term_not.tolist(),
+                         msg='Test compile_rules term_not')
+        self.assertEqual([[0, 3], [1], [2, 4], [2, 4]],
+                         my_compiled.rule_terms,
+                         msg='Test compile_rules rule_terms')
+
+    def test_get_mf_evaluations_report(self):
+        sugeno_filename = "tests/test_data/Ramp_Arid.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename, True)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        self.assertEqual({'per_rule': 18, 'shared': 6, 'saved': 12},
+                         my_service.get_mf_evaluations_report(),
+                         msg='Test get_mf_evaluations_report')
+
+    def test_calc_term_degrees(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_3.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_inputs = {'service': 1, 'food': 7}
+
+        self.assertTrue(
+            np.allclose([1, 0, 0, 0.1, 0.9],
+                        my_service.calc_term_degrees(my_inputs)),
+            msg='Test calc_term_degrees')
+
+    def test_calc_rule_firing_batch(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_3.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_inputs = {'service': np.array([1, 9]), 'food': np.array([7, 3])}
+        my_results = my_service.calc_rule_firing_batch(my_inputs)
+
+        self.assertTrue(np.allclose([[1, 0, 0.9, 0], [0.9, 1, 1, 0.1]],
+                                    my_results.T),
+                        msg='Test calc_rule_firing_batch')
+
     def test_calc_rule_weights(self):
         sugeno_filename = "tests/test_data/Tip_fuzzylite_1.fis"
         fisSystemService = SystemService()
@@ -700,4 +797,453 @@ class SugenoControllerServiceTest(unittest.TestCase):
             _ = my_service.sugeno_calc_single_value(my_inputs)
 
         self.assertEqual(my_exception, context.exception.args[0],
-                         msg='Test sugeno_calc_single_value exception 1')
\ No newline at end of file
+                         msg='Test sugeno_calc_single_value exception 1')
+
+    def test_sugeno_calc_batch_1(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_1.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_service_values = np.linspace(0, 10, 41)
+        my_food_values = np.linspace(10, 0, 41)
+        my_results = my_service.sugeno_calc_batch(
+            {'service': my_service_values, 'food': my_food_values})
+
+        my_expected = [my_service.sugeno_calc_single_value(
+            {'service': service, 'food': food})
+            for service, food in zip(my_service_values, my_food_values)]
+
+        self.assertEqual((41,), my_results.shape,
+                         msg='Test sugeno_calc_batch 1 shape')
+        self.assertTrue(np.allclose(my_expected, my_results),
+                        msg='Test sugeno_calc_batch 1')
+
+    def test_sugeno_calc_batch_2(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_3.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_service_values = np.array([[1, 3], [5, 8]])
+        my_food_values = np.array([[7, 2], [9, 4]])
+        my_results = my_service.sugeno_calc_batch(
+            {'service': my_service_values, 'food': my_food_values})
+
+        my_expected = [[my_service.sugeno_calc_single_value(
+            {'service': service, 'food': food})
+            for service, food in zip(s_row, f_row)]
+            for s_row, f_row in zip(my_service_values, my_food_values)]
+
+        self.assertTrue(np.allclose(my_expected, my_results),
+                        msg='Test sugeno_calc_batch 2')
+
+    def test_sugeno_calc_batch_3(self):
+        sugeno_filename = "tests/test_data/Ramp_Arid.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename, True)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_inputs = {'Depth': np.array([120, 10, 300]),
+                     'EnergyDissipation': np.array([0.7, 0.1, 0.9])}
+
+        my_results = my_service.sugeno_calc_batch(my_inputs)
+
+        for num, my_result in enumerate(my_results):
+            self.assertEqual(
+                my_service.sugeno_calc_single_value(
+                    {'Depth': my_inputs['Depth'][num],
+                     'EnergyDissipation':
+                         my_inputs['EnergyDissipation'][num]}),
+                my_result,
+                msg=f'Test sugeno_calc_batch 3 item {num}')
+
+    def test_sugeno_calc_batch_exception_1(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_2.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_inputs = {'service': np.array([1, 2])}
+
+        my_exception = f"O antecedente food não foi informado!"
+        with self.assertRaises(Exception) as context:
+            _ = my_service.sugeno_calc_batch(my_inputs)
+
+        self.assertEqual(my_exception, context.exception.args[0],
+                         msg='Test sugeno_calc_batch exception 1')
+
+    def test_sugeno_calc_batch_exception_2(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_2.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_inputs = {'service': np.array([1, 2]),
+                     'food': np.array([1, 2, 3])}
+
+        my_exception = f"Os arrays dos antecedentes não possuem o mesmo " \
+                       f"formato!"
+        with self.assertRaises(Exception) as context:
+            _ = my_service.sugeno_calc_batch(my_inputs)
+
+        self.assertEqual(my_exception, context.exception.args[0],
+                         msg='Test sugeno_calc_batch exception 2')
+
+    def test_calc_rule_output_level_batch_linear(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_linear.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_service_values = np.linspace(0, 10, 11)
+        my_food_values = np.linspace(10, 0, 11)
+        my_results = my_service.calc_rule_output_level_batch(
+            {'service': my_service_values, 'food': my_food_values})
+
+        my_expected = np.array([my_service.calc_rule_output_level(
+            {'service': service, 'food': food})
+            for service, food in zip(my_service_values, my_food_values)]).T
+
+        self.assertFalse(
+            my_service.sugeno_controller.compiled_rules.constant_consequents,
+            msg='Test calc_rule_output_level_batch_linear constant')
+        self.assertEqual((4, 11), my_results.shape,
+                         msg='Test calc_rule_output_level_batch_linear shape')
+        self.assertTrue(np.allclose(my_expected, my_results),
+                        msg='Test calc_rule_output_level_batch_linear')
+
+    def test_calc_rule_output_level_batch_constant(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_1.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_results = my_service.calc_rule_output_level_batch(
+            {'service': np.array([1.0, 5.0, 9.0]),
+             'food': np.array([2.0, 4.0, 8.0])})
+
+        self.assertTrue(
+            my_service.sugeno_controller.compiled_rules.constant_consequents,
+            msg='Test calc_rule_output_level_batch_constant constant')
+        self.assertTrue(np.array_equal([[5, 5, 5], [15, 15, 15],
+                                        [25, 25, 25], [25, 25, 25]],
+                                       my_results),
+                        msg='Test calc_rule_output_level_batch_constant')
+
+    def test_sugeno_calc_batch_linear(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_linear.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_service_values = np.linspace(0, 10, 41)
+        my_food_values = np.linspace(10, 0, 41)
+        my_results = my_service.sugeno_calc_batch(
+            {'service': my_service_values, 'food': my_food_values})
+
+        my_expected = [my_service.sugeno_calc_single_value(
+            {'service': service, 'food': food})
+            for service, food in zip(my_service_values, my_food_values)]
+
+        self.assertTrue(np.allclose(my_expected, my_results),
+                        msg='Test sugeno_calc_batch linear')
+
+    def test_sugeno_calc_fused(self):
+        for my_filename in ("Tip_fuzzylite_1", "Tip_fuzzylite_2",
+                            "Tip_fuzzylite_3", "Tip_fuzzylite_linear"):
+            fisSystemService = SystemService()
+            my_fuzzy = fisSystemService.import_file(
+                f"tests/test_data/{my_filename}.fis")
+
+            my_service = SugenoControllerService()
+            my_service.create_from_fis_system(my_fuzzy)
+
+            for my_service_value, my_food_value in zip(
+                    np.linspace(0, 10, 21), np.linspace(10, 0, 21)):
+                my_inputs = {'service': float(my_service_value),
+                             'food': float(my_food_value)}
+
+                self.assertAlmostEqual(
+                    my_service.sugeno_calc_single_value(my_inputs),
+                    my_service.sugeno_calc_fused(my_inputs),
+                    msg=f'Test sugeno_calc_fused {my_filename}')
+
+    def test_sugeno_calc_fused_facies(self):
+        sugeno_filename = "tests/test_data/Ramp_Arid.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename, True)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        for my_depth in (5.0, 50.0, 150.0, 300.0):
+            my_inputs = {'Depth': my_depth, 'EnergyDissipation': 0.4}
+
+            self.assertEqual(
+                my_service.sugeno_calc_single_value(my_inputs),
+                my_service.sugeno_calc_fused(my_inputs),
+                msg='Test sugeno_calc_fused facies')
+
+    def test_sugeno_calc_fused_threads(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_linear.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_generator = np.random.default_rng(11)
+        my_samples = [{'service': my_service_value, 'food': my_food_value}
+                      for my_service_value, my_food_value in
+                      my_generator.uniform(0, 10, (2000, 2)).tolist()]
+        my_serial = [my_service.sugeno_calc_fused(my_inputs)
+                     for my_inputs in my_samples]
+
+        my_results = [None] * 8
+
+        def run(p_num):
+            my_results[p_num] = [my_service.sugeno_calc_fused(my_inputs)
+                                 for my_inputs in my_samples]
+
+        # Troca de thread mais frequente para as threads se intercalarem
+        # dentro das chamadas
+        my_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            my_threads = [threading.Thread(target=run, args=(my_num,))
+                          for my_num in range(8)]
+            for my_thread in my_threads:
+                my_thread.start()
+            for my_thread in my_threads:
+                my_thread.join()
+        finally:
+            sys.setswitchinterval(my_interval)
+
+        for my_result in my_results:
+            self.assertEqual(my_result, my_serial,
+                             msg='Test sugeno_calc_fused threads')
+
+    def test_sugeno_calc_fused_exception_1(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_1.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        with self.assertRaises(Exception) as context:
+            _ = my_service.sugeno_calc_fused({'service': 1.0})
+
+        self.assertEqual("O antecedente food não foi informado!",
+                         context.exception.args[0],
+                         msg='Test sugeno_calc_fused exception 1')
+
+    def test_sugeno_calc_batch_outputs(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_multi.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_inputs = {'service': np.linspace(0, 10, 21),
+                     'food': np.linspace(10, 0, 21)}
+        my_results = my_service.sugeno_calc_batch_outputs(my_inputs)
+
+        # O primeiro consequente é igual ao Tip_fuzzylite_1
+        my_reference = SugenoControllerService()
+        my_reference.create_from_fis_system(SystemService().import_file(
+            "tests/test_data/Tip_fuzzylite_1.fis"))
+
+        # A segunda regra não possui o segundo consequente
+        my_firing = my_service.calc_rule_firing_batch(my_inputs) * \
+            np.array([[1.0], [0.0], [0.5], [1.0]])
+        my_coefficients = np.array([[0.5, 0.25, 2.0], [1.0, 0.5, 5.0],
+                                    [1.5, 1.0, 8.0], [1.5, 1.0, 8.0]])
+        my_levels = my_coefficients[:, 0:1] * my_inputs['service'] + \
+            my_coefficients[:, 1:2] * my_inputs['food'] + \
+            my_coefficients[:, 2:3]
+
+        self.assertEqual(['Tip', 'TipLinear'], list(my_results.keys()),
+                         msg='Test sugeno_calc_batch_outputs keys')
+        self.assertTrue(np.allclose(
+            my_reference.sugeno_calc_batch(my_inputs), my_results['Tip']),
+            msg='Test sugeno_calc_batch_outputs Tip')
+        self.assertTrue(np.allclose(
+            np.sum(my_firing * my_levels, axis=0) / np.sum(my_firing, axis=0),
+            my_results['TipLinear']),
+            msg='Test sugeno_calc_batch_outputs TipLinear')
+
+        my_array = my_service.sugeno_calc_batch_outputs(my_inputs, True)
+        self.assertEqual((2, 21), my_array.shape,
+                         msg='Test sugeno_calc_batch_outputs array shape')
+        self.assertTrue(np.array_equal(my_results['TipLinear'], my_array[1]),
+                        msg='Test sugeno_calc_batch_outputs array')
+
+    def test_sugeno_calc_outputs(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_multi.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_batch = my_service.sugeno_calc_batch_outputs(
+            {'service': np.array([1.0, 5.0, 9.0]),
+             'food': np.array([2.0, 4.0, 8.0])})
+
+        for my_num, (my_service_value, my_food_value) in enumerate(
+                [(1.0, 2.0), (5.0, 4.0), (9.0, 8.0)]):
+            my_results = my_service.sugeno_calc_outputs(
+                {'service': my_service_value, 'food': my_food_value})
+
+            for my_name, my_value in my_results.items():
+                self.assertAlmostEqual(my_batch[my_name][my_num], my_value,
+                                       msg=f'Test sugeno_calc_outputs '
+                                           f'{my_name}')
+
+    def test_sugeno_calc_single_value_multi_output(self):
+        # As regras 2, 3 e 4 não possuem um dos consequentes (0)
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_multi_partial.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_values = [(5.0, 4.0), (1.0, 9.0), (9.0, 9.0), (3.0, 1.0)]
+        my_batch = my_service.sugeno_calc_batch_outputs(
+            {'service': np.array([value[0] for value in my_values]),
+             'food': np.array([value[1] for value in my_values])})
+
+        for my_num, (my_service_value, my_food_value) in enumerate(my_values):
+            my_inputs = {'service': my_service_value, 'food': my_food_value}
+
+            for my_name in ['Tip', 'TipLinear']:
+                self.assertAlmostEqual(
+                    my_service.sugeno_calc_single_value(my_inputs, my_name),
+                    my_batch[my_name][my_num],
+                    msg=f'Test sugeno_calc_single_value {my_name}')
+                self.assertAlmostEqual(
+                    my_service.sugeno_calc_fused(my_inputs, my_name),
+                    my_batch[my_name][my_num],
+                    msg=f'Test sugeno_calc_fused {my_name}')
+
+        # Sem o nome é usado o primeiro consequente
+        self.assertAlmostEqual(
+            my_service.sugeno_calc_single_value({'service': 5.0,
+                                                 'food': 4.0}),
+            my_batch['Tip'][0],
+            msg='Test sugeno_calc_single_value first output')
+
+    def test_sugeno_calc_single_value_exception_2(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_multi.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        with self.assertRaises(Exception) as context:
+            my_service.sugeno_calc_single_value({'service': 5.0,
+                                                 'food': 4.0}, 'Bonus')
+
+        self.assertEqual(str(context.exception),
+                         "O consequente Bonus não existe!",
+                         msg='Test sugeno_calc_single_value exception 2')
+
+    def test_sugeno_calc_batch_sparse(self):
+        for my_filename in ("Tip_fuzzylite_2", "Tip_fuzzylite_multi"):
+            my_inputs = {'service': np.linspace(0, 10, 41),
+                         'food': np.linspace(10, 0, 41)}
+
+            my_dense = SugenoControllerService()
+            my_dense.create_from_fis_system(SystemService().import_file(
+                f"tests/test_data/{my_filename}.fis"))
+            my_dense.SPARSE_DENSITY = 0.0
+
+            my_sparse = SugenoControllerService()
+            my_sparse.create_from_fis_system(SystemService().import_file(
+                f"tests/test_data/{my_filename}.fis"))
+            my_sparse.SPARSE_DENSITY = 1.0
+
+            self.assertTrue(np.allclose(
+                my_dense.sugeno_calc_batch_outputs(my_inputs, True),
+                my_sparse.sugeno_calc_batch_outputs(my_inputs, True),
+                equal_nan=True),
+                msg=f'Test sugeno_calc_batch sparse {my_filename}')
+
+    def test_get_activation_report(self):
+        sugeno_filename = "tests/test_data/Tip_fuzzylite_1.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_inputs = {'service': np.array([1.0, 5.0, 9.0]),
+                     'food': np.array([2.0, 4.0, 8.0])}
+        _ = my_service.sugeno_calc_batch(my_inputs)
+        my_report = my_service.get_activation_report()
+
+        my_firing = my_service.calc_rule_firing_batch(my_inputs)
+        self.assertEqual(12, my_report['pairs'],
+                         msg='Test get_activation_report pairs')
+        self.assertEqual(np.count_nonzero(my_firing), my_report['active'],
+                         msg='Test get_activation_report active')
+        self.assertAlmostEqual(1 - np.count_nonzero(my_firing) / 12,
+                               my_report['sparsity'],
+                               msg='Test get_activation_report sparsity')
+        self.assertEqual(np.count_nonzero(my_firing, axis=1).tolist(),
+                         my_report['per_rule'],
+                         msg='Test get_activation_report per_rule')
+
+    def test_firing_epsilon(self):
+        sugeno_filename = "tests/test_data/Ramp_Arid.fis"
+        fisSystemService = SystemService()
+        my_fuzzy = fisSystemService.import_file(sugeno_filename)
+
+        my_service = SugenoControllerService()
+        my_service.create_from_fis_system(my_fuzzy)
+
+        my_inputs = {'Depth': np.linspace(0, 400, 81),
+                     'EnergyDissipation': np.linspace(0, 1, 81)}
+        my_exact = my_service.sugeno_calc_batch(my_inputs)
+        my_exact_report = my_service.get_activation_report()
+
+        my_service.firing_epsilon = 1e-3
+        my_results = my_service.sugeno_calc_batch(my_inputs)
+        my_report = my_service.get_activation_report()
+
+        self.assertLessEqual(my_report['active'], my_exact_report['active'],
+                             msg='Test firing_epsilon active')
+        self.assertTrue(np.allclose(my_exact, my_results, atol=1e-1,
+                                    equal_nan=True),
+                        msg='Test firing_epsilon')
+
+    def test_property_firing_epsilon_exception_1(self):
+        my_service = SugenoControllerService()
+
+        my_exception = "O limite de disparo precisa estar entre 0 e 1!"
+        with self.assertRaises(Exception) as context:
+            my_service.firing_epsilon = -0.1
+
+        self.assertEqual(my_exception, context.exception.args[0],
+                         msg='Test firing_epsilon exception 1')
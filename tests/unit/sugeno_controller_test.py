@@ -453,3 +453,14 @@ class SugenoControllerTest(unittest.TestCase):
 
         self.assertEqual(my_exception, context.exception.args[0],
                          msg='Test add_rule exception 1')
+
+    def test_property_compiled_rules_exception_1(self):
+        my_sugeno = SugenoController()
+
+        my_exception = f"O valor não é uma instância da classe " \
+                       f"SugenoCompiledRules!"
+        with self.assertRaises(Exception) as context:
+            my_sugeno.compiled_rules = 'test'
+
+        self.assertEqual(my_exception, context.exception.args[0],
+                         msg='Test compiled_rules exception 1')
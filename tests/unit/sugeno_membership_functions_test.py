@@ -5,6 +5,7 @@ email: rmodena@unisinos.br
 date: July, 2020
 """
 import unittest
+import numpy as np
 from continentalfuzzy.service.sugeno.membership_functions.GaussMembershipFunction import \
     GaussMembershipFunction
 from continentalfuzzy.service.sugeno.membership_functions.GaussTwoMembershipFunction import \
@@ -532,4 +533,92 @@ class TriangularMembershipFunctionTest(unittest.TestCase):
                                                              my_abc)
 
         self.assertEqual(my_exception, context.exception.args[0],
-                         msg='Test calculate_trimf exception 4')
\ No newline at end of file
+                         msg='Test calculate_trimf exception 4')
+
+class MembershipFunctionArrayTest(unittest.TestCase):
+    def test_calculate_trimf_array(self):
+        my_x = np.linspace(-1, 11, 49)
+        my_abc = [0, 2.5, 10]
+        my_result = [TriangularMembershipFunction.calculate_trimf(x, my_abc)
+                     for x in my_x]
+
+        self.assertTrue(np.allclose(
+            my_result,
+            TriangularMembershipFunction.calculate_trimf_array(my_x, my_abc)),
+            msg='Test calculate_trimf_array')
+
+    def test_calculate_trapmf_array(self):
+        my_x = np.linspace(-1, 11, 49)
+        my_abcd = [0, 2.5, 5, 10]
+        my_result = [
+            TrapezoidalMembershipFunction.calculate_trapmf(x, my_abcd)
+            for x in my_x]
+
+        self.assertTrue(np.allclose(
+            my_result,
+            TrapezoidalMembershipFunction.calculate_trapmf_array(my_x,
+                                                                 my_abcd)),
+            msg='Test calculate_trapmf_array')
+
+    def test_calculate_gaussmf_array(self):
+        my_x = np.linspace(-1, 11, 49)
+        my_result = [GaussMembershipFunction.calculate_gaussmf(x, 3, 1.5)
+                     for x in my_x]
+
+        self.assertTrue(np.allclose(
+            my_result,
+            GaussMembershipFunction.calculate_gaussmf_array(my_x, 3, 1.5)),
+            msg='Test calculate_gaussmf_array')
+
+    def test_calculate_gauss2mf_array(self):
+        my_x = np.linspace(-1, 11, 49)
+        for my_params in ([3, 1.5, 8, 2.7], [8, 2, 4, 1]):
+            my_result = [
+                GaussTwoMembershipFunction.calculate_gauss2mf(x, *my_params)
+                for x in my_x]
+
+            self.assertTrue(np.allclose(
+                my_result,
+                GaussTwoMembershipFunction.calculate_gauss2mf_array(
+                    my_x, *my_params)),
+                msg=f'Test calculate_gauss2mf_array {my_params}')
+
+    def test_calculate_trimf_array_2d(self):
+        my_x = np.linspace(0, 10, 12).reshape((3, 4)).T
+        my_result = TriangularMembershipFunction.calculate_trimf_array(
+            my_x, [2, 5, 8])
+
+        self.assertEqual(my_x.shape, my_result.shape,
+                         msg='Test calculate_trimf_array_2d shape')
+        self.assertTrue(np.allclose(
+            [[TriangularMembershipFunction.calculate_trimf(x, [2, 5, 8])
+              for x in row] for row in my_x],
+            my_result),
+            msg='Test calculate_trimf_array_2d')
+
+    def test_calculate_linear_array(self):
+        my_x = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+        self.assertTrue(np.allclose(
+            [2 * 1 - 4 + 1, 2 * 2 - 5 + 1, 2 * 3 - 6 + 1],
+            LinearMembershipFunction.calculate_linear_array(
+                np.array([2.0, -1.0, 1.0]), my_x)),
+            msg='Test calculate_linear_array')
+
+    def test_calculate_linear_array_constant(self):
+        my_x = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+        self.assertTrue(np.allclose(
+            [15, 15, 15],
+            LinearMembershipFunction.calculate_linear_array(
+                np.array([0.0, 0.0, 15.0]), my_x)),
+            msg='Test calculate_linear_array_constant')
+
+    def test_calculate_linear_array_exception_1(self):
+        with self.assertRaises(Exception) as exc:
+            LinearMembershipFunction.calculate_linear_array(
+                np.array([1.0, 2.0]), np.ones((2, 3)))
+
+        self.assertEqual(str(exc.exception),
+                         "Número de coeficientes inválido!",
+                         msg='Test calculate_linear_array_exception_1')
@@ -0,0 +1,131 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import unittest
+import numpy as np
+from continentalfuzzy.domain.membership_function.Gauss2MF import Gauss2MF
+from continentalfuzzy.domain.membership_function.GaussMF import GaussMF
+from continentalfuzzy.domain.membership_function.TrapMF import TrapMF
+from continentalfuzzy.domain.membership_function.TriMF import TriMF
+from continentalfuzzy.service.sugeno.evaluators.Gauss2MFEvaluator import \
+    Gauss2MFEvaluator
+from continentalfuzzy.service.sugeno.evaluators.GaussMFEvaluator import \
+    GaussMFEvaluator
+from continentalfuzzy.service.sugeno.evaluators.TrapMFEvaluator import \
+    TrapMFEvaluator
+from continentalfuzzy.service.sugeno.evaluators.TriMFEvaluator import \
+    TriMFEvaluator
+from continentalfuzzy.service.sugeno.membership_functions.GaussMembershipFunction import \
+    GaussMembershipFunction
+from continentalfuzzy.service.sugeno.membership_functions.GaussTwoMembershipFunction import \
+    GaussTwoMembershipFunction
+from continentalfuzzy.service.sugeno.membership_functions.TrapezoidalMembershipFunction import \
+    TrapezoidalMembershipFunction
+from continentalfuzzy.service.sugeno.membership_functions.TriangularMembershipFuntion import \
+    TriangularMembershipFunction
+
+
+class MFEvaluatorsTest(unittest.TestCase):
+    def setUp(self):
+        self.my_x = np.linspace(-1, 11, 97)
+
+    def test_trimf_evaluator(self):
+        for my_abc in ([2, 5, 8], [2, 2, 8], [2, 8, 8], [5, 5, 5]):
+            my_evaluator = TriMFEvaluator(TriMF('mf', my_abc))
+            my_result = [TriangularMembershipFunction.calculate_trimf(x, my_abc)
+                         for x in self.my_x]
+
+            self.assertTrue(np.allclose(my_result,
+                                        [my_evaluator(x) for x in self.my_x]),
+                            msg=f'Test trimf_evaluator {my_abc}')
+            self.assertTrue(np.allclose(
+                my_result,
+                my_evaluator.calculate_array(self.my_x,
+                                             np.empty(self.my_x.shape))),
+                msg=f'Test trimf_evaluator array {my_abc}')
+
+        self.assertEqual(TriMFEvaluator(TriMF('mf', [5, 5, 5]))(5), 1,
+                         msg='Test trimf_evaluator degenerate')
+
+    def test_trapmf_evaluator(self):
+        for my_abcd in ([1, 3, 6, 9], [1, 1, 6, 9], [1, 3, 9, 9]):
+            my_evaluator = TrapMFEvaluator(TrapMF('mf', my_abcd))
+            my_result = [
+                TrapezoidalMembershipFunction.calculate_trapmf(x, my_abcd)
+                for x in self.my_x]
+
+            self.assertTrue(np.allclose(my_result,
+                                        [my_evaluator(x) for x in self.my_x]),
+                            msg=f'Test trapmf_evaluator {my_abcd}')
+            self.assertTrue(np.allclose(
+                my_result,
+                my_evaluator.calculate_array(self.my_x,
+                                             np.empty(self.my_x.shape))),
+                msg=f'Test trapmf_evaluator array {my_abcd}')
+
+    def test_gaussmf_evaluator(self):
+        my_evaluator = GaussMFEvaluator(GaussMF('mf', 1.5, 3))
+        my_result = [GaussMembershipFunction.calculate_gaussmf(x, 3, 1.5)
+                     for x in self.my_x]
+
+        self.assertTrue(np.allclose(my_result,
+                                    [my_evaluator(x) for x in self.my_x]),
+                        msg='Test gaussmf_evaluator')
+        self.assertTrue(np.allclose(
+            my_result,
+            my_evaluator.calculate_array(self.my_x,
+                                         np.empty(self.my_x.shape))),
+            msg='Test gaussmf_evaluator array')
+
+    def test_gauss2mf_evaluator(self):
+        for my_params in ([1.5, 3, 2.7, 8], [2, 8, 1, 4]):
+            my_sigma1, my_mean1, my_sigma2, my_mean2 = my_params
+            my_evaluator = Gauss2MFEvaluator(Gauss2MF('mf', *my_params))
+            my_result = [GaussTwoMembershipFunction.calculate_gauss2mf(
+                x, my_mean1, my_sigma1, my_mean2, my_sigma2)
+                for x in self.my_x]
+
+            self.assertTrue(np.allclose(my_result,
+                                        [my_evaluator(x) for x in self.my_x]),
+                            msg=f'Test gauss2mf_evaluator {my_params}')
+            self.assertTrue(np.allclose(
+                my_result,
+                my_evaluator.calculate_array(self.my_x,
+                                             np.empty(self.my_x.shape))),
+                msg=f'Test gauss2mf_evaluator array {my_params}')
+
+    def test_evaluator_slots(self):
+        my_evaluator = TriMFEvaluator(TriMF('mf', [2, 5, 8]))
+
+        with self.assertRaises(AttributeError):
+            my_evaluator.other = 1
+
+        self.assertFalse(hasattr(my_evaluator, '__dict__'),
+                         msg='Test evaluator_slots')
+
+    def test_trimf_evaluator_exception_1(self):
+        with self.assertRaises(Exception) as exc:
+            TriMFEvaluator(TriMF('mf', [5, 2, 8]))
+
+        self.assertEqual(str(exc.exception),
+                         "Os parâmetros não estão em ordem crescente!",
+                         msg='Test trimf_evaluator_exception_1')
+
+    def test_trapmf_evaluator_exception_1(self):
+        with self.assertRaises(Exception) as exc:
+            TrapMFEvaluator(TriMF('mf', [2, 5, 8]))
+
+        self.assertEqual(str(exc.exception),
+                         "O valor não é uma instância da classe TrapMF!",
+                         msg='Test trapmf_evaluator_exception_1')
+
+    def test_gaussmf_evaluator_exception_1(self):
+        with self.assertRaises(Exception) as exc:
+            GaussMFEvaluator(GaussMF('mf', 0, 3))
+
+        self.assertEqual(str(exc.exception),
+                         "O desvio padrão não pode ser zero!",
+                         msg='Test gaussmf_evaluator_exception_1')
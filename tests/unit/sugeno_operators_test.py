@@ -5,6 +5,7 @@ email: rmodena@unisinos.br
 date: July, 2020
 """
 import unittest
+import numpy as np
 
 from continentalfuzzy.domain.sugeno.rule_variable.SugenoRuleInput import \
     SugenoRuleInput
@@ -302,3 +303,82 @@ class MinAndMethodTest(unittest.TestCase):
                          round(MinAndMethod.calculate_min_and(my_rule_inputs,
                                                               my_value), 1),
                          msg='Test calculate_max_or_not')
+
+
+class OperatorsDegreesTest(unittest.TestCase):
+    def test_calculate_degrees(self):
+        my_degrees = [0.2, 0.5, 0.1]
+
+        self.assertEqual(0.1,
+                         MinAndMethod.calculate_min_and_degrees(my_degrees),
+                         msg='Test calculate_min_and_degrees')
+        self.assertAlmostEqual(
+            0.01,
+            ProdAndMethod.calculate_prod_and_degrees(my_degrees),
+            msg='Test calculate_prod_and_degrees')
+        self.assertEqual(0.5,
+                         MaxOrMethod.calculate_max_or_degrees(my_degrees),
+                         msg='Test calculate_max_or_degrees')
+        self.assertAlmostEqual(
+            0.64,
+            ProborOrMethod.calculate_probor_or_degrees(my_degrees),
+            msg='Test calculate_probor_or_degrees')
+
+
+class OperatorsShortCircuitTest(unittest.TestCase):
+    def setUp(self):
+        self.my_calls = list()
+
+        def my_rule_func(x, value):
+            self.my_calls.append(x)
+            return value
+
+        self.my_rule_inputs = [
+            SugenoRuleInput('Distance', my_rule_func, {'value': 0.5}, False),
+            SugenoRuleInput('Slope', my_rule_func, {'value': 0.0}, False),
+            SugenoRuleInput('Depth', my_rule_func, {'value': 0.8}, False)]
+        self.my_value = {'Distance': 0.7, 'Slope': 0.01, 'Depth': 200.0}
+
+    def test_calculate_min_and_short_circuit(self):
+        self.assertEqual(0, MinAndMethod.calculate_min_and(
+            self.my_rule_inputs, self.my_value),
+            msg='Test calculate_min_and short circuit')
+        self.assertEqual([0.7, 0.01], self.my_calls,
+                         msg='Test calculate_min_and short circuit calls')
+
+    def test_calculate_prod_and_short_circuit(self):
+        self.assertEqual(0, ProdAndMethod.calculate_prod_and(
+            self.my_rule_inputs, self.my_value),
+            msg='Test calculate_prod_and short circuit')
+        self.assertEqual([0.7, 0.01], self.my_calls,
+                         msg='Test calculate_prod_and short circuit calls')
+
+    def test_calculate_degrees_short_circuit(self):
+        self.assertEqual(0, MinAndMethod.calculate_min_and_degrees(
+            [0.5, 0.0, 0.8]), msg='Test calculate_min_and_degrees zero')
+        self.assertEqual(0, ProdAndMethod.calculate_prod_and_degrees(
+            [0.5, 0.0, 0.8]), msg='Test calculate_prod_and_degrees zero')
+
+
+class OperatorsArrayTest(unittest.TestCase):
+    def test_calculate_array(self):
+        my_degrees = [np.array([0.2, 0.9, 0.0]),
+                      np.array([0.5, 0.4, 1.0]),
+                      np.array([0.1, 1.0, 0.3])]
+
+        self.assertTrue(np.allclose(
+            [0.1, 0.4, 0.0],
+            MinAndMethod.calculate_min_and_array(my_degrees)),
+            msg='Test calculate_min_and_array')
+        self.assertTrue(np.allclose(
+            [0.01, 0.36, 0.0],
+            ProdAndMethod.calculate_prod_and_array(my_degrees)),
+            msg='Test calculate_prod_and_array')
+        self.assertTrue(np.allclose(
+            [0.5, 1.0, 1.0],
+            MaxOrMethod.calculate_max_or_array(my_degrees)),
+            msg='Test calculate_max_or_array')
+        self.assertTrue(np.allclose(
+            [0.64, 1.0, 1.0],
+            ProborOrMethod.calculate_probor_or_array(my_degrees)),
+            msg='Test calculate_probor_or_array')
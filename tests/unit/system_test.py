@@ -28,7 +28,7 @@ from continentalfuzzy.service.SystemService import SystemService
 
 class SystemTest(unittest.TestCase):
     def test_MAX_NUM_OUTPUTS(self):
-        self.assertEqual(1, System.MAX_NUM_OUTPUTS,
+        self.assertEqual(8, System.MAX_NUM_OUTPUTS,
                          msg='Test MAX_NUM_OUTPUTS')
 
     def test_create_system_1(self):
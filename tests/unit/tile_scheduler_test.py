@@ -0,0 +1,92 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import os
+import queue
+import tempfile
+import unittest
+from continentalfuzzy.util.TileScheduler import TileScheduler
+
+
+class TileSchedulerTest(unittest.TestCase):
+    def tearDown(self):
+        TileScheduler.CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+
+    def test_tiles(self):
+        my_scheduler = TileScheduler(5, 3, (2, 2))
+
+        self.assertEqual(my_scheduler.tiles,
+                         [(0, 2, 0, 2), (0, 2, 2, 3), (2, 4, 0, 2),
+                          (2, 4, 2, 3), (4, 5, 0, 2), (4, 5, 2, 3)],
+                         msg='Test tiles')
+        self.assertEqual(my_scheduler.num_tiles, 6, msg='Test num_tiles')
+
+    def test_create_queue(self):
+        my_queue = TileScheduler(3, 3, (2, 3)).create_queue()
+
+        self.assertEqual(my_queue.get_nowait(), (0, 2, 0, 3),
+                         msg='Test create_queue first')
+        self.assertEqual(my_queue.get_nowait(), (2, 3, 0, 3),
+                         msg='Test create_queue second')
+        with self.assertRaises(queue.Empty):
+            my_queue.get_nowait()
+
+    def test_get_tile_shape(self):
+        # Menos linhas que workers: os blocos são divididos até existirem
+        # blocos para todos os workers
+        my_scheduler = TileScheduler(2, 100, number_of_workers=32)
+
+        self.assertGreaterEqual(my_scheduler.num_tiles,
+                                TileScheduler.TILES_PER_WORKER * 32,
+                                msg='Test get_tile_shape small')
+        self.assertEqual(TileScheduler.get_tile_shape(1000, 1000, 1),
+                         TileScheduler.DEFAULT_TILE_SHAPE,
+                         msg='Test get_tile_shape default')
+        self.assertEqual(TileScheduler.get_tile_shape(1, 1, 8), (1, 1),
+                         msg='Test get_tile_shape single cell')
+
+    def test_get_available_cpus(self):
+        my_dir = tempfile.mkdtemp()
+        my_filename = os.path.join(my_dir, "cpu.max")
+        TileScheduler.CGROUP_V2_CPU_MAX = my_filename
+        try:
+            with open(my_filename, 'w') as my_file:
+                my_file.write("50000 100000\n")
+            self.assertEqual(TileScheduler.get_cgroup_cpu_limit(), 0.5,
+                             msg='Test get_cgroup_cpu_limit')
+            self.assertEqual(TileScheduler.get_available_cpus(), 1,
+                             msg='Test get_available_cpus quota')
+
+            with open(my_filename, 'w') as my_file:
+                my_file.write("max 100000\n")
+            self.assertIsNone(TileScheduler.get_cgroup_cpu_limit(),
+                              msg='Test get_cgroup_cpu_limit max')
+            self.assertEqual(TileScheduler.get_available_cpus(),
+                             len(os.sched_getaffinity(0)),
+                             msg='Test get_available_cpus affinity')
+        finally:
+            os.remove(my_filename)
+            os.rmdir(my_dir)
+
+    def test_tile_scheduler_exception_1(self):
+        with self.assertRaises(Exception) as context:
+            TileScheduler(2, 2, (0, 2))
+
+        self.assertEqual(str(context.exception),
+                         "O tamanho dos blocos precisa ser maior que zero!",
+                         msg='Test tile_scheduler exception 1')
+
+    def test_tile_scheduler_exception_2(self):
+        with self.assertRaises(Exception) as context:
+            TileScheduler(2, 2, number_of_workers=0)
+
+        self.assertEqual(str(context.exception),
+                         "O número de workers precisa ser maior que zero!",
+                         msg='Test tile_scheduler exception 2')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+"""
+Developed by Projeto Continentais and Petrobras
+author: Rudi César Comiotto Modena
+email: rmodena@unisinos.br
+date: July, 2020
+"""
+import threading
+import unittest
+import numpy as np
+from continentalfuzzy.domain.definition.mamdani.UniverseModes import \
+    UniverseModes
+from continentalfuzzy.domain.mamdani.UniverseResolution import \
+    UniverseResolution
+from continentalfuzzy.service.MamdaniControllerService import \
+    MamdaniControllerService
+from continentalfuzzy.service.SystemService import SystemService
+from continentalfuzzy.service.mamdani.UniverseService import UniverseService
+from continentalfuzzy.util.FuzzyUtil import FuzzyUtil
+
+
+class UniverseResolutionTest(unittest.TestCase):
+    def setUp(self):
+        UniverseService.clear_cache()
+
+    def test_universe_resolution(self):
+        my_resolution = UniverseResolution()
+        self.assertEqual(my_resolution.mode, UniverseModes.default,
+                         msg='Test universe_resolution mode')
+        self.assertIsNone(my_resolution.num_points,
+                          msg='Test universe_resolution num_points')
+
+        my_resolution = UniverseResolution(UniverseModes.adaptive,
+                                           r_tolerance=1e-3)
+        self.assertEqual(my_resolution.key,
+                         (UniverseModes.adaptive, None, 1e-3),
+                         msg='Test universe_resolution key')
+
+    def test_universe_resolution_exception_1(self):
+        with self.assertRaises(Exception) as context:
+            UniverseResolution('fixed')
+
+        self.assertEqual(str(context.exception),
+                         "O valor não é uma instância da classe "
+                         "UniverseModes!",
+                         msg='Test universe_resolution exception 1')
+
+    def test_universe_resolution_exception_2(self):
+        with self.assertRaises(Exception) as context:
+            UniverseResolution(UniverseModes.fixed, r_num_points=1)
+
+        self.assertEqual(str(context.exception),
+                         "O número de pontos precisa ser maior que 1!",
+                         msg='Test universe_resolution exception 2')
+
+    def test_universe_resolution_exception_3(self):
+        with self.assertRaises(Exception) as context:
+            UniverseResolution(UniverseModes.adaptive, r_tolerance=0)
+
+        self.assertEqual(str(context.exception),
+                         "A tolerância precisa ser maior que zero!",
+                         msg='Test universe_resolution exception 3')
+
+    def test_get_universe_fixed(self):
+        my_system = SystemService().import_file(
+            "tests/test_data/Tip_mamdani.fis")
+        my_output = my_system.outputs[1]
+        my_universe = UniverseService.get_universe(
+            my_output.range, my_output.mfs,
+            UniverseResolution(UniverseModes.fixed, r_num_points=11))
+
+        for my_mf in my_output.mfs.values():
+            for my_value in my_mf.abc:
+                if my_output.range[0] <= my_value <= my_output.range[1]:
+                    self.assertIn(my_value, my_universe,
+                                  msg='Test get_universe fixed breakpoints')
+
+        self.assertTrue(np.all(np.diff(my_universe) > 0),
+                        msg='Test get_universe fixed sorted')
+        self.assertFalse(my_universe.flags.writeable,
+                         msg='Test get_universe fixed read only')
+
+    def test_get_universe_default(self):
+        my_system = SystemService().import_file("tests/test_data/Shelf.fis")
+        my_output = my_system.outputs[1]
+
+        np.testing.assert_array_equal(
+            UniverseService.get_universe(my_output.range, my_output.mfs,
+                                         UniverseResolution()),
+            FuzzyUtil.create_universe(my_output.range, my_output.mfs),
+            err_msg='Test get_universe default')
+
+    def test_get_universe_cache(self):
+        my_system = SystemService().import_file("tests/test_data/Shelf.fis")
+        my_output = my_system.outputs[1]
+        my_resolution = UniverseResolution(UniverseModes.fixed,
+                                           r_num_points=201)
+
+        my_first = UniverseService.get_universe(my_output.range,
+                                                my_output.mfs,
+                                                my_resolution)
+        my_second = UniverseService.get_universe(my_output.range,
+                                                 my_output.mfs,
+                                                 my_resolution)
+
+        self.assertIs(my_first, my_second, msg='Test get_universe cache')
+        self.assertEqual(UniverseService.get_cache_info(),
+                         {'hits': 1, 'misses': 1, 'size': 1},
+                         msg='Test get_universe cache info')
+
+    def test_get_universe_cache_threads(self):
+        my_system = SystemService().import_file("tests/test_data/Shelf.fis")
+        my_output = my_system.outputs[1]
+        my_resolution = UniverseResolution(UniverseModes.fixed,
+                                           r_num_points=201)
+        my_universes = list()
+
+        def my_worker():
+            for _ in range(200):
+                my_universes.append(UniverseService.get_universe(
+                    my_output.range, my_output.mfs, my_resolution))
+
+        my_threads = [threading.Thread(target=my_worker) for _ in range(8)]
+        for my_thread in my_threads:
+            my_thread.start()
+        for my_thread in my_threads:
+            my_thread.join()
+
+        my_info = UniverseService.get_cache_info()
+        self.assertEqual(my_info['hits'] + my_info['misses'], 8 * 200,
+                         msg='Test get_universe cache threads counters')
+        self.assertEqual(my_info['size'], 1,
+                         msg='Test get_universe cache threads size')
+        self.assertTrue(all(my_universe is my_universes[0]
+                            for my_universe in my_universes),
+                        msg='Test get_universe cache threads universe')
+
+    def test_get_universe_adaptive(self):
+        my_system = SystemService().import_file("tests/test_data/Shelf.fis")
+        my_output = my_system.outputs[1]
+        my_width = my_output.range[1] - my_output.range[0]
+        my_reference = UniverseService.calc_probe_centroids(
+            FuzzyUtil.create_universe_fixed(my_output.range, my_output.mfs,
+                                            2 ** 16 + 1),
+            my_output.mfs)
+
+        for my_tolerance in [1e-2, 1e-4]:
+            my_universe = UniverseService.get_universe(
+                my_output.range, my_output.mfs,
+                UniverseResolution(UniverseModes.adaptive,
+                                   r_tolerance=my_tolerance),
+                is_output=True)
+            my_error = np.nanmax(np.abs(UniverseService.calc_probe_centroids(
+                my_universe, my_output.mfs) - my_reference)) / my_width
+
+            self.assertLessEqual(my_error, my_tolerance,
+                                 msg='Test get_universe adaptive')
+
+        my_input = my_system.inputs[1]
+        my_universe = UniverseService.get_universe(
+            my_input.range, my_input.mfs,
+            UniverseResolution(UniverseModes.adaptive, r_tolerance=1e-3))
+        self.assertLessEqual(UniverseService.calc_membership_error(
+            my_universe, my_input.mfs), 1e-3,
+            msg='Test get_universe adaptive input')
+
+    def test_get_universe_exception_1(self):
+        my_system = SystemService().import_file(
+            "tests/test_data/Tip_mamdani.fis")
+        my_output = my_system.outputs[1]
+
+        with self.assertRaises(Exception) as context:
+            UniverseService.get_universe(my_output.range, my_output.mfs,
+                                         UniverseResolution(
+                                             UniverseModes.fixed))
+
+        self.assertEqual(str(context.exception),
+                         "O número de pontos não foi informado!",
+                         msg='Test get_universe exception 1')
+
+    def test_controller_universe_resolution(self):
+        my_system = SystemService().import_file("tests/test_data/Shelf.fis")
+        my_controller = MamdaniControllerService()
+        my_controller.universe_resolution = UniverseResolution(
+            UniverseModes.fixed, r_num_points=51)
+        my_controller.create_from_fis_system(my_system)
+
+        my_universe = my_controller.fuzzy_machine.outputs[
+            'FaciesAssociation'].universe
+        self.assertIs(my_controller.fuzzy_machine.compiled_rules
+                      .output_universes[0], my_universe,
+                      msg='Test controller universe_resolution shared')
+
+        my_inputs = {my_input.name: np.mean(my_input.range)
+                     for my_input in my_system.inputs.values()}
+        my_native = my_controller.fuzzy_calc_native(my_inputs,
+                                                    'FaciesAssociation')
+        my_single = my_controller.fuzzy_calc_single_value(
+            my_inputs, 'FaciesAssociation')
+        self.assertAlmostEqual(my_native, my_single, places=9,
+                               msg='Test controller universe_resolution')
+
+    def test_controller_universe_resolution_exception_1(self):
+        with self.assertRaises(Exception) as context:
+            MamdaniControllerService().universe_resolution = 100
+
+        self.assertEqual(str(context.exception),
+                         "O valor não é uma instância da classe "
+                         "UniverseResolution!",
+                         msg='Test controller universe_resolution '
+                             'exception 1')
+
+
+if __name__ == '__main__':
+    unittest.main()